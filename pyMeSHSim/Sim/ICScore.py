@@ -4,19 +4,33 @@
 #!/usr/bin/python3
 from __future__ import division
 import sys
-from copy import deepcopy
 from collections import defaultdict
-from math import log
-from ..data import dataDB
+from ..data.dataStore import storeProperty
+from ..data import storage
 from .MeSHProcess import MeSHProcess
-import bcolz as bz
+from .TreeCodeIndex import TreeCodeIndex
+import numpy as np
+import pandas as pd
 
 class InformationContent(MeSHProcess):
-    """This class implement the IC based similarity."""
+    """This class implement the IC based similarity.
+
+    **attribute**
+
+    ICTableInCategory: dict
+        | cache for IC table of each category.
+        | value is tuple of (dict map MeSH ID to array position, numpy array of IC value, max IC value).
+
+    treeCodeICInCategory: dict
+        cache for the tree code LCA index of each category, value is tuple of (TreeCodeIndex, IC value of each node).
+    """
+
+    propagationDict = storeProperty(name="propagationDict", default=dict)
+    ICTableInCategory = storeProperty(name="ICTableInCategory", default=dict)
+    treeCodeICInCategory = storeProperty(name="treeCodeICInCategory", default=dict)
 
     def __init__(self):
         MeSHProcess.__init__(self)
-        self.propagationDict = {}
 
     def _allMaxFreqDict(self):
         """This method is used to construct the MainHeadingDetailData.
@@ -37,9 +51,9 @@ class InformationContent(MeSHProcess):
 
             maxIndex = value_tmp.idxmin()
             maxIDInCategory[category] = id[maxIndex]
-        bz1 = bz.open(rootdir=self._MainHeadingDetailDataFilePath)
-        bz1.attrs["maxIDInCategory"] = maxIDInCategory
-        bz1.flush()
+        storage.setTableAttr(rootdir=self._MainHeadingDetailDataFilePath, name="maxIDInCategory", value=maxIDInCategory)
+        self._store.reset(filePath=self._MainHeadingDetailDataFilePath)
+        self.maxIDInCategory = maxIDInCategory
 
     def getFreqDict(self, category="C"):
         """Get the IC frequence from MainHeadingDetailData.
@@ -70,14 +84,43 @@ class InformationContent(MeSHProcess):
         id = df["MeSHID"]
         value = df["Frequence"]
         sumOfFreq = sum(value)
-        freqValue = value.apply(lambda x: x/sumOfFreq)
+        freqValue = value / sumOfFreq
         FreqDict = defaultdict(lambda: "N/A", zip(id, freqValue))
         return FreqDict
 
+    @staticmethod
+    def _propagateIC(freq=None, offspring=None, ancestor=None):
+        """Compute IC value of every concept in one pass.
+
+        | The frequence of every offspring is added to its ancestors with one weighted bincount,
+        | it is the product of the closure matrix and the frequence vector.
+
+        **parameter**
+
+        freq: numpy array
+            frequence of every concept.
+
+        offspring, ancestor: numpy array
+            position of the closure pairs in freq, -1 means not in freq.
+
+        **return**
+
+        tuple of (numpy array of IC value, numpy array of total frequence)
+        """
+        num = len(freq)
+        keep = (offspring >= 0) & (ancestor >= 0)
+        # the same pair may occur more than once
+        keys = np.unique(ancestor[keep].astype(np.int64) * num + offspring[keep])
+        freqTotal = freq + np.bincount(keys // num, weights=freq[keys % num], minlength=num)
+        valid = (freqTotal > 0) & (freqTotal <= 1)
+        ic = np.zeros(num)
+        ic[valid] = -1 * np.log(freqTotal[valid]) / np.log(10)
+        return (ic, freqTotal)
+
     def getICDict(self, category="C"):
         """This method used to check whole IC value.
 
-        It takes long time.
+        | The IC value of all concepts are propagated over table offspringAndAncestorRel in one vectorized pass.
 
         **parameter**
 
@@ -92,30 +135,110 @@ class InformationContent(MeSHProcess):
         dict
         """
         freqDict = self.getFreqDict(category=category)
-        dd = deepcopy(freqDict)
-        ICDict = {}
-        for dui in dd.keys():
-            #children = self.getDescendant(dui=dui, category=category)
-            children = self.getOffspringConceptID(dui=dui, category=category)
-            if children is None:
-                children = [dui]
-            else:
-                children = children + [dui]
-            freqTotal = 0
-            for child in children:
-                if freqDict[child] == "N/A":
-                    sys.stderr.write("%s has no freq value\n" % child)
-                freqTotal = freqTotal + freqDict[child]
-            if 0 < freqTotal <= 1:
-                ICDict[dui] = -1 * log(freqTotal, 10)
-            else:
-                sys.stderr.write("dui %s IC value %s is wrong\n" % (dui, freqTotal))
-                ICDict[dui] = 0
+        ids = list(freqDict.keys())
+        freq = np.array([freqDict[dui] for dui in ids], dtype=float)
+        index = pd.Index(ids)
+        df = self.getOffspringAncestorData(category=category, columns=["Offspring", "Ancestor"])
+        offspring = index.get_indexer(df["Offspring"])
+        ancestor = index.get_indexer(df["Ancestor"])
+        for child in set(df["Offspring"][offspring < 0]):
+            sys.stderr.write("%s has no freq value\n" % child)
+        (ic, freqTotal) = self._propagateIC(freq=freq, offspring=offspring, ancestor=ancestor)
+        for i in np.flatnonzero(ic == 0):
+            if not 0 < freqTotal[i] <= 1:
+                sys.stderr.write("dui %s IC value %s is wrong\n" % (ids[i], freqTotal[i]))
+        ICDict = dict(zip(ids, ic.tolist()))
         return ICDict
 
+    def _computeICTable(self, category="C"):
+        """Compute IC value of all main heading concepts in one category.
+
+        | The IC value of a concept is computed from the frequence of itself and all its descendants.
+        | Frequence is propagated over the closure of the parent child graph in one vectorized pass.
+
+        **return**
+
+        tuple of (list of MeSH ID, numpy array of IC value)
+        """
+        freqDict = self.getFreqDict(category=category)
+        ids = sorted(freqDict.keys())
+        freq = np.array([freqDict[dui] for dui in ids], dtype=float)
+        graph = self.getMeSHGraph(category=category)
+        nodePos = pd.Index(ids).get_indexer(graph.ids)
+        (offspring, ancestor) = graph.ancestorClosure()
+        (ic, freqTotal) = self._propagateIC(freq=freq, offspring=nodePos[offspring], ancestor=nodePos[ancestor])
+        return (ids, ic)
+
+    def getICTable(self, category="C"):
+        """Get IC value of all main heading concepts in one category.
+
+        | The table is read from the precomputed MeSHICData once and cached.
+        | If MeSHICData has no such category, the table is computed.
+
+        **parameter**
+
+        category: String
+            one of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z', 'all').
+            It can't be None.
+
+            default: "C".
+
+        **return**
+
+        tuple of (dict map MeSH ID to array position, numpy array of IC value, max IC value).
+        """
+        if category is None:
+            sys.stderr.write("invalid category value\n")
+            exit(1)
+
+        if category not in self.allCategory:
+            sys.stderr.write("category %s not in category list.\n" % category)
+            exit(1)
+
+        if category not in self.ICTableInCategory:
+            data = self.getICData(category=category)
+            if data is None:
+                (ids, ic) = self._computeICTable(category=category)
+                index = dict(zip(ids, range(len(ids))))
+                maxID = self.maxIDInCategory.get(category)
+                maxIC = ic[index[maxID]] if maxID in index else 0
+            else:
+                (df, maxIC) = data
+                ic = df["IC"].to_numpy(dtype=float)
+                index = dict(zip(df["MeSHID"], range(len(df))))
+            self.ICTableInCategory[category] = (index, ic, maxIC)
+        return self.ICTableInCategory[category]
+
+    def createICData(self):
+        """This method is used to construct the MeSHICData table.
+
+        | It computes the IC value of every main heading concept in every category, and the max IC value.
+        | This is not a frequently used method.
+        | Before release, we have runned this method. so usrs can skip this one
+        """
+        frames = []
+        categotyDict = {}
+        maxICInCategory = {}
+        start = 0
+        for category in self.allCategory:
+            (ids, ic) = self._computeICTable(category=category)
+            frames.append(pd.DataFrame({"MeSHID": ids, "Category": category, "IC": ic}))
+            categotyDict[category] = (start, start + len(ids) - 1)
+            start = start + len(ids)
+            maxID = self.maxIDInCategory.get(category)
+            maxICInCategory[category] = float(ic[ids.index(maxID)]) if maxID in ids else 0.0
+        df1 = pd.concat(frames, ignore_index=True)
+        # same format as the other tables in the data directory
+        storage.writeTable(df=df1, rootdir=self._ICDataFilePath,
+                           attrs={"myattr": categotyDict, "maxICInCategory": maxICInCategory},
+                           storage=storage.tableFormat(rootdir=self._MainHeadingDetailDataFilePath))
+        self._store.reset(filePath=self._ICDataFilePath)
+
     def getMeSHIC(self, dui=None, category="C"):
         """This method used to get IC value from a MeSH ID.
 
+        | The value is looked up in the IC table of the category.
+
         **parameter**
 
         dui: String
@@ -135,17 +258,11 @@ class InformationContent(MeSHProcess):
         if dui.startswith("C"):
             sys.stderr.write("narrow MeSH concept has no IC value\n")
             exit(1)
-        freqDict = self.getFreqDict(category=category)
-        children = self.getDescendant(dui=dui, category=category)
-        freqTotal = 0
-        for child in children:
-            freqTotal = freqTotal + freqDict[child]
-        if 0 < freqTotal <= 1:
-            IC = -1 * log(freqTotal, 10)
-        else:
-            sys.stderr.write("dui %s IC value %s is wrong\n" % (dui, freqTotal))
-            IC = 0
-        return IC
+        (index, ic, maxIC) = self.getICTable(category=category)
+        if dui not in index:
+            sys.stderr.write("dui %s has no IC value in category %s\n" % (dui, category))
+            return 0
+        return float(ic[index[dui]])
 
     def _getMaxICInCategory(self, category=None):
         """Get the max ic concept in one category.
@@ -155,7 +272,7 @@ class InformationContent(MeSHProcess):
         if category not in self.maxIDInCategory:
             sys.stderr.write("can't get max IC in category: %s \n" % category)
             exit(1)
-        maxIC = self.getMeSHIC(dui=self.maxIDInCategory[category], category=category)
+        (index, ic, maxIC) = self.getICTable(category=category)
         return maxIC
 
 
@@ -203,15 +320,14 @@ class InformationContent(MeSHProcess):
             sys.stderr.write("the concept %s has no tree code\n"% dui2)
             return None
 
-        subsumerDuis = []
-        for code1 in treeCode1:
-            if code1[0] != category:
-                continue
-            for code2 in treeCode2:
-                if code2[0] != category:
-                    continue
-                dui = self.compareTreecode(code1=code1, code2=code2)
-                subsumerDuis.append(dui)
+        (treeIndex, nodeIC) = self.getTreeCodeIC(category=category)
+        nodes1 = [treeIndex.nodeID[code] for code in treeCode1 if code[0] == category and code in treeIndex.nodeID]
+        nodes2 = [treeIndex.nodeID[code] for code in treeCode2 if code[0] == category and code in treeIndex.nodeID]
+        if len(nodes1) == 0 or len(nodes2) == 0:
+            return []
+        lca = treeIndex.lca(node1=np.repeat(nodes1, len(nodes2)), node2=np.tile(nodes2, len(nodes1)))
+        # node 0 is the virtual root above all categories
+        subsumerDuis = ["topConcept" if node == 0 else treeIndex.owners[node] for node in set(lca.tolist())]
         return list(set(subsumerDuis))
 
     def compareTreecode(self, code1=None, code2=None):
@@ -346,6 +462,204 @@ class InformationContent(MeSHProcess):
         rel = lin * (1 - (10**(- ictmp * maxic)))
         return (res, lin, jiang, rel)
 
+    def getTreeCodeIC(self, category=None):
+        """Get the lowest common ancestor index of the tree codes in one category, and the IC value of each node.
+
+        | For "all", no tree code starts with the category letter,
+        | so the index is empty and every subsumer is the top concept, the same as findLeastCommonSubsumerbyTreeCode.
+
+        **return**
+
+        tuple of (TreeCodeIndex, numpy array of the IC value of each node).
+        """
+        if category not in self.treeCodeICInCategory:
+            (index, ic, maxIC) = self.getICTable(category=category)
+            if category == "all":
+                treeIndex = TreeCodeIndex(codes=[], owners=[])
+            else:
+                treeIndex = self.getTreeCodeIndex(category=category)
+            # the virtual root is the top concept, its IC is 0
+            nodeIC = np.array([ic[index[dui]] if dui in index else 0 for dui in treeIndex.owners], dtype=float)
+            self.treeCodeICInCategory[category] = (treeIndex, nodeIC)
+        return self.treeCodeICInCategory[category]
+
+    @staticmethod
+    def _ICScore(ic1=None, ic2=None, ictmp=None, maxic=None, method=None):
+        """Compute one IC based measure in the same way as simil, all IC values are normalized by maxic."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if method == "res":
+                return ictmp + np.zeros_like(ic2)
+            lin = 2 * ictmp / (ic1 + ic2)
+            if method == "lin":
+                return lin
+            if method == "jiang":
+                return 1 - np.minimum(1, ic1 + ic2 - 2 * ictmp)
+            return lin * (1 - (10 ** (- ictmp * maxic)))
+
+    @staticmethod
+    def _maxInGroups(values=None, offsets=None, axis=0):
+        """Get the max over groups of rows (axis 0) or columns (axis 1), the groups are given in CSR offsets.
+
+        | An empty group has value 0, the IC of the top concept.
+        """
+        counts = np.diff(offsets)
+        shape = list(values.shape)
+        shape[axis] = len(counts)
+        result = np.zeros(shape)
+        nonEmpty = counts > 0
+        if nonEmpty.any():
+            reduced = np.maximum.reduceat(values, offsets[:-1][nonEmpty], axis=axis)
+            if axis == 0:
+                result[nonEmpty] = reduced
+            else:
+                result[:, nonEmpty] = reduced
+        return result
+
+    def _getLCSICMatrix(self, duis1=None, duis2=None, category=None):
+        """Get the IC value of the least common subsumer of every pair of MeSH ID.
+
+        | The lowest common ancestor of each pair of tree codes is looked up in the TreeCodeIndex,
+        | for two MeSH ID, the max IC over their tree code pairs is kept.
+        | The rows are computed in blocks of about 2^20 tree code pairs, and reduced into the result at once,
+        | so the memory is the result matrix plus one block.
+        | duis2 None means all-vs-all of duis1, only the upper triangle is looked up and it is mirrored.
+
+        **return**
+
+        numpy matrix, 0 means the top concept.
+        """
+        (treeIndex, nodeIC) = self.getTreeCodeIC(category=category)
+        symmetric = duis2 is None
+        if symmetric:
+            duis2 = duis1
+        nodes1 = [treeIndex.ownerNodes.get(dui, []) for dui in duis1]
+        nodes2 = [treeIndex.ownerNodes.get(dui, []) for dui in duis2]
+        codes1 = np.array([i for r in nodes1 for i in r], dtype=np.int64)
+        codes2 = np.array([i for r in nodes2 for i in r], dtype=np.int64)
+        # the tree codes of MeSH ID i are codes[offset[i]: offset[i + 1]]
+        offset1 = np.zeros(len(duis1) + 1, dtype=np.int64)
+        np.cumsum([len(r) for r in nodes1], out=offset1[1:])
+        offset2 = np.zeros(len(duis2) + 1, dtype=np.int64)
+        np.cumsum([len(r) for r in nodes2], out=offset2[1:])
+        lcsIC = np.zeros((len(duis1), len(duis2)))
+        if codes1.size == 0 or codes2.size == 0:
+            return lcsIC
+        codesInBlock = max(1, 2**20 // len(codes2))
+        start = 0
+        while start < len(duis1):
+            end = int(np.searchsorted(offset1, offset1[start] + codesInBlock, side="right")) - 1
+            end = min(max(end, start + 1), len(duis1))
+            colStart = start if symmetric else 0
+            block1 = codes1[offset1[start]: offset1[end]]
+            block2 = codes2[offset2[colStart]:]
+            if block1.size and block2.size:
+                lca = treeIndex.lca(node1=np.repeat(block1, len(block2)), node2=np.tile(block2, len(block1)))
+                codeIC = nodeIC[lca].reshape(len(block1), len(block2))
+                # max over the tree codes of each MeSH ID
+                codeIC = self._maxInGroups(values=codeIC, offsets=offset1[start: end + 1] - offset1[start], axis=0)
+                codeIC = self._maxInGroups(values=codeIC, offsets=offset2[colStart:] - offset2[colStart], axis=1)
+                lcsIC[start: end, colStart:] = codeIC
+                if symmetric:
+                    lcsIC[start:, start: end] = codeIC.T
+            start = end
+        return lcsIC
+
+    def similMatrix(self, duis1=None, duis2=None, category=None, method=None):
+        """The ic algorithm for many pairs of MeSH ID in one vectorized pass.
+
+        | The value of each pair is the same as method simil.
+        | MeSH ID are deduplicated before computing, and the result is mapped back to the input order.
+        | When duis2 is None, only the upper triangle of the least common subsumer matrix is computed.
+
+        **parameter**
+
+        duis1: list
+            list of MeSH ID, limit to main headings.
+
+        duis2: list or None
+            list of MeSH ID, limit to main headings.
+            None means all-vs-all of duis1.
+
+        category: String
+            A MeSH category.
+            One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z').
+            It can't be None.
+
+        method: String or None
+            one value in ["res", "lin", "jiang", "rel"], only this measure is computed.
+            None means all four.
+
+        **return**
+
+        dict, key is the measure in ["res", "lin", "jiang", "rel"], value is numpy matrix.
+        A pair has value -1 if one of them has no IC value, nan if one of them is not in the category.
+        """
+        if category is None:
+            sys.stderr.write("category can't be None\n")
+            exit(1)
+
+        if method is None:
+            methods = ["res", "lin", "jiang", "rel"]
+        elif method in ["res", "lin", "jiang", "rel"]:
+            methods = [method]
+        else:
+            sys.stderr.write("program has no method %s\n" % method)
+            exit(1)
+
+        symmetric = duis2 is None
+        if symmetric:
+            duis2 = duis1
+
+        for dui in list(duis1) + ([] if symmetric else list(duis2)):
+            if not self.checkDui(dui=dui):
+                sys.stderr.write("invalid MeSH ID %s\n" % dui)
+                exit(1)
+            if dui.startswith("C"):
+                sys.stderr.write("narrow concept can't as inpput\n")
+                exit(1)
+
+        (uniq1, inverse1) = np.unique(np.asarray(duis1, dtype=str), return_inverse=True)
+        if symmetric:
+            (uniq2, inverse2) = (uniq1, inverse1)
+        else:
+            (uniq2, inverse2) = np.unique(np.asarray(duis2, dtype=str), return_inverse=True)
+
+        (index, ic, maxic) = self.getICTable(category=category)
+        maxic = float(maxic)
+        ic1 = np.array([ic[index[dui]] if dui in index else np.nan for dui in uniq1.tolist()]) / maxic
+        ic2 = np.array([ic[index[dui]] if dui in index else np.nan for dui in uniq2.tolist()]) / maxic
+        ictmp = self._getLCSICMatrix(duis1=uniq1.tolist(), duis2=None if symmetric else uniq2.tolist(),
+                                     category=category)
+        ictmp /= maxic
+
+        # the same MeSH ID in both lists has value 1
+        position = np.minimum(np.searchsorted(uniq2, uniq1), len(uniq2) - 1)
+        sameRow = np.flatnonzero(uniq2[position] == uniq1)
+        sameCol = position[sameRow]
+        noIC2 = ic2 <= 0
+        step = max(1, 2**20 // max(1, len(uniq2)))
+        scores = {}
+        for name in methods:
+            # the last measure is written over ictmp, so no new matrix is allocated
+            value = ictmp if name == methods[-1] else np.empty_like(ictmp)
+            for start in range(0, len(uniq1), step):
+                rows = slice(start, start + step)
+                block = self._ICScore(ic1=ic1[rows, None], ic2=ic2[None, :], ictmp=ictmp[rows], maxic=maxic,
+                                      method=name)
+                block[(ic1[rows, None] <= 0) | noIC2[None, :]] = -1
+                block[np.isnan(ic1[rows, None]) | np.isnan(ic2)[None, :]] = np.nan
+                value[rows] = block
+            value[sameRow, sameCol] = 1
+            scores[name] = value
+        # the matrix is copied only if the input is not sorted and unique
+        keep1 = len(inverse1) == len(uniq1) and (np.diff(inverse1) > 0).all()
+        keep2 = len(inverse2) == len(uniq2) and (np.diff(inverse2) > 0).all()
+        if not (keep1 and keep2):
+            for name in methods:
+                value = scores[name] if keep1 else scores[name][inverse1.ravel()]
+                scores[name] = value if keep2 else value[:, inverse2.ravel()]
+        return scores
+
     def calICSimilarity(self, dui1=None, dui2=None, category=None, method=None):
         """Calculating the term similarity based on information content.
 
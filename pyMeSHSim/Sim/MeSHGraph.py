@@ -0,0 +1,186 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import numpy as np
+
+
+class MeSHGraph(object):
+    """This class stores the parent child relation of one MeSH category as a compact graph.
+
+    | Every MeSH ID in ParentChildRel is interned to an int32 index.
+    | Parents and children of each node are stored in CSR format (offset array + index array),
+    | so the neighbours of a node is an O(degree) slice instead of a scan over the whole table.
+
+    **parameter**
+
+    relData: DataFrame
+        ParentChildRel data of one category, it has columns "Child", "Parent".
+
+    **attribute**
+
+    ids: numpy array
+        MeSH ID of each node, ids[i] is the MeSH ID of node i.
+
+    index: dict
+        Map MeSH ID to node index.
+
+    parentOffset, parentIndex: numpy array
+        CSR arrays, parents of node i is parentIndex[parentOffset[i]:parentOffset[i+1]].
+
+    childOffset, childIndex: numpy array
+        CSR arrays, children of node i is childIndex[childOffset[i]:childOffset[i+1]].
+    """
+
+    def __init__(self, relData=None):
+        child = np.asarray(relData["Child"], dtype=str)
+        parent = np.asarray(relData["Parent"], dtype=str)
+        self.ids, inverse = np.unique(np.concatenate([child, parent]), return_inverse=True)
+        self.index = dict(zip(self.ids.tolist(), range(len(self.ids))))
+        edgeNum = len(child)
+        edges = np.stack([inverse[:edgeNum], inverse[edgeNum:]], axis=1).astype(np.int32)
+        # the same edge may occur more than once
+        edges = np.unique(edges, axis=0)
+        childIdx = edges[:, 0]
+        parentIdx = edges[:, 1]
+        self.parentOffset, self.parentIndex = self._buildCSR(src=childIdx, dst=parentIdx)
+        self.childOffset, self.childIndex = self._buildCSR(src=parentIdx, dst=childIdx)
+        self._ancestorPairs = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, dui):
+        return dui in self.index
+
+    def _buildCSR(self, src=None, dst=None):
+        """Build CSR offset and index arrays from an edge list."""
+        order = np.argsort(src, kind="stable")
+        counts = np.bincount(src, minlength=len(self.ids))
+        offset = np.zeros(len(self.ids) + 1, dtype=np.int32)
+        np.cumsum(counts, out=offset[1:])
+        return offset, dst[order].astype(np.int32)
+
+    @staticmethod
+    def _gather(offset=None, index=None, nodes=None):
+        """Concatenate the CSR rows of several nodes without a python loop."""
+        starts = offset[nodes]
+        lengths = offset[nodes + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int32)
+        shift = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return index[shift + np.arange(total)]
+
+    def getID(self, dui=None):
+        """Get the node index of a MeSH ID, None if it is not in the graph."""
+        return self.index.get(dui)
+
+    def parents(self, node=None):
+        """Get parents node index of one node."""
+        return self.parentIndex[self.parentOffset[node]: self.parentOffset[node + 1]]
+
+    def children(self, node=None):
+        """Get children node index of one node."""
+        return self.childIndex[self.childOffset[node]: self.childOffset[node + 1]]
+
+    def _closure(self, node=None, offset=None, index=None):
+        """Breadth first search from one node, the node itself is the first one."""
+        visited = np.zeros(len(self.ids), dtype=bool)
+        visited[node] = True
+        frontier = np.array([node], dtype=np.int32)
+        levels = [frontier]
+        while frontier.size:
+            nodes = np.unique(self._gather(offset=offset, index=index, nodes=frontier))
+            frontier = nodes[~visited[nodes]]
+            visited[frontier] = True
+            levels.append(frontier)
+        return np.concatenate(levels)
+
+    def ancestors(self, node=None):
+        """Get all ancestors node index of one node, including itself."""
+        return self._closure(node=node, offset=self.parentOffset, index=self.parentIndex)
+
+    def descendants(self, node=None):
+        """Get all descendants node index of one node, including itself."""
+        return self._closure(node=node, offset=self.childOffset, index=self.childIndex)
+
+    def ancestorClosure(self):
+        """Get the transitive closure of the graph, computed for all nodes at once and cached.
+
+        | The closure is expanded level by level, every level is one vectorized join with the parent arrays.
+
+        **return**
+
+        tuple of (offspring, ancestor) numpy array,
+        every pair is a node and one of its ancestors, the node itself is not included.
+        """
+        if self._ancestorPairs is None:
+            n = np.int64(len(self.ids))
+            offspring = np.repeat(np.arange(len(self.ids), dtype=np.int64), np.diff(self.parentOffset))
+            allKeys = np.unique(offspring * n + self.parentIndex)
+            frontier = allKeys
+            while frontier.size:
+                frontierOff = frontier // n
+                frontierAnc = frontier % n
+                lengths = np.diff(self.parentOffset)[frontierAnc]
+                newAnc = self._gather(offset=self.parentOffset, index=self.parentIndex, nodes=frontierAnc)
+                keys = np.unique(np.repeat(frontierOff, lengths) * n + newAnc)
+                frontier = keys[~np.isin(keys, allKeys, assume_unique=True)]
+                allKeys = np.union1d(allKeys, frontier)
+            self._ancestorPairs = ((allKeys // n).astype(np.int32), (allKeys % n).astype(np.int32))
+        return self._ancestorPairs
+
+    def getParents(self, dui=None):
+        """From MeSH ID get its parents MeSH ID.
+
+        **return**
+
+        None or list of string.
+        """
+        node = self.getID(dui=dui)
+        if node is None:
+            return None
+        res = self.parents(node=node)
+        if res.size == 0:
+            return None
+        return self.ids[res].tolist()
+
+    def getChildren(self, dui=None):
+        """From MeSH ID get its children MeSH ID.
+
+        **return**
+
+        None or list of string.
+        """
+        node = self.getID(dui=dui)
+        if node is None:
+            return None
+        res = self.children(node=node)
+        if res.size == 0:
+            return None
+        return self.ids[res].tolist()
+
+    def getAncestors(self, dui=None):
+        """From MeSH ID get all its ancestors, the first item is the MeSH ID itself.
+
+        **return**
+
+        list of string.
+        """
+        node = self.getID(dui=dui)
+        if node is None:
+            return [dui]
+        return self.ids[self.ancestors(node=node)].tolist()
+
+    def getDescendant(self, dui=None):
+        """From MeSH ID get all its descendant, the first item is the MeSH ID itself.
+
+        **return**
+
+        list of string.
+        """
+        node = self.getID(dui=dui)
+        if node is None:
+            return [dui]
+        return self.ids[self.descendants(node=node)].tolist()
@@ -5,7 +5,11 @@
 import sys, copy
 #from ..data.dataDB import dataDB
 from ..data.duiFunc import duiFunc
+from ..data.dataStore import storeProperty
 from ..metamapWrap.Concept import Concept
+from .MeSHGraph import MeSHGraph
+from .TreeCodeIndex import TreeCodeIndex
+import numpy as np
 #from ..metamapWrap.MetamapInterface import MetaMap
 
 class MeSHProcess(duiFunc):
@@ -13,7 +17,22 @@ class MeSHProcess(duiFunc):
 
     | Such as child, parent, narrow, broad, ancestor, decendant...
     | This class inherit the duiFunc class.
+
+    **attribute**
+
+    parChdGraphInCategory: dict
+        cache for MeSHGraph object of each category.
+
+    treeCodeIndexInCategory: dict
+        cache for TreeCodeIndex object of each category.
+
+    ancestorBitsetInCategory: dict
+        cache for the packed ancestor bitset of each category.
     """
+    parChdGraphInCategory = storeProperty(name="parChdGraphInCategory", default=dict)
+    treeCodeIndexInCategory = storeProperty(name="treeCodeIndexInCategory", default=dict)
+    ancestorBitsetInCategory = storeProperty(name="ancestorBitsetInCategory", default=dict)
+
     def __init__(self):
         duiFunc.__init__(self)
 
@@ -42,6 +61,105 @@ class MeSHProcess(duiFunc):
         concept = Concept.MeSHConcept(cui=cui, dui=dui, tree_code=tree_code)
         return concept
 
+    def getMeSHGraph(self, category=None):
+        """Get the parent child relation graph of one category.
+
+        | The graph is built once from table ParentChildRel and cached.
+
+        **parameter**
+
+        category: String
+            One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z', 'all').
+
+        **return**
+
+        MeSHGraph object
+
+        **see also**
+
+        pyMeSHSim.Sim.MeSHGraph
+        """
+        self._checkCategory(category=category)
+        if category not in self.parChdGraphInCategory:
+            if category not in self.parChdRelDataInCategory:
+                df = self.getRelData(data="ParentChildRel", category=category)
+                self.parChdRelDataInCategory[category] = df
+            else:
+                df = self.parChdRelDataInCategory[category]
+            self.parChdGraphInCategory[category] = MeSHGraph(relData=df)
+        return self.parChdGraphInCategory[category]
+
+    def _checkCategory(self, category=None):
+        """Exit if category is not one category abbreviation."""
+        if category is None:
+            sys.stderr.write("category can't be none\n")
+            exit(1)
+
+        if isinstance(category, list):
+            sys.stderr.write("can't input a list as category\n")
+            exit(1)
+
+        if category not in self.allCategory:
+            sys.stderr.write("category %s not in category list.\n" % category)
+            exit(1)
+
+    def getTreeCodeIndex(self, category=None):
+        """Get the sorted tree code index of one category.
+
+        | The index is built once from table MainHeadingDetailData and cached.
+        | Only the tree codes starting with the category letter are in the index, "all" has all tree codes.
+
+        **parameter**
+
+        category: String
+            One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z', 'all').
+
+        **return**
+
+        TreeCodeIndex object
+
+        **see also**
+
+        pyMeSHSim.Sim.TreeCodeIndex
+        """
+        self._checkCategory(category=category)
+        if category not in self.treeCodeIndexInCategory:
+            if category not in self.MainHeadingDetailDataInCategory:
+                df = self.getMainHeadingDetailData(category=category)
+                self.MainHeadingDetailDataInCategory[category] = df
+            else:
+                df = self.MainHeadingDetailDataInCategory[category]
+            pairs = [(code, dui) for (code, dui) in zip(df["Tree_Code"], df["MeSHID"])
+                     if category == "all" or code[0] == category]
+            self.treeCodeIndexInCategory[category] = TreeCodeIndex(codes=[code for (code, dui) in pairs],
+                                                                   owners=[dui for (code, dui) in pairs])
+        return self.treeCodeIndexInCategory[category]
+
+    def getAncestorBitset(self, category=None):
+        """Get the packed ancestor bitset of all main headings in one category.
+
+        | It is built once from the tree code index and cached, see TreeCodeIndex.ancestorBitset.
+        | The ancestors of several concepts in a set of concepts are found by OR and AND of the rows,
+        | whatever the depth of the hierarchy.
+
+        **parameter**
+
+        category: String
+            category abbreviation, eg. "C".
+
+        **return**
+
+        tuple of (numpy array, numpy array)
+        | sorted MeSH ID of the category,
+        | uint64 array, bit j of row i is set if the j-th MeSH ID is a proper ancestor of the i-th one.
+        """
+        self._checkCategory(category=category)
+        if category not in self.ancestorBitsetInCategory:
+            treeIndex = self.getTreeCodeIndex(category="all")
+            (duiIDs, bits) = treeIndex.ancestorBitset(category=category)
+            self.ancestorBitsetInCategory[category] = (treeIndex.duis[duiIDs], bits)
+        return self.ancestorBitsetInCategory[category]
+
     def _getParentOrchildConceptID(self, dui=None, data=None, category=None, rel=None):
         """From MeSH ID get its parents or children concepts MeSHID.
 
@@ -91,23 +209,11 @@ class MeSHProcess(duiFunc):
             else:
                 return list(set(pa))
 
-        if category not in self.parChdRelDataInCategory:
-            df = self.getRelData(data="ParentChildRel", category=category)
-            self.parChdRelDataInCategory[category] = df
-        else:
-            df = self.parChdRelDataInCategory[category]
-
+        graph = self.getMeSHGraph(category=category)
         if rel == "PAR":
-            res = df[column][df["Child"] == dui]
-        else:
-            res = df[column][df["Parent"] == dui]
-
-        if res.empty:
-            return None
+            return graph.getParents(dui=dui)
         else:
-            return list(set(res))
-
-
+            return graph.getChildren(dui=dui)
 
     def getParentsConceptID(self, dui=None, data=None, category=None):
         """From MeSH ID get its parent concepts MeSHID.
@@ -207,20 +313,39 @@ class MeSHProcess(duiFunc):
         list of string.
         Store MeSH ID.
         """
-        parents = self.getParentsConceptID(dui=dui, category=category)
-        contmp = copy.deepcopy(parents)
-        searchedcon = [dui]
-        while contmp:
-            interCon = []
-            for con in contmp:
-                if con in searchedcon:
-                    continue
-                searchedcon.append(con)
-                parents = self.getParentsConceptID(dui=con, category=category)
-                if parents is not None:
-                    interCon = interCon + parents
-            contmp = list(set(interCon))
-        return searchedcon
+        self._checkCategory(category=category)
+        treeIndex = self.getTreeCodeIndex(category="all")
+        return treeIndex.getAncestors(dui=dui, category=category)
+
+    def isAncestor(self, dui1=None, dui2=None, category=None):
+        """Check if dui1 is an ancestor of dui2 in one category.
+
+        | It is one bit of the ancestor bitset of the category, see getAncestorBitset,
+        | the same relation as getAncestors, including the ancestors through the other tree codes
+        | of an intermediate concept.
+
+        **parameter**
+
+        dui1: String
+            MeSH ID.
+
+        dui2: String
+            MeSH ID.
+
+        category: String
+            One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z', 'all').
+
+        **return**
+
+        True or False, a concept is not an ancestor of itself.
+        """
+        if dui1 == dui2:
+            return False
+        (duis, bits) = self.getAncestorBitset(category=category)
+        (row, col) = np.searchsorted(duis, [dui2, dui1])
+        if row == len(duis) or col == len(duis) or duis[row] != dui2 or duis[col] != dui1:
+            return False
+        return bool((int(bits[row, col >> 6]) >> int(col & 63)) & 1)
 
     def getDescendant(self, dui=None, category=None, data=None):
         """This method will return all decendant of a mesh concept.
@@ -240,20 +365,25 @@ class MeSHProcess(duiFunc):
         list of string
         Store MeSH ID.
         """
-        children = self.getChildrenConceptID(dui=dui, category=category, data=data)
-        contmp = copy.deepcopy(children)
-        searchedcon = [dui]
-        while contmp:
-            interCon = []
-            for con in contmp:
-                if con in searchedcon:
-                    continue
-                searchedcon.append(con)
-                children = self.getChildrenConceptID(dui=con, category=category, data=data)
-                if children is not None:
-                    interCon = interCon + children
-            contmp = list(set(interCon))
-        return searchedcon
+        if data is not None:
+            children = self.getChildrenConceptID(dui=dui, category=category, data=data)
+            contmp = copy.deepcopy(children)
+            searchedcon = [dui]
+            while contmp:
+                interCon = []
+                for con in contmp:
+                    if con in searchedcon:
+                        continue
+                    searchedcon.append(con)
+                    children = self.getChildrenConceptID(dui=con, category=category, data=data)
+                    if children is not None:
+                        interCon = interCon + children
+                contmp = list(set(interCon))
+            return searchedcon
+
+        self._checkCategory(category=category)
+        treeIndex = self.getTreeCodeIndex(category="all")
+        return treeIndex.getDescendant(dui=dui, category=category)
 
 
     def _getAncestorsOrDescendentConceptID(self, dui=None, category=None, rel=None):
@@ -4,13 +4,23 @@
 #!/usr/bin/python3
 from copy import deepcopy
 from .ICScore import InformationContent
+from ..data.dataStore import storeProperty
 import sys
+import numpy as np
 
 class pathMethod(InformationContent):
-    """This class implement the path based similarity."""
+    """This class implement the path based similarity.
+
+    **attribute**
+
+    SVLevelInCategory: dict
+        | cache for the semantic value of each category, key is node index in the MeSHGraph.
+        | value is tuple of (ancestor node index, longest path length), the weight is applied when used.
+    """
+    SVLevelInCategory = storeProperty(name="SVLevelInCategory", default=dict)
+
     def __init__(self):
         InformationContent.__init__(self)
-        pass
 
     def pathSim(self, cui1=None, cui2=None):
         """Shortest path measurement."""
@@ -173,6 +183,39 @@ class pathMethod(InformationContent):
 
         return -1
 
+    def _getSVLevel(self, node=None, category=None):
+        """Get the ancestors of a node and the longest path length to each of them, cached for the category.
+
+        | The levels of a node are merged from the levels of its parents plus one,
+        | so every node in the category is computed only once.
+
+        **return**
+
+        tuple of (sorted numpy array of ancestor node index, numpy array of path length),
+        the node itself is included with length 0.
+        """
+        graph = self.getMeSHGraph(category=category)
+        cache = self.SVLevelInCategory.setdefault(category, {})
+        stack = [node]
+        while stack:
+            cur = stack[-1]
+            if cur in cache:
+                stack.pop()
+                continue
+            parents = graph.parents(node=cur).tolist()
+            missing = [par for par in parents if par not in cache]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            nodes = np.concatenate([[cur]] + [cache[par][0] for par in parents])
+            levels = np.concatenate([[0]] + [cache[par][1] + 1 for par in parents])
+            # keep the longest path of each ancestor, as the level by level walk overwrites the shorter ones
+            order = np.lexsort((-levels, nodes))
+            (uniq, first) = np.unique(nodes[order], return_index=True)
+            cache[cur] = (uniq.astype(np.int32), levels[order][first].astype(np.int32))
+        return cache[node]
+
     def _getSV(self, dui=None, weight=0.7, category=None):
         """this is the base function of calPathSimilarity.
 
@@ -191,29 +234,29 @@ class pathMethod(InformationContent):
 
         **return**
 
-        dict
+        dict, the root concept has only itself.
         """
+        (nodes, values) = self._getSVVector(dui=dui, weight=weight, category=category)
+        if nodes is None:
+            return {dui: 1}
+        ids = self.getMeSHGraph(category=category).ids
+        return dict(zip(ids[nodes].tolist(), values.tolist()))
 
-        parents = self.getParentsConceptID(dui=dui, category=category)
-        if parents is None:
-            return 1
-        stack = deepcopy(parents)
-        SVDict = {dui: 1}
-        loopFlag = 1
-        while stack is not None and len(stack) >= 1:
-            stackTmp = deepcopy(stack)
-            stack = []
-            for con in stackTmp:
-                SVDict[con] = 1 * weight**loopFlag
-                par = self.getParentsConceptID(dui=con, category=category)
-                if par is not None:
-                    stack = stack + par
-            loopFlag = loopFlag + 1
-        return SVDict
-
-
-
-    def calPathSimilarity(self, dui1=None, dui2=None, category=None):
+    def _getSVVector(self, dui=None, weight=0.7, category=None):
+        """Get the semantic value of a MeSH ID as a sparse vector over the graph nodes.
+
+        **return**
+
+        tuple of (numpy array of node index, numpy array of semantic value),
+        node index is None if the MeSH ID is not in the graph.
+        """
+        node = self.getMeSHGraph(category=category).getID(dui=dui)
+        if node is None:
+            return (None, np.ones(1))
+        (nodes, levels) = self._getSVLevel(node=node, category=category)
+        return (nodes, weight ** levels.astype(float))
+
+    def calPathSimilarity(self, dui1=None, dui2=None, category=None, weight=0.7):
         """Calculating the term similarity based on term path.
 
         This is the "wang" method.
@@ -231,6 +274,9 @@ class pathMethod(InformationContent):
             One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z').
             It can't be None.
 
+        weight: float
+            weight of one edge, defaut is 0.7.
+
         **return**
 
         float
@@ -254,16 +300,94 @@ class pathMethod(InformationContent):
         if dui1 == dui2:
             return 1
 
-        if dui1 == dui2:
-            return 1
-
-        SV1 = self._getSV(dui=dui1, category=category)
-        SV2 = self._getSV(dui=dui2, category=category)
-        intersection = SV1.keys() & SV2.keys()
-        interSV1 = sum([SV1[key] for key in intersection])
-        interSV2 = sum([SV2[key] for key in intersection])
-        allSV1 = sum(SV1.values())
-        allSV2 = sum(SV2.values())
-        score = float(interSV1 + interSV2) / (allSV1 + allSV2)
+        (nodes1, SV1) = self._getSVVector(dui=dui1, weight=weight, category=category)
+        (nodes2, SV2) = self._getSVVector(dui=dui2, weight=weight, category=category)
+        if nodes1 is None or nodes2 is None:
+            return 0.0
+        (common, pos1, pos2) = np.intersect1d(nodes1, nodes2, assume_unique=True, return_indices=True)
+        score = float(SV1[pos1].sum() + SV2[pos2].sum()) / (SV1.sum() + SV2.sum())
         return score
 
+    def calPathSimilarityMatrix(self, duis1=None, duis2=None, category=None, weight=0.7):
+        """Calculating the "wang" similarity for many pairs of MeSH ID.
+
+        | The semantic values are dense rows over the ancestors shared by both sides,
+        | so the intersections of all pairs are two matrix products.
+        | When duis2 is None, the two products are the transpose of each other, only one is computed.
+
+        **parameter**
+
+        duis1: list
+            list of MeSH ID, limit to main headings.
+
+        duis2: list or None
+            list of MeSH ID, limit to main headings.
+            None means all-vs-all of duis1.
+
+        category: String
+            A MeSH category.
+            One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z').
+            It can't be None.
+
+        weight: float
+            weight of one edge, defaut is 0.7.
+
+        **return**
+
+        numpy matrix
+        """
+        if category is None:
+            sys.stderr.write("category can't be None\n")
+            exit(1)
+
+        symmetric = duis2 is None
+        if symmetric:
+            duis2 = duis1
+
+        for dui in list(duis1) + ([] if symmetric else list(duis2)):
+            if not self.checkDui(dui=dui):
+                sys.stderr.write("invalid MeSH ID %s\n" % dui)
+                exit(1)
+            if dui.startswith("C"):
+                sys.stderr.write("narrow concept can't as inpput\n")
+                exit(1)
+
+        (uniq1, inverse1) = np.unique(np.asarray(duis1, dtype=str), return_inverse=True)
+        SV1 = [self._getSVVector(dui=dui, weight=weight, category=category) for dui in uniq1.tolist()]
+        total1 = np.array([values.sum() for (nodes, values) in SV1])
+        empty = np.zeros(0, dtype=np.int32)
+        nodes1 = np.concatenate([empty] + [nodes for (nodes, values) in SV1 if nodes is not None])
+        if symmetric:
+            columns = np.unique(nodes1)
+            dense1 = self._denseSV(SVs=SV1, columns=columns)
+            inter = np.dot(dense1, (dense1 > 0).T)
+            inter += inter.T.copy()
+            scores = inter / (total1[:, None] + total1[None, :])
+            np.fill_diagonal(scores, 1)
+            return scores[inverse1][:, inverse1]
+
+        (uniq2, inverse2) = np.unique(np.asarray(duis2, dtype=str), return_inverse=True)
+        SV2 = [self._getSVVector(dui=dui, weight=weight, category=category) for dui in uniq2.tolist()]
+        total2 = np.array([values.sum() for (nodes, values) in SV2])
+        # only the ancestors shared by both sides contribute to the intersection
+        columns = np.intersect1d(nodes1,
+                                 np.concatenate([empty] + [nodes for (nodes, values) in SV2 if nodes is not None]))
+        dense1 = self._denseSV(SVs=SV1, columns=columns)
+        dense2 = self._denseSV(SVs=SV2, columns=columns)
+        inter = np.dot(dense1, (dense2 > 0).T) + np.dot(dense1 > 0, dense2.T)
+        scores = inter / (total1[:, None] + total2[None, :])
+        scores[uniq1[:, None] == uniq2[None, :]] = 1
+        return scores[inverse1][:, inverse2]
+
+    @staticmethod
+    def _denseSV(SVs=None, columns=None):
+        """Put sparse semantic values into a dense matrix, the node not in columns is dropped."""
+        dense = np.zeros((len(SVs), len(columns)))
+        for i, (nodes, values) in enumerate(SVs):
+            if nodes is None or len(columns) == 0:
+                continue
+            pos = np.searchsorted(columns, nodes)
+            pos[pos == len(columns)] = 0
+            keep = columns[pos] == nodes
+            dense[i, pos[keep]] = values[keep]
+        return dense
@@ -0,0 +1,382 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import numpy as np
+from ..data.treeStatistics import countDescendants, nodeStatistics, packAncestors
+
+
+class TreeCodeIndex(object):
+    """This class indexes the MeSH tree code forest for lowest common ancestor query.
+
+    | All tree codes are encoded as int, node 0 is a virtual root above the top tree codes of every category.
+    | An Euler tour of the forest and a sparse table over the depth of the tour are precomputed,
+    | so the lowest common ancestor of two tree codes is a range minimum query in constant time.
+
+    **parameter**
+
+    codes: list
+        list of MeSH tree code.
+
+    owners: list
+        MeSH ID of each tree code.
+
+    **attribute**
+
+    codes: list
+        tree code of each node, sorted, codes[0] is "" for the virtual root.
+
+    owners: list
+        MeSH ID of each node, None for the virtual root and the tree code missing in the data.
+
+    nodeID: dict
+        Map tree code to node index.
+
+    ownerNodes: dict
+        Map MeSH ID to the list of its node index.
+
+    parent, depth: numpy array
+        parent node and depth of each node, the virtual root has parent -1 and depth 0.
+
+    subtreeEnd: numpy array
+        the subtree of node i is the nodes in range(i, subtreeEnd[i]).
+
+    duis: numpy array
+        MeSH ID in the index, ownerID[i] is the position of the owner of node i in duis, -1 for none.
+
+    duiNodeOffset, duiNodeIndex: numpy array
+        CSR arrays, nodes of MeSH ID j is duiNodeIndex[duiNodeOffset[j]:duiNodeOffset[j+1]].
+
+    childOffset, childIndex: numpy array
+        CSR arrays, children of node i is childIndex[childOffset[i]:childOffset[i+1]].
+    """
+
+    def __init__(self, codes=None, owners=None):
+        codeOwner = dict(zip(codes, owners))
+        # a tree code which is not in the data still need a node, so its children can be linked
+        allCodes = set()
+        for code in codeOwner:
+            array = code.split(".")
+            for i in range(len(array)):
+                allCodes.add(".".join(array[0: i + 1]))
+        # sorted tree codes are in the depth first order, because "." is smaller than any digit
+        self.codes = [""] + sorted(allCodes)
+        self.owners = [codeOwner.get(code) for code in self.codes]
+        self.nodeID = dict(zip(self.codes, range(len(self.codes))))
+        self.ownerNodes = {}
+        for node, dui in enumerate(self.owners):
+            if dui is not None:
+                self.ownerNodes.setdefault(dui, []).append(node)
+
+        num = len(self.codes)
+        self.parent = np.full(num, -1, dtype=np.int32)
+        self.depth = np.zeros(num, dtype=np.int32)
+        for node in range(1, num):
+            code = self.codes[node]
+            pos = code.rfind(".")
+            self.parent[node] = 0 if pos < 0 else self.nodeID[code[0: pos]]
+            self.depth[node] = self.depth[self.parent[node]] + 1
+        # the descendants of a tree code sort between the code and the code + "/"
+        codeArray = np.array(self.codes)
+        self.subtreeEnd = np.searchsorted(codeArray, np.char.add(codeArray, "/"))
+        self.subtreeEnd[0] = num
+        self._buildOwnerIndex()
+        self._buildChildIndex()
+        self._buildEulerTour()
+        self._buildSparseTable()
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _buildOwnerIndex(self):
+        """Encode the owner of each node as int, and store the nodes of each MeSH ID in CSR format."""
+        self.duis = np.array(sorted(self.ownerNodes), dtype=str)
+        position = dict(zip(self.duis.tolist(), range(len(self.duis))))
+        self.ownerID = np.array([position.get(dui, -1) for dui in self.owners], dtype=np.int64)
+        nodes = np.flatnonzero(self.ownerID >= 0)
+        order = np.argsort(self.ownerID[nodes], kind="stable")
+        self.duiNodeIndex = nodes[order]
+        self.duiNodeOffset = np.zeros(len(self.duis) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.ownerID[nodes], minlength=len(self.duis)), out=self.duiNodeOffset[1:])
+        self.codeLetter = np.array([code[0: 1] for code in self.codes])
+        self.categoryMasks = {}
+        self.ancestorBitsets = {}
+
+    def _buildChildIndex(self):
+        """Store the children of each node in CSR format."""
+        nodes = np.arange(1, len(self.codes), dtype=np.int64)
+        order = np.argsort(self.parent[nodes], kind="stable")
+        self.childIndex = nodes[order]
+        self.childOffset = np.zeros(len(self.codes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.parent[nodes], minlength=len(self.codes)), out=self.childOffset[1:])
+
+    @staticmethod
+    def _ranges(starts=None, ends=None):
+        """Concatenate integer ranges [starts[i], ends[i]) without a python loop."""
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        shift = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return shift + np.arange(total)
+
+    def _duiNodes(self, duiIDs=None):
+        """Get all nodes of several MeSH ID."""
+        return self.duiNodeIndex[self._ranges(starts=self.duiNodeOffset[duiIDs], ends=self.duiNodeOffset[duiIDs + 1])]
+
+    def descendantNodes(self, nodes=None):
+        """Get the nodes in the subtree of several nodes, each subtree is a contiguous range of the sorted codes."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        return self._ranges(starts=nodes, ends=self.subtreeEnd[nodes])
+
+    def ancestorNodes(self, nodes=None):
+        """Get the prefix nodes of several nodes, including themselves, the virtual root is not included."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        levels = []
+        while nodes.size:
+            nodes = nodes[nodes > 0]
+            levels.append(nodes)
+            nodes = self.parent[nodes].astype(np.int64)
+        return np.concatenate(levels)
+
+    def childNodes(self, nodes=None):
+        """Get the direct children of several nodes."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        return self.childIndex[self._ranges(starts=self.childOffset[nodes], ends=self.childOffset[nodes + 1])]
+
+    def parentNodes(self, nodes=None):
+        """Get the direct parents of several nodes, the virtual root is not included."""
+        nodes = self.parent[np.asarray(nodes, dtype=np.int64)].astype(np.int64)
+        return nodes[nodes > 0]
+
+    def categoryMask(self, category=None):
+        """Get a bool array over duis, True for the MeSH ID which has a tree code in the category."""
+        if category not in self.categoryMasks:
+            mask = np.zeros(len(self.duis), dtype=bool)
+            owner = self.ownerID[self.codeLetter == category]
+            mask[owner[owner >= 0]] = True
+            self.categoryMasks[category] = mask
+        return self.categoryMasks[category]
+
+    def _closure(self, dui=None, ancestor=True, category=None):
+        """Expand a MeSH ID through its tree codes until no new MeSH ID is found.
+
+        | A MeSH ID may have tree codes in several branches, the MeSH ID found from one tree code
+        | are expanded again from all of their tree codes, so the result is the closure over MeSH ID.
+        | For "all", one step is a whole subtree range or prefix walk.
+        | For a category, a parent-child relation is in the category when both concepts have a tree code in it,
+        | the closure is read from the ancestor bitset of the category, a row for the ancestors
+        | and a column for the descendants.
+        """
+        if dui not in self.ownerNodes:
+            return [dui]
+        start = int(np.searchsorted(self.duis, dui))
+        if category is not None and category != "all":
+            (duiIDs, bits) = self.ancestorBitset(category=category)
+            local = int(np.searchsorted(duiIDs, start))
+            if local == len(duiIDs) or duiIDs[local] != start:
+                return [dui]
+            if ancestor:
+                found = np.flatnonzero(np.unpackbits(bits[local].view(np.uint8), bitorder="little"))
+            else:
+                found = np.flatnonzero((bits[:, local >> 6] >> np.uint64(local & 63)) & np.uint64(1))
+            return [dui] + self.duis[duiIDs[found]].tolist()
+        expand = self.ancestorNodes if ancestor else self.descendantNodes
+        visited = np.zeros(len(self.duis), dtype=bool)
+        visited[start] = True
+        frontier = np.array([start], dtype=np.int64)
+        levels = [frontier]
+        while frontier.size:
+            found = np.unique(self.ownerID[expand(nodes=self._duiNodes(duiIDs=frontier))])
+            found = found[found >= 0]
+            frontier = found[~visited[found]]
+            visited[frontier] = True
+            levels.append(frontier)
+        return self.duis[np.concatenate(levels)].tolist()
+
+    def getDescendant(self, dui=None, category=None):
+        """From MeSH ID get all its descendant, the first item is the MeSH ID itself.
+
+        **parameter**
+
+        dui: String
+            MeSH ID.
+
+        category: String or None
+            a category letter, or None and "all" for all tree codes.
+
+        **return**
+
+        list of string.
+        """
+        return self._closure(dui=dui, ancestor=False, category=category)
+
+    def getAncestors(self, dui=None, category=None):
+        """From MeSH ID get all its ancestors, the first item is the MeSH ID itself.
+
+        **parameter**
+
+        dui: String
+            MeSH ID.
+
+        category: String or None
+            a category letter, or None and "all" for all tree codes.
+
+        **return**
+
+        list of string.
+        """
+        return self._closure(dui=dui, ancestor=True, category=category)
+
+    def descendantCounts(self, category=None):
+        """Count the descendants of every MeSH ID in one category, the MeSH ID itself is not counted.
+
+        | For a category, the count of a MeSH ID is the number of rows of the ancestor bitset with its bit set.
+        | For "all", a MeSH ID without a child has no descendant, only the others need the closure.
+
+        **return**
+
+        numpy array of int, in the order of duis, 0 for the MeSH ID not in the category.
+        """
+        counts = np.zeros(len(self.duis), dtype=np.int64)
+        if category is not None and category != "all":
+            (duiIDs, bits) = self.ancestorBitset(category=category)
+            counts[duiIDs] = countDescendants(bits=bits)
+            return counts
+        childOwner = self.ownerID[self.childIndex]
+        parentOwner = self.ownerID[self.parent[self.childIndex]]
+        keep = (childOwner >= 0) & (parentOwner >= 0)
+        for duiID in np.unique(parentOwner[keep]):
+            counts[duiID] = len(self.getDescendant(dui=self.duis[duiID], category=category)) - 1
+        return counts
+
+    def ancestorBitset(self, category=None):
+        """Get the packed ancestor bitset of every MeSH ID in one category.
+
+        | Bit j of row i is set if the j-th MeSH ID of the category is a proper ancestor of the i-th one,
+        | the same relation as getAncestors. It is built once for each category and cached.
+
+        **return**
+
+        tuple of (numpy array, numpy array)
+        | position of the MeSH ID of the category in duis,
+        | uint64 array of shape (number of MeSH ID, number of 64 bit words).
+        """
+        key = "all" if category is None else category
+        if key not in self.ancestorBitsets:
+            self.ancestorBitsets[key] = self._buildAncestorBitset(category=key)
+        return self.ancestorBitsets[key]
+
+    def _buildAncestorBitset(self, category=None):
+        """Get the direct relations between the MeSH ID of a category, and pack their closure by packAncestors."""
+        if category == "all":
+            mask = np.ones(len(self.duis), dtype=bool)
+        else:
+            mask = self.categoryMask(category=category)
+        duiIDs = np.flatnonzero(mask)
+        local = np.full(len(self.duis), -1, dtype=np.int64)
+        local[duiIDs] = np.arange(len(duiIDs))
+        # direct parent-child relations between the MeSH ID of the category, through any tree code
+        # a tree code missing in the data has no owner, it gives no relation
+        nodes = np.flatnonzero((self.ownerID >= 0) & (self.parent > 0))
+        nodes = nodes[self.ownerID[self.parent[nodes]] >= 0]
+        child = local[self.ownerID[nodes]]
+        parent = local[self.ownerID[self.parent[nodes]]]
+        keep = (child >= 0) & (parent >= 0) & (child != parent)
+        edges = np.unique(np.stack([child[keep], parent[keep]], axis=1), axis=0).reshape(-1, 2)
+        bits = packAncestors(edges=edges, size=len(duiIDs))
+        return (duiIDs, bits)
+
+    def isAncestorCode(self, code1=None, code2=None):
+        """Check if tree code code1 is a proper prefix of tree code code2, by one interval check."""
+        if code1 not in self.nodeID or code2 not in self.nodeID:
+            return False
+        node1 = self.nodeID[code1]
+        node2 = self.nodeID[code2]
+        return node1 < node2 < self.subtreeEnd[node1]
+
+    def isAncestorByCode(self, dui1=None, dui2=None):
+        """Check if one tree code of dui1 is a proper prefix of one tree code of dui2.
+
+        | Each pair of tree codes is one interval check.
+        """
+        for node1 in self.ownerNodes.get(dui1, []):
+            end = self.subtreeEnd[node1]
+            for node2 in self.ownerNodes.get(dui2, []):
+                if node1 < node2 < end:
+                    return True
+        return False
+
+    def _buildEulerTour(self):
+        """Walk the forest from the virtual root, record every node when it is entered and returned to."""
+        num = len(self.codes)
+        children = [[] for i in range(num)]
+        for node in range(1, num):
+            children[self.parent[node]].append(node)
+        euler = []
+        self.first = np.zeros(num, dtype=np.int64)
+        stack = [(0, 0)]
+        while stack:
+            (node, pos) = stack.pop()
+            if pos == 0:
+                self.first[node] = len(euler)
+            euler.append(node)
+            if pos < len(children[node]):
+                stack.append((node, pos + 1))
+                stack.append((children[node][pos], 0))
+        self.euler = np.array(euler, dtype=np.int32)
+        self.eulerDepth = self.depth[self.euler]
+
+    def _buildSparseTable(self):
+        """sparse[k][i] is the position of the min depth in euler[i: i + 2**k]."""
+        size = len(self.euler)
+        table = [np.arange(size, dtype=np.int32)]
+        k = 1
+        while (1 << k) <= size:
+            prev = table[-1]
+            half = 1 << (k - 1)
+            left = prev[: size - (1 << k) + 1]
+            right = prev[half: half + len(left)]
+            table.append(np.where(self.eulerDepth[left] <= self.eulerDepth[right], left, right))
+            k = k + 1
+        self.sparse = table
+
+    def lca(self, node1=None, node2=None):
+        """Get the lowest common ancestor of two nodes, or of two arrays of nodes element-wise.
+
+        **return**
+
+        int or numpy array of node index, 0 means the virtual root.
+        """
+        first1 = self.first[node1]
+        first2 = self.first[node2]
+        left = np.minimum(first1, first2)
+        right = np.maximum(first1, first2)
+        length = right - left + 1
+        k = np.floor(np.log2(length)).astype(np.int64)
+        if np.ndim(k) == 0:
+            cand1 = self.sparse[k][left]
+            cand2 = self.sparse[k][right - (1 << k) + 1]
+            pos = cand1 if self.eulerDepth[cand1] <= self.eulerDepth[cand2] else cand2
+            return int(self.euler[pos])
+        pos = np.empty(len(k), dtype=np.int32)
+        for level in np.unique(k):
+            sel = k == level
+            cand1 = self.sparse[level][left[sel]]
+            cand2 = self.sparse[level][right[sel] - (1 << int(level)) + 1]
+            pos[sel] = np.where(self.eulerDepth[cand1] <= self.eulerDepth[cand2], cand1, cand2)
+        return self.euler[pos]
+
+    def lcaCode(self, code1=None, code2=None):
+        """Get the lowest common ancestor of two tree codes.
+
+        **return**
+
+        None if they have no common ancestor or one of them is not in the index, otherwise a tree code.
+        """
+        if code1 not in self.nodeID or code2 not in self.nodeID:
+            return None
+        node = self.lca(node1=self.nodeID[code1], node2=self.nodeID[code2])
+        if node == 0:
+            return None
+        return self.codes[node]
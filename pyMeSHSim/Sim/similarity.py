@@ -5,9 +5,21 @@
 #!/usr/bin/python3
 from .PathScore import pathMethod
 from ..metamapWrap.MetamapInterface import MetaMap
+from ..data.dataStore import storeProperty
 import sys, copy
+import numpy as np
 
 class termComp(pathMethod):
+    """This class compares MeSH terms.
+
+    **attribute**
+
+    similarSearchInCategory: dict
+        | cache for the top-k search of each category.
+        | value is tuple of (sorted MeSH ID, IC value, candidate of each tree code node, min positive IC in each subtree).
+    """
+
+    similarSearchInCategory = storeProperty(name="similarSearchInCategory", default=dict)
 
     def __init__(self):
         pathMethod.__init__(self)
@@ -79,6 +91,216 @@ class termComp(pathMethod):
 
         return score_list
 
+    def termSimMatrix(self, duis1=None, duis2=None, category=None, method=None):
+        """This function used to measure the similarity between two lists of MeSH terms in one batch.
+
+        | The IC based measures are computed in one vectorized pass, the "wang" semantic values are computed once per term.
+        | MeSH ID are deduplicated, and when duis2 is None the symmetry of the all-vs-all matrix is used.
+        | Only main headings are accepted, the value of each pair is the same as termSim.
+
+        **parameter**
+
+        duis1: list
+            list of MeSH ID.
+
+        duis2: list or None
+            list of MeSH ID.
+            None means all-vs-all of duis1.
+
+        category: String
+            A MeSH category.
+            One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z').
+            It can't be None.
+
+        method: String
+            One value in ["lin", "res", "jiang", "rel", "wang"].
+
+        **return**
+
+        numpy matrix, row i and column j is the score of duis1[i] and duis2[j].
+        """
+        if method not in ["lin", "res", "jiang", "rel", "wang"]:
+            sys.stderr.write("program has no method %s\n" % method)
+            exit(1)
+
+        if duis1 is None or len(duis1) == 0:
+            sys.stderr.write("no items in duis1\n")
+            exit(1)
+
+        if method == "wang":
+            return self.calPathSimilarityMatrix(duis1=duis1, duis2=duis2, category=category)
+        scores = self.similMatrix(duis1=duis1, duis2=duis2, category=category, method=method)
+        return scores[method]
+
+    def _getSimilarSearchData(self, category=None):
+        """Get the candidate MeSH ID of one category and the IC bounds of every tree code subtree.
+
+        **return**
+
+        tuple of (numpy array of sorted MeSH ID, numpy array of IC value,
+        numpy array of candidate position of each node, -1 for none,
+        numpy array of min positive IC in the subtree of each node, inf for none).
+        """
+        if category not in self.similarSearchInCategory:
+            (index, ic, maxic) = self.getICTable(category=category)
+            duis = sorted(index.keys())
+            candIC = ic[[index[dui] for dui in duis]]
+            (treeIndex, nodeIC) = self.getTreeCodeIC(category=category)
+            position = dict(zip(duis, range(len(duis))))
+            nodeCand = np.array([position.get(dui, -1) for dui in treeIndex.owners], dtype=np.int64)
+            subMin = np.full(len(treeIndex), np.inf)
+            valid = nodeCand >= 0
+            subMin[valid] = np.where(candIC[nodeCand[valid]] > 0, candIC[nodeCand[valid]], np.inf)
+            # merge the subtree min from the deepest level to the top
+            for level in range(int(treeIndex.depth.max()), 0, -1):
+                nodes = np.flatnonzero(treeIndex.depth == level)
+                np.minimum.at(subMin, treeIndex.parent[nodes], subMin[nodes])
+            positive = candIC[candIC > 0]
+            subMin[0] = positive.min() if positive.size else np.inf
+            self.similarSearchInCategory[category] = (np.array(duis, dtype=str), candIC, nodeCand, subMin)
+        return self.similarSearchInCategory[category]
+
+    def _mostSimilarIC(self, dui=None, category=None, method=None, k=None):
+        """Top-k search for the IC based measures.
+
+        | The least common subsumer of the query and a candidate is one ancestor of the query tree codes.
+        | Ancestors are visited in descending IC order, so a candidate first met in the subtree of an ancestor
+        | has that ancestor as its subsumer. The score of every candidate in a subtree is bounded by the ancestor IC
+        | and the min IC in the subtree, the subtree is skipped when the bound can't enter the top-k.
+        """
+        (duis, candIC, nodeCand, subMin) = self._getSimilarSearchData(category=category)
+        (treeIndex, nodeIC) = self.getTreeCodeIC(category=category)
+        maxic = self._getMaxICInCategory(category=category)
+        position = np.searchsorted(duis, dui)
+        inTable = position < len(duis) and duis[position] == dui
+        if not inTable:
+            sys.stderr.write("dui %s has no IC value in category %s\n" % (dui, category))
+        icq = candIC[position] if inTable else 0
+        assigned = np.zeros(len(duis), dtype=bool)
+        if inTable:
+            assigned[position] = True
+
+        if icq <= 0:
+            # simil gives -1 for every pair
+            best = np.flatnonzero(~assigned)[0: k]
+            return [(d, -1) for d in duis[best].tolist()]
+
+        ancestors = set([0])
+        for node in treeIndex.ownerNodes.get(dui, []):
+            while node > 0:
+                ancestors.add(node)
+                node = treeIndex.parent[node]
+        ancestors = sorted(ancestors, key=lambda node: (-nodeIC[node], -treeIndex.depth[node]))
+        ic1 = icq / float(maxic)
+        icRing = np.array([nodeIC[node] for node in ancestors])
+        bounds = self._ICScore(ic1=ic1, ic2=subMin[ancestors] / float(maxic), ictmp=icRing / maxic, maxic=maxic, method=method)
+        # the subtree without a candidate of positive IC can only give -1
+        bounds = np.where(np.isinf(subMin[ancestors]), -1, bounds)
+        remain = np.maximum.accumulate(bounds[::-1])[::-1]
+
+        bestCand = np.zeros(0, dtype=np.int64)
+        bestScore = np.zeros(0)
+        threshold = -np.inf
+        for i, node in enumerate(ancestors):
+            if remain[i] < threshold:
+                break
+            if node == 0:
+                cands = np.flatnonzero(~assigned)
+            else:
+                cands = nodeCand[node: treeIndex.subtreeEnd[node]]
+                cands = np.unique(cands[cands >= 0])
+                cands = cands[~assigned[cands]]
+            assigned[cands] = True
+            if bounds[i] < threshold or cands.size == 0:
+                continue
+            ic2 = candIC[cands] / float(maxic)
+            scores = self._ICScore(ic1=ic1, ic2=ic2, ictmp=icRing[i] / maxic, maxic=maxic, method=method)
+            scores = np.where(ic2 <= 0, -1, scores)
+            bestCand = np.concatenate([bestCand, cands])
+            bestScore = np.concatenate([bestScore, scores])
+            order = np.lexsort((bestCand, -bestScore))[0: k]
+            bestCand = bestCand[order]
+            bestScore = bestScore[order]
+            if len(bestCand) >= k:
+                threshold = bestScore[-1]
+        return list(zip(duis[bestCand].tolist(), bestScore.tolist()))
+
+    def _mostSimilarWang(self, dui=None, category=None, k=None):
+        """Top-k search for the "wang" measure.
+
+        | A candidate has a score above 0 only if it shares an ancestor with the query,
+        | so only the descendants of the query root ancestors are scored, the others are 0.
+        """
+        (duis, candIC, nodeCand, subMin) = self._getSimilarSearchData(category=category)
+        graph = self.getMeSHGraph(category=category)
+        node = graph.getID(dui=dui)
+        related = set()
+        if node is not None:
+            for anc in graph.ancestors(node=node):
+                if graph.parents(node=anc).size == 0:
+                    related.update(graph.ids[graph.descendants(node=anc)].tolist())
+        related.discard(dui)
+        related = sorted(related.intersection(duis.tolist()))
+        scores = []
+        if len(related) > 0:
+            scores = self.calPathSimilarityMatrix(duis1=[dui], duis2=related, category=category)[0]
+        result = sorted(zip(related, scores), key=lambda item: (-item[1], item[0]))[0: k]
+        if len(result) < k:
+            # pad with the candidates which share nothing with the query
+            others = [d for d in duis.tolist() if d != dui and d not in set(related)]
+            result = result + [(d, 0.0) for d in others[0: k - len(result)]]
+        return [(d, float(score)) for (d, score) in result]
+
+    def mostSimilar(self, dui=None, category=None, method=None, k=10):
+        """Get the k main headings most similar to one MeSH ID in one category.
+
+        | The result is exact, the same as calling termSim with every main heading in the category,
+        | but the branches of the MeSH tree which can't enter the top-k are skipped.
+        | The query itself is not in the result, ties are ordered by MeSH ID.
+
+        **parameter**
+
+        dui: String
+            MeSH ID, limit to main headings.
+
+        category: String
+            A MeSH category.
+            One of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z').
+            It can't be None.
+
+        method: String
+            One value in ["lin", "res", "jiang", "rel", "wang"].
+
+        k: int
+            number of result, default is 10.
+
+        **return**
+
+        list of tuple (MeSH ID, score), in descending order of score.
+        """
+        if method not in ["lin", "res", "jiang", "rel", "wang"]:
+            sys.stderr.write("program has no method %s\n" % method)
+            exit(1)
+
+        if category is None:
+            sys.stderr.write("category can't be None\n")
+            exit(1)
+
+        if not self.checkDui(dui=dui):
+            sys.stderr.write("invalid MeSH ID in dui\n")
+            exit(1)
+
+        if dui.startswith("C"):
+            sys.stderr.write("narrow concept can't as inpput\n")
+            exit(1)
+
+        if k is None or k <= 0:
+            return []
+
+        if method == "wang":
+            return self._mostSimilarWang(dui=dui, category=category, k=k)
+        return self._mostSimilarIC(dui=dui, category=category, method=method, k=k)
+
 class metamapFilter(MetaMap, pathMethod):
     """This class inherits from MetaMap and pathMethod."""
 
@@ -89,6 +311,10 @@ class metamapFilter(MetaMap, pathMethod):
     def discardAncestor(self, concepts=None):
         """Discard the ancestor concept in one parse result.
 
+        | A concept is discarded if it is an ancestor of another concept of the result in one of its category.
+        | The ancestor bitsets of each category are precomputed, so the cost does not depend on the depth.
+        | The first concept of each MeSH ID is kept, in the order of concepts.
+
         **parameter**
 
         concepts: list
@@ -113,21 +339,20 @@ class metamapFilter(MetaMap, pathMethod):
         if len(mesh_dict) == 0:
             return concepts
 
-        all_meshid = mesh_dict.keys()
-        for key in all_meshid:
-            cates = self.getCategory(dui=key)
-            ances_list = []
-            for cate in cates:
-                ancestors = self.getAncestors(dui="D000544", category=cate)
-                ances_list = ances_list + ancestors
-            if key in ances_list:
-                ances_list.remove(key)
-            #tmp = [val for val in ances_list if val in all_meshid]
-            all_meshid = list(set(all_meshid).difference(set(ances_list)))
-
-        new_concept = []
-        for id in all_meshid:
-            new_concept.append(mesh_dict[id])
+        # only main headings have ancestors, and a concept can only be the ancestor of a main heading
+        duis = list(mesh_dict)
+        stats = self.getNodeStatistics(duis=duis)
+        discard = set()
+        for category in stats["Category"].unique():
+            (categoryDuis, bits) = self.getAncestorBitset(category=category)
+            rows = np.searchsorted(categoryDuis, stats["MeSHID"][stats["Category"] == category].to_numpy())
+            docBits = np.zeros(bits.shape[1], dtype=np.uint64)
+            np.bitwise_or.at(docBits, rows >> 6, np.left_shift(np.uint64(1), (rows & 63).astype(np.uint64)))
+            found = np.bitwise_or.reduce(bits[rows], axis=0) & docBits
+            positions = np.flatnonzero(np.unpackbits(found.view(np.uint8), bitorder="little"))
+            discard.update(categoryDuis[positions].tolist())
+
+        new_concept = [mesh_dict[dui] for dui in duis if dui not in discard]
 
         return new_concept
 
@@ -153,24 +378,11 @@ class metamapFilter(MetaMap, pathMethod):
             sys.stderr.write("no items in concepts\n")
             exit(1)
 
-        new_concept = []
-        for con in concepts:
-
-            if con["MeSHID"] is None:
-                continue
-            dui = con["MeSHID"]
-            cates = self.getCategory(dui=dui)
-            descen_list = []
-            for cate in cates:
-                offsp = self.getDescendant(dui=dui, category=cate)
-                descen_list = descen_list + offsp
-            if dui in descen_list:
-                descen_list.remove(dui)
-            if len(descen_list) > number:
-                continue
-            else:
-                new_concept.append(con)
-
+        concepts = [con for con in concepts if con["MeSHID"] is not None]
+        # descendant counts are precomputed in MainHeadingDetailData, so all concepts are compared at once
+        counts = self.getDescendantCount(duis=[con["MeSHID"] for con in concepts])
+        keep = np.flatnonzero(counts <= number)
+        new_concept = [concepts[i] for i in keep]
         return new_concept
 
 
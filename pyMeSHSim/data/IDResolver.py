@@ -0,0 +1,164 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import sys
+
+
+class IDResolver(object):
+    """This class maps the identifiers of MeSH concepts to each other.
+
+    | The maps are built once from MainHeadingDetailData, supplementMainHeading and RNDetailData,
+    | every lookup is a dict lookup, and a list of identifiers is resolved in one call.
+    | Identifier types are "cui" (UMLS ID), "dui" (MeSH ID), "treeCode" and "name" (preferred name).
+
+    **parameter**
+
+    MHData: DataFrame
+        MainHeadingDetailData, it has columns "MeSHID", "UMLSID", "Tree_Code", "Preferred_Name".
+
+    supplementData: DataFrame
+        supplementMainHeading, it has columns "MeSHID", "UMLSID".
+
+    RNData: DataFrame
+        RNDetailData, it has columns "MeSHID", "UMLSID", "Preferred_Name".
+
+    **attribute**
+
+    cuiToDui: dict
+        | UMLS ID to MeSH ID.
+        | A UMLS ID is searched in MainHeadingDetailData, RNDetailData, then supplementMainHeading,
+        | the same order as duiFunc.getMeSHIDbyUMLSID.
+
+    duiToCui: dict
+        MeSH ID to its preferred UMLS ID.
+
+    duiToTreeCodes: dict
+        MeSH ID of main heading to the list of its tree codes.
+
+    treeCodeToDui: dict
+        tree code to MeSH ID.
+
+    duiToName: dict
+        MeSH ID to preferred name.
+
+    nameToDuis: dict
+        lower case preferred name to the list of MeSH ID.
+    """
+
+    types = ("cui", "dui", "treeCode", "name")
+
+    def __init__(self, MHData=None, supplementData=None, RNData=None):
+        self.cuiToDui = {}
+        # the first table has the highest priority, the smallest MeSH ID is kept in one table
+        for df in [MHData, RNData, supplementData]:
+            pairs = df[["UMLSID", "MeSHID"]].drop_duplicates().sort_values(["UMLSID", "MeSHID"], ascending=False)
+            tableMap = dict(zip(pairs["UMLSID"], pairs["MeSHID"]))
+            tableMap.update(self.cuiToDui)
+            self.cuiToDui = tableMap
+
+        self.duiToCui = {}
+        self.duiToName = {}
+        for df in [RNData, MHData]:
+            pairs = df[["MeSHID", "UMLSID", "Preferred_Name"]].drop_duplicates("MeSHID")
+            self.duiToCui.update(zip(pairs["MeSHID"], pairs["UMLSID"]))
+            self.duiToName.update(zip(pairs["MeSHID"], pairs["Preferred_Name"]))
+
+        self.duiToTreeCodes = {}
+        self.treeCodeToDui = {}
+        for (dui, code) in zip(MHData["MeSHID"], MHData["Tree_Code"]):
+            codes = self.duiToTreeCodes.setdefault(dui, [])
+            if code not in codes:
+                codes.append(code)
+            self.treeCodeToDui[code] = dui
+
+        self.nameToDuis = {}
+        for (dui, name) in self.duiToName.items():
+            self.nameToDuis.setdefault(str(name).lower(), []).append(dui)
+
+    def toDui(self, value=None, source=None):
+        """Get the MeSH ID of one identifier.
+
+        **return**
+
+        None, string, or list of string for source "name".
+        """
+        if source == "dui":
+            if value in self.duiToCui:
+                return value
+            return None
+        if source == "cui":
+            return self.cuiToDui.get(value)
+        if source == "treeCode":
+            return self.treeCodeToDui.get(value)
+        if source == "name":
+            return self.nameToDuis.get(str(value).lower())
+        sys.stderr.write("identifier type %s not in %s\n" % (source, str(self.types)))
+        exit(1)
+
+    def fromDui(self, dui=None, target=None):
+        """Get one type of identifier of a MeSH ID.
+
+        **return**
+
+        None, string, or list of string for target "treeCode".
+        """
+        if target == "dui":
+            if dui in self.duiToCui:
+                return dui
+            return None
+        if target == "cui":
+            return self.duiToCui.get(dui)
+        if target == "treeCode":
+            return self.duiToTreeCodes.get(dui)
+        if target == "name":
+            return self.duiToName.get(dui)
+        sys.stderr.write("identifier type %s not in %s\n" % (target, str(self.types)))
+        exit(1)
+
+    def resolve(self, value=None, source=None, target=None):
+        """Map one identifier to another type, through its MeSH ID.
+
+        **parameter**
+
+        value: String
+            the identifier.
+
+        source: String
+            type of value, one of the value in ("cui", "dui", "treeCode", "name").
+
+        target: String
+            type of the result, one of the value in ("cui", "dui", "treeCode", "name").
+
+        **return**
+
+        None or string, a list if target is "treeCode", or source is "name" and the name has more than one concept.
+        """
+        dui = self.toDui(value=value, source=source)
+        if dui is None:
+            return None
+        if isinstance(dui, list):
+            results = [self.fromDui(dui=item, target=target) for item in dui]
+            if len(results) == 1:
+                return results[0]
+            return results
+        return self.fromDui(dui=dui, target=target)
+
+    def resolveBatch(self, values=None, source=None, target=None):
+        """Map a list of identifiers to another type.
+
+        | Each unique identifier is resolved only once.
+
+        **return**
+
+        list, in the same order as values, None for the identifier not in the data.
+        """
+        for idType in [source, target]:
+            if idType not in self.types:
+                sys.stderr.write("identifier type %s not in %s\n" % (idType, str(self.types)))
+                exit(1)
+        resolved = {}
+        for value in values:
+            if value not in resolved:
+                resolved[value] = self.resolve(value=value, source=source, target=target)
+        return [resolved[value] for value in values]
@@ -10,10 +10,13 @@
 import sys
 from .dataDB import dataDB
 import pandas as pd
-import bcolz as bz
+from .storage import writeTable
+from .dataStore import dataStore
+from .treeStatistics import nodeStatistics
 import os
+import shutil
 import logging
-import copy
+from concurrent.futures import ThreadPoolExecutor
 import re
 
 
@@ -22,10 +25,17 @@ class getCuiFunc(object):
 
     | This is the base class of createBcolzData.
     | It provides interface to get MeSH information from UMLS Metathesaurus.
+
+    **parameter**
+
+    DBclient: dataDB object or None
+        | the UMLS database, eg. dataDB(connection=sqlite3.connect("umls.db")).
+        | default None, connect to the UMLS MySQL database given by the PYMESHSIM_DB_* environment variables,
+        | see dataDB.
     """
 
-    def __init__(self):
-        self.DBclient = dataDB()
+    def __init__(self, DBclient=None):
+        self.DBclient = DBclient if DBclient is not None else dataDB()
 
     def getSemanticType(self, cui=None):
         """Get the semantic type of a UMLS concept.
@@ -213,6 +223,186 @@ class getCuiFunc(object):
         return result[0]
 
 
+def runStages(DBclient=None, stages=None):
+    """Run the build stages, in parallel threads if the database has more than one connection.
+
+    **parameter**
+
+    DBclient: dataDB object
+
+    stages: list of function
+        each function queries the database with its own connection.
+    """
+    if getattr(DBclient, "poolSize", 1) <= 1 or len(stages) <= 1:
+        for stage in stages:
+            stage()
+        return
+    with ThreadPoolExecutor(max_workers=min(DBclient.poolSize, len(stages))) as executor:
+        for future in [executor.submit(stage) for stage in stages]:
+            future.result()
+
+
+class umlsMaps(object):
+    """Hash maps of the MeSH information in UMLS Metathesaurus, loaded by a few set-based queries.
+
+    | getCuiFunc runs one or more queries for each concept, it is too slow to build the tables.
+    | The MN and TH attributes of MRSAT are loaded once,
+    | the preferred names and semantic types are loaded for a set of concepts in chunks, see prefetch.
+    | The methods have the same names and results as getCuiFunc.
+
+    **parameter**
+
+    DBclient: dataDB object
+
+    chunkSize: int
+        number of concepts in one query of prefetch.
+
+    **attribute**
+
+    cuiDui: dict
+        UMLS concept to MeSH ID, from MN attribute.
+
+    cuiTreeCodes: dict
+        UMLS concept to list of tree code.
+
+    duiCui: dict
+        MeSH ID to UMLS concept, from MN attribute.
+
+    cuiTH: dict
+        UMLS concept to MeSH ID or SCR ID, from TH attribute.
+
+    thCuis: dict
+        MeSH ID or SCR ID to list of UMLS concept, from TH attribute.
+
+    cuiName, cuiSemanticType: dict
+        UMLS concept to preferred name and semantic type abbreviation, only the prefetched concepts.
+    """
+
+    def __init__(self, DBclient=None, chunkSize=1000):
+        self.DBclient = DBclient
+        self.chunkSize = chunkSize
+        self._initMaps()
+        sys.stderr.write("loading the MN and TH attributes of MRSAT\n")
+        # the rows are streamed into the maps, the two queries run in parallel if the pool has two connections
+        runStages(DBclient=self.DBclient, stages=[
+            lambda: self._addMN(rows=self.DBclient.iterate(
+                sql_cmd="select distinct CUI, CODE, ATV from MRSAT where ATN = 'MN';")),
+            lambda: self._addTH(rows=self.DBclient.iterate(
+                sql_cmd="select distinct CUI, CODE from MRSAT where ATN = 'TH';"))])
+
+    def _initMaps(self):
+        self.cuiDui = {}
+        self.cuiTreeCodes = {}
+        self.duiCui = {}
+        self.cuiTH = {}
+        self.thCuis = {}
+        self.cuiName = {}
+        self.cuiSemanticType = {}
+
+    def _addMN(self, rows=None):
+        """Add the rows (CUI, CODE, ATV) of MN attribute."""
+        for (cui, code, treeCode) in rows:
+            self.cuiDui.setdefault(cui, code)
+            self.duiCui.setdefault(code, cui)
+            codes = self.cuiTreeCodes.setdefault(cui, [])
+            if treeCode not in codes:
+                codes.append(treeCode)
+
+    def _addTH(self, rows=None):
+        """Add the rows (CUI, CODE) of TH attribute, the repeated rows are skipped."""
+        for (cui, code) in rows:
+            self.cuiTH.setdefault(cui, code)
+            cuis = self.thCuis.setdefault(code, [])
+            if cui not in cuis:
+                cuis.append(cui)
+
+    def getRelation(self, rel="PAR"):
+        """Get the distinct concept pairs of a relation in MRREL.
+
+        **return**
+
+        list of tuple (CUI1, CUI2)
+        """
+        return list(self.iterRelation(rel=rel))
+
+    def iterRelation(self, rel="PAR"):
+        """Read the distinct concept pairs of a relation in MRREL in batches.
+
+        **return**
+
+        generator of tuple (CUI1, CUI2)
+        """
+        sql_str = "select distinct CUI1,CUI2 from MRREL where REL='%s'" % (rel)
+        return self.DBclient.iterate(sql_cmd=sql_str)
+
+    def prefetch(self, cuis=None):
+        """Load the preferred names and semantic types of UMLS concepts, the loaded concepts are skipped.
+
+        **parameter**
+
+        cuis: iterable of string
+        """
+        cuis = sorted(set(cui for cui in cuis if cui is not None and cui not in self.cuiName))
+        sys.stderr.write("loading the names and semantic types of %s concepts\n" % len(cuis))
+        inStrings = [",".join("'%s'" % cui for cui in cuis[start: start + self.chunkSize])
+                     for start in range(0, len(cuis), self.chunkSize)]
+
+        def loadNames():
+            for inString in inStrings:
+                sqlcmd = "select distinct CUI, STR from MRCONSO where TS = 'P' and CUI in (%s);" % inString
+                for (cui, name) in self.DBclient.fetch_all(sql_cmd=sqlcmd):
+                    self.cuiName.setdefault(cui, name)
+
+        def loadSemanticTypes():
+            for inString in inStrings:
+                sqlcmd = "select distinct MRSTY.CUI, SRDEF.ABR from MRSTY join SRDEF on MRSTY.TUI = SRDEF.UI " \
+                         "where MRSTY.CUI in (%s);" % inString
+                for (cui, abbr) in self.DBclient.fetch_all(sql_cmd=sqlcmd):
+                    self.cuiSemanticType.setdefault(cui, abbr)
+
+        runStages(DBclient=self.DBclient, stages=[loadNames, loadSemanticTypes])
+
+    def getMeSHID(self, cui=None):
+        """Get the MeSH ID of the preferred concept CUI, None if it has no MN attribute."""
+        return self.cuiDui.get(cui)
+
+    def getMeSHIDFromTH(self, cui=None):
+        """Get the MeSH descriptor ID or SCR ID from TH attribute."""
+        return self.cuiTH.get(cui)
+
+    def getCUIfromMeshID(self, dui=None):
+        """Get the preferred UMLS concept of a MeSH ID."""
+        return self.duiCui.get(dui)
+
+    def getTreeCode(self, cui=None, dui=None):
+        """Get the tree codes of a UMLS concept or a MeSH concept, list of string."""
+        if cui is None:
+            cui = self.getCUIfromMeshID(dui=dui)
+        return list(self.cuiTreeCodes.get(cui, []))
+
+    def getPreferredName(self, cui=None):
+        """Get the preferred name of a prefetched UMLS concept."""
+        return self.cuiName.get(cui)
+
+    def getSemanticType(self, cui=None):
+        """Get the semantic type abbreviation of a prefetched UMLS concept."""
+        return self.cuiSemanticType.get(cui)
+
+    def getCodeForNoneTreeConcept(self, cui=None):
+        """Get the MeSH ID, or the SCR ID if the concept has no MN attribute."""
+        MeSHID = self.getMeSHID(cui=cui)
+        if MeSHID is not None:
+            return MeSHID
+        return self.getMeSHIDFromTH(cui=cui)
+
+    def getCategoryOfTreecode(self, cui=None):
+        """Get the categories of a UMLS concept, None if it has no tree code."""
+        treeCode = self.getTreeCode(cui=cui)
+        if len(treeCode) == 0:
+            return None
+        return list(set(code[0] for code in treeCode))
+
+
 class createBcolzData(getCuiFunc):
     """A class to construct the base data.
 
@@ -225,6 +415,16 @@ class createBcolzData(getCuiFunc):
     | 4. RN detail data table
     | 6. supplement main heading table
     | 7. offspring and ancestor table
+
+    **parameter**
+
+    DBclient: dataDB object or None
+        the UMLS database, see getCuiFunc.
+
+    maps: umlsMaps object or None
+        | the tables are created from these maps instead of the database,
+        | eg. pyMeSHSim.data.createDataFromRRF.rrfMaps.
+        | default None, umlsMaps is loaded from DBclient.
     """
 
     # {'cui': 'C1256745', 'semtypes': 'inpr', 'tree_code': [], 'MeSHID': None, 'preferred_name': 'Check Tag',
@@ -235,9 +435,12 @@ class createBcolzData(getCuiFunc):
     # 'preferred_name': 'MeSH Descriptors', 'isNarrowConcept': None, 'relations': None}
     # {'cui': 'C1256743', 'semtypes': 'inpr', 'tree_code': [], 'MeSHID': None,
     # 'preferred_name': 'Publication Type', 'isNarrowConcept': None, 'relations': None}
-    def __init__(self, log_file_name="createData.log"):
-        self.DBclient = dataDB()
-        getCuiFunc.__init__(self)
+    def __init__(self, log_file_name="createData.log", DBclient=None, maps=None):
+        if maps is None:
+            getCuiFunc.__init__(self, DBclient=DBclient)
+        else:
+            # the tables are created from maps, the database is not needed
+            self.DBclient = DBclient
         self.categoryDict = {"C0002784": "E",
                              "C0002807": "A",
                              "C0003186": "I",
@@ -255,6 +458,18 @@ class createBcolzData(getCuiFunc):
                              "C2720181": "Z"
                              }
         self.logger = None
+        self.maps = maps
+
+    def getUMLSMaps(self):
+        """Get the hash maps of UMLS, they are loaded on first use and shared by the create functions.
+
+        **return**
+
+        umlsMaps object
+        """
+        if self.maps is None:
+            self.maps = umlsMaps(DBclient=self.DBclient)
+        return self.maps
 
     @staticmethod
     def initLog(log_file_name=None):
@@ -284,28 +499,34 @@ class createBcolzData(getCuiFunc):
         """
         self.logger = self.initLog(log_file_name="createParentChildRel.log")
         sys.stderr.write("Running the create parents function\n")
-        sql_str = "select distinct CUI1,CUI2 from MRREL where REL='%s'" % (rel)
-        result = self.DBclient.fetch_all(sql_cmd=sql_str)
-
-        sys.stderr.write("We selected %s items from umls database\n" % len(result))
+        maps = self.getUMLSMaps()
+        # the relation is read twice instead of being held in memory,
+        # first for the names, which are only needed by the concepts without MeSH id
+        noDuiCuis = set()
+        count = 0
+        for item in maps.iterRelation(rel=rel):
+            count = count + 1
+            noDuiCuis.update(cui for cui in item if maps.getMeSHID(cui=cui) is None)
+        sys.stderr.write("We selected %s items from umls database\n" % count)
+        maps.prefetch(cuis=noDuiCuis)
         handle = open("ParentChildRel.tsv", "w")
         handle.write("Child\tParent\tCategory\n")
         handle_top = open("topDescription.tsv", "w")
-        for item in result:
+        for item in maps.iterRelation(rel=rel):
             cui1 = item[0]
             cui2 = item[1]
 
             # Log the cuis which has no dui, most of them are "MeSH Category" concept
-            Dui1 = self.getMeSHID(cui=cui1)
+            Dui1 = maps.getMeSHID(cui=cui1)
             if Dui1 is None:
-                pName1 = self.getPreferredName(cui=cui1)
+                pName1 = maps.getPreferredName(cui=cui1)
                 self.logger.warning("The child cui %s, %s has no MeSH id\n" % (cui1, pName1))
 
-            Dui2 = self.getMeSHID(cui=cui2)
+            Dui2 = maps.getMeSHID(cui=cui2)
             if Dui2 is None:
-                pName2 = self.getPreferredName(cui=cui2)
+                pName2 = maps.getPreferredName(cui=cui2)
                 if Dui1 is not None:
-                    catAbbr = self.getCategoryOfTreecode(cui=cui1)
+                    catAbbr = maps.getCategoryOfTreecode(cui=cui1)
                     if len(catAbbr) > 1:
                         cateString = ",".join(catAbbr)
                     else:
@@ -316,10 +537,8 @@ class createBcolzData(getCuiFunc):
 
             # These are some supplymentals items, we do not save them, so pass
             if Dui1 is None and Dui2 is not None:
-                pName1 = self.getPreferredName(cui=cui1)
-                pName2 = self.getPreferredName(cui=cui2)
                 # sys.stderr.write(
-                #     "cui1 %s, %s has no dui, but cui2 %s, %s has dui %s\n" % (cui1, pName1, cui2, pName2, Dui2))
+                #     "cui1 %s has no dui, but cui2 %s has dui %s\n" % (cui1, cui2, Dui2))
                 continue
 
             """
@@ -340,8 +559,8 @@ class createBcolzData(getCuiFunc):
                 #sys.stderr.write("Dui2 %s start with Q\n" % Dui2)
                 continue
 
-            treeCode1 = self.getTreeCode(cui=cui1)
-            treeCode2 = self.getTreeCode(cui=cui2)
+            treeCode1 = maps.getTreeCode(cui=cui1)
+            treeCode2 = maps.getTreeCode(cui=cui2)
 
             if len(treeCode1) == 0:
                 # this msg will not print out, it means all dui1 has tree code
@@ -514,8 +733,8 @@ class createBcolzData(getCuiFunc):
         """
         self.logger = self.initLog(log_file_name="createRNandRBRelTable.log")
         sys.stderr.write("running the createRNandRBRelTable function\n")
-        sql_str = "select distinct CUI1, CUI2 from MRREL where REL='%s'" % ("RN")
-        result = self.DBclient.fetch_all(sql_cmd=sql_str)
+        maps = self.getUMLSMaps()
+        count = 0
         # RNtoRB is majority file
         handle = open("RNandRBRel.tsv", "w")
         handle.write("RNconcept\tRBconcept\tCategory\n")
@@ -523,15 +742,16 @@ class createBcolzData(getCuiFunc):
         handle_2 = open("RBtoRN.tsv", "w")
         handle_2.write("RNconcept\tRBconcept\n")
 
-        for line in result:
+        for line in maps.iterRelation(rel="RN"):
+            count = count + 1
             cui1 = line[0]
             cui2 = line[1]
-            dui1 = self.getMeSHID(cui=cui1)
-            dui2 = self.getMeSHID(cui=cui2)
+            dui1 = maps.getMeSHID(cui=cui1)
+            dui2 = maps.getMeSHID(cui=cui2)
 
             if dui1 is None and dui2 is None:
-                srcDui1 = self.getCodeForNoneTreeConcept(cui=cui1)
-                srcDui2 = self.getCodeForNoneTreeConcept(cui=cui2)
+                srcDui1 = maps.getCodeForNoneTreeConcept(cui=cui1)
+                srcDui2 = maps.getCodeForNoneTreeConcept(cui=cui2)
                 # if cui1 and cui2 has no MN attribute, interesting all srcDui start with "C"
                 # and in this situation, almost all srcDui1 == srcDui2, only 7 exceptions
                 self.logger.warning("cui1 %s and cui2 %s both has no dui, (%s, %s)\n" % (cui1, cui2, srcDui1, srcDui2))
@@ -544,7 +764,7 @@ class createBcolzData(getCuiFunc):
 
             if dui1 is not None and dui2 is None:
                 #in this situation, we can get many cui2 concept start with "D"
-                code2 = self.getCodeForNoneTreeConcept(cui=cui2)
+                code2 = maps.getCodeForNoneTreeConcept(cui=cui2)
                 if code2 is None:
                     #qualifierID = self.getQualifierID(cui=cui2)
                     #sys.stderr.write("the narrow concept cui2 %s has no MeSH id, qualifier: %s\n" % (cui2, qualifierID))
@@ -555,7 +775,7 @@ class createBcolzData(getCuiFunc):
                     #some mesh qualifier has no MN attribute, but has TH attribute
                     continue
 
-                category = self.getCategoryOfTreecode(cui=cui1)
+                category = maps.getCategoryOfTreecode(cui=cui1)
                 if category is None:
                     sys.stderr.write("dui1 %s has no tree code\n" % dui1)
                     exit(1)
@@ -565,14 +785,14 @@ class createBcolzData(getCuiFunc):
 
             #thi is a very small case, mainly dui1 == dui2, and we do not need this pair
             if dui1 is None and dui2 is not None:
-                code1 = self.getCodeForNoneTreeConcept(cui=cui1)
+                code1 = maps.getCodeForNoneTreeConcept(cui=cui1)
                 if code1 is None:
                     continue
                 handle_2.write("%s\t%s\n" % (dui2, code1))
 
         handle.close()
         handle_2.close()
-        sys.stderr.write("We selected %s items from mysql database" % len(result))
+        sys.stderr.write("We selected %s items from mysql database" % count)
         sys.stderr.write("Done the create RNtoRB function\n")
         return
 
@@ -611,26 +831,17 @@ class createBcolzData(getCuiFunc):
         meshID = list(set(meshID))
         supHandle = open("supplementMainHeading.tsv", "w")
         supHandle.write("MeSHID\tUMLSID\n")
-
-        sql_cmd = "select distinct CUI,CODE from MRSAT where ATN='TH';"
-        result = self.DBclient.fetch_all(sql_cmd=sql_cmd)
-        duiDict = {}
-        for line in result:
-            cui = line[0]
-            dui = line[1]
-            if dui in duiDict:
-                duiDict[dui].append(cui)
-            else:
-                duiDict[dui] = [cui]
+        duiDict = self.getUMLSMaps().thCuis
 
         for mesh in meshID:
             dui = mesh
-            cuis = duiDict[dui]
+            cuis = duiDict.get(dui)
             if cuis is None:
                 sys.stderr.write("something wrong!!!!\n")
                 exit(1)
             for cui in cuis:
                 supHandle.write("%s\t%s\n" % (mesh, cui))
+        supHandle.close()
         sys.stderr.write("Done the create supplement Main Heading detail data function\n")
         return
 
@@ -678,20 +889,22 @@ class createBcolzData(getCuiFunc):
         meshID = list(df1["Child"]) + list(df1["Parent"])
         # unique mesh id
         meshID = list(set(meshID))
+        maps = self.getUMLSMaps()
+        maps.prefetch(cuis=[maps.getCUIfromMeshID(dui=mesh) if mesh[0] == "D" else mesh for mesh in meshID])
 
         handle_Total = open("MainHeadingDetailData.tsv", "w")
         handle_Total.write("MeSHID\tUMLSID\tTree_Code\tPreferred_Name\tCategory\tFrequence\tSemantic_Type\n")
         for mesh in meshID:
             if mesh[0] == "D":
                 dui = mesh
-                cui = self.getCUIfromMeshID(dui=mesh)
-                treeCode = self.getTreeCode(cui=cui)
+                cui = maps.getCUIfromMeshID(dui=mesh)
+                treeCode = maps.getTreeCode(cui=cui)
                 if len(treeCode) == 0:
                     print (mesh)
                     print ("treeCode is err")
                     exit(1)
-                preferredName = self.getPreferredName(cui=cui)
-                category = self.getCategoryOfTreecode(cui=cui)
+                preferredName = maps.getPreferredName(cui=cui)
+                category = maps.getCategoryOfTreecode(cui=cui)
                 if category is None:
                     print ("category is wrong!")
                     exit(1)
@@ -699,18 +912,18 @@ class createBcolzData(getCuiFunc):
                     Frequence = ICdict[dui]
                 else:
                     Frequence = 0
-                semtypes = self.getSemanticType(cui=cui)
+                semtypes = maps.getSemanticType(cui=cui)
             else:
                 #now no cui in parentAndChildRel table
                 dui = ""
                 cui = mesh
-                treeCode = self.getTreeCode(cui=cui)
+                treeCode = maps.getTreeCode(cui=cui)
                 if len(treeCode) == 0:
                     treeCode = ""
                     print ("the cui %s tree code is None" % cui)
                     continue
-                preferredName = self.getPreferredName(cui=cui)
-                category = self.getCategoryOfTreecode(cui=cui)
+                preferredName = maps.getPreferredName(cui=cui)
+                category = maps.getCategoryOfTreecode(cui=cui)
                 if category is None:
                     if cui in self.categoryDict:
                         category = self.categoryDict[cui]
@@ -721,7 +934,7 @@ class createBcolzData(getCuiFunc):
                     Frequence = ICdict[cui]
                 else:
                     Frequence = 0
-                semtypes = self.getSemanticType(cui=cui)
+                semtypes = maps.getSemanticType(cui=cui)
             # write data
             if len(treeCode) > 1:
                 for tc in treeCode:
@@ -756,26 +969,18 @@ class createBcolzData(getCuiFunc):
         handle_RN = open("RNDetailData.tsv", "w")
         handle_RN.write("MeSHID\tUMLSID\tPreferred_Name\tSemantic_Type\n")
         #sql_cmd = "select distinct CUI,CODE from MRSAT where STYPE='SDUI';"
-
-        sql_cmd = "select distinct CUI,CODE from MRSAT where ATN='TH';"
-        result = self.DBclient.fetch_all(sql_cmd=sql_cmd)
-        duiDict = {}
-        for line in result:
-            cui = line[0]
-            dui = line[1]
-            if dui in duiDict:
-                duiDict[dui].append(cui)
-            else:
-                duiDict[dui] = [cui]
+        maps = self.getUMLSMaps()
+        duiDict = maps.thCuis
+        maps.prefetch(cuis=[cui for SDUI in SDUIList for cui in duiDict.get(SDUI, [])])
 
         for SDUI in SDUIList:
-            cuis = duiDict[SDUI]
+            cuis = duiDict.get(SDUI)
             if cuis is None:
                 sys.stderr.write("something wrong!!!!\n")
                 exit(1)
             for Cui in cuis:
-                preferredName = self.getPreferredName(cui=Cui)
-                semtypes = self.getSemanticType(cui=Cui)
+                preferredName = maps.getPreferredName(cui=Cui)
+                semtypes = maps.getSemanticType(cui=Cui)
                 handle_RN.write("%s\t%s\t%s\t%s\n" % (SDUI, Cui, preferredName, semtypes))
         # handle_Total.close()
         handle_RN.close()
@@ -792,48 +997,28 @@ class createBcolzData(getCuiFunc):
         inputFile = "ParentChildRel.tsv"
         df1 = pd.read_table(inputFile, header="infer", sep="\t")
 
-        #construct parents dict
-        parentsDict = {}
-        for index, row in df1.iterrows():
-            if row["Category"] in parentsDict:
-                if row["Child"] in parentsDict[row["Category"]]:
-                    parentsDict[row["Category"]][row["Child"]] += [(row["Parent"])]
-                else:
-                    parentsDict[row["Category"]][row["Child"]] = [(row["Parent"])]
-            else:
-                parentsDict[row["Category"]] = {}
-                parentsDict[row["Category"]][row["Child"]] = [(row["Parent"])]
-
-
-        outputFile = "offspringAndAncestorRel.tsv"
-        handle = open(outputFile, "w")
-        handle.write("Offspring\tAncestor\tCategory\n")
-        for index, row in df1.iterrows():
-            category = row["Category"]
-            child = row["Child"]
-            parents = parentsDict[category][child]
-            contmp = list(copy.deepcopy(parents))
-            searchedcon = []
-            while contmp:
-                interCon = []
-                for con in contmp:
-                    if con in searchedcon:
-                        continue
-                    searchedcon.append(con)
-                    if con in parentsDict[category]:
-                        parent = parentsDict[category][con]
-                    else:
-                        parent = None
-                    if parent is not None:
-                        interCon = interCon + parent
-                contmp = list(set(interCon))
-            for ances in searchedcon:
-                handle.write("%s\t%s\t%s\n" % (child, ances, category))
+        df6 = offspringAndAncestorTable(parentChild=df1)
+        df6.to_csv("offspringAndAncestorRel.tsv", sep="\t", index=False)
         sys.stderr.write("Done create offspring and ancestor rel table\n")
         return
 
-    def constructBcolz(self):
-        """This funtion will convert above tables in bcolz format."""
+    def constructBcolz(self, storage="bcolz", dataPath="/home/luozhihui/PycharmProjects/pyMeSHSim/pyMeSHSim/data/testData"):
+        """This funtion will convert above tables in bcolz format.
+
+        **parameter**
+
+        storage: String
+            | One of the value in ("bcolz", "npy").
+            | "npy" writes memory-mapped columns instead, see pyMeSHSim.data.storage.
+            | default: "bcolz".
+
+        dataPath: String
+            the directory of the tables.
+
+        **see also**
+
+        writeTables
+        """
 
         sys.stderr.write("Running the construct Bcolz function\n")
         file1 = "ParentChildRel.tsv"
@@ -842,86 +1027,151 @@ class createBcolzData(getCuiFunc):
         file4 = "RNDetailData.tsv"
         file5 = "supplementMainHeading.tsv"
         file6 = "offspringAndAncestorRel.tsv"
-        dataPath = "/home/luozhihui/PycharmProjects/pyMeSHSim/pyMeSHSim/data/testData"
-
-        # file 1 process ParentChildRel.tsv
-        df1 = pd.read_table(file1, header="infer", sep="\t")
-        df1.sort_values(["Category", "Child"], inplace=True)
-        df1 = df1.reset_index(drop=True)
-
-        categotyDict = {}
-        for C in set(df1["Category"]):
-            dftmp = df1[df1["Category"] == C]
-            start = min(dftmp.index)
-            end = max(dftmp.index)
-            categotyDict[C] = (start, end)
-        bz1 = bz.ctable.fromdataframe(df1, rootdir=os.path.join(dataPath, "ParentChildRel"), mode="w")
-        bz1.attrs["myattr"] = categotyDict
-        bz1.flush()
-
-        # file 2 process RNandRBRel.tsv
-        df2 = pd.read_table(file2, header="infer", sep="\t")
-        df2.sort_values(["Category", "RNconcept"], inplace=True)
-        df2 = df2.reset_index(drop=True)
-
-        categotyDict = {}
-        for C in set(df2["Category"]):
-            dftmp = df2[df2["Category"] == C]
-            start = min(dftmp.index)
-            end = max(dftmp.index)
-            categotyDict[C] = (start, end)
-        bz2 = bz.ctable.fromdataframe(df2, rootdir=os.path.join(dataPath, "RNandRBRel"), mode="w")
-        bz2.attrs["myattr"] = categotyDict
-        bz2.flush()
-
-        # file 3 process MainHeadingDetailData.tsv
-        df3 = pd.read_table(file3, header="infer", sep="\t")
-        df3.sort_values(["Category", "MeSHID"], inplace=True)
-        df3 = df3.reset_index(drop=True)
-        categotyDict = {}
-        for C in set(df3["Category"]):
-            dftmp = df3[df3["Category"] == C]
-            start = min(dftmp.index)
-            end = max(dftmp.index)
-            categotyDict[C] = (start, end)
-
-            # set disease category semantic type
-            if C == "C":
-                semanticTypes = list(set(dftmp["Semantic_Type"]))
-
-        bz3 = bz.ctable.fromdataframe(df3, rootdir=os.path.join(dataPath, "MainHeadingDetailData"), mode="w")
-        bz3.attrs["myattr"] = categotyDict
-        bz3.attrs["DiseaseCategoryST"] = semanticTypes
-        # print (semanticTypes)
-        bz3.attrs["allCategory"] = self.parseParentChildLog()
-        bz3.flush()
-
-        # file 4 process RNDetailData.tsv
-        # it has no Category columns, so we don't give myattr
-        df4 = pd.read_table(file4, header="infer", sep="\t")
-        bz4 = bz.ctable.fromdataframe(df4, rootdir=os.path.join(dataPath, "RNDetailData"), mode="w")
-        bz4.flush()
-
-        #file 5 process supplementMainHeading.tsv
-        df5 = pd.read_table(file5, header="infer", sep="\t")
-        bz5 = bz.ctable.fromdataframe(df5, rootdir=os.path.join(dataPath, "supplementMainHeading"), mode="w")
-        bz5.flush()
-
-        #file 6 process the offspring and ancestor relation file
-        df6 = pd.read_table(file6, header="infer", sep="\t")
-        df6.sort_values(["Category", "Offspring"], inplace=True)
-        df6 = df6.reset_index(drop=True)
-
-        #define myattr
-        categotyDict = {}
-        for C in set(df6["Category"]):
-            dftmp = df6[df6["Category"] == C]
-            start = min(dftmp.index)
-            end = max(dftmp.index)
-            categotyDict[C] = (start, end)
-        bz6 = bz.ctable.fromdataframe(df6, rootdir=os.path.join(dataPath, "offspringAndAncestorRel"), mode="w")
-        bz6.attrs["myattr"] = categotyDict
-        bz6.flush()
 
+        writeTables(parentChild=pd.read_table(file1, header="infer", sep="\t"),
+                    RNandRB=pd.read_table(file2, header="infer", sep="\t"),
+                    mainHeading=pd.read_table(file3, header="infer", sep="\t"),
+                    RNDetail=pd.read_table(file4, header="infer", sep="\t"),
+                    supplement=pd.read_table(file5, header="infer", sep="\t"),
+                    offspringAncestor=pd.read_table(file6, header="infer", sep="\t"),
+                    allCategory=self.parseParentChildLog(), dataPath=dataPath, storage=storage)
         sys.stderr.write("Done the construct bcolz function\n")
         return None
+
+
+def offspringAndAncestorTable(parentChild=None):
+    """Get the offspring and ancestor relation of main heading descriptors from the parent-child relation.
+
+    | Each child is written once for each of its parent rows, the same as createOffspringAndAncestorRel.
+
+    **parameter**
+
+    parentChild: pandas.DataFrame
+        columns "Child", "Parent", "Category".
+
+    **return**
+
+    pandas.DataFrame, columns "Offspring", "Ancestor", "Category".
+    """
+    #construct parents dict
+    parentsDict = {}
+    for (child, parent, category) in zip(parentChild["Child"], parentChild["Parent"], parentChild["Category"]):
+        parentsDict.setdefault(category, {}).setdefault(child, []).append(parent)
+
+    # the ancestors of a child are searched once
+    ancestorsDict = {}
+    rows = []
+    for (child, category) in zip(parentChild["Child"], parentChild["Category"]):
+        key = (child, category)
+        if key not in ancestorsDict:
+            contmp = list(parentsDict[category][child])
+            searchedcon = []
+            searchedset = set()
+            while contmp:
+                interCon = []
+                for con in contmp:
+                    if con in searchedset:
+                        continue
+                    searchedcon.append(con)
+                    searchedset.add(con)
+                    if con in parentsDict[category]:
+                        interCon = interCon + parentsDict[category][con]
+                contmp = list(set(interCon))
+            ancestorsDict[key] = searchedcon
+        for ances in ancestorsDict[key]:
+            rows.append((child, ances, category))
+    return pd.DataFrame(rows, columns=["Offspring", "Ancestor", "Category"])
+
+
+def _categoryRange(df=None):
+    """Get the first and last row of each category in a table sorted by category."""
+    categotyDict = {}
+    for C in set(df["Category"]):
+        index = df.index[df["Category"] == C]
+        categotyDict[C] = (min(index), max(index))
+    return categotyDict
+
+
+def _maxIDInCategory(df=None, categories=None):
+    """Get the MeSH ID of the least frequent concept in each category, the same as InformationContent._allMaxFreqDict."""
+    maxIDInCategory = {}
+    for category in categories:
+        dftmp = df if category == "all" else df[df["Category"] == category]
+        dftmp = dftmp[dftmp["Frequence"] != 0]
+        if len(dftmp) > 0:
+            maxIDInCategory[category] = dftmp.loc[dftmp["Frequence"].idxmin(), "MeSHID"]
+    return maxIDInCategory
+
+
+def writeTables(parentChild=None, RNandRB=None, mainHeading=None, RNDetail=None, supplement=None,
+                offspringAncestor=None, allCategory=None, dataPath=None, storage="bcolz"):
+    """Sort the six tables, add their attrs, and write them to dataPath.
+
+    | It is shared by the builders, createBcolzData.constructBcolz reads the tables from its tsv files.
+
+    **parameter**
+
+    parentChild, RNandRB, mainHeading, RNDetail, supplement, offspringAncestor: pandas.DataFrame
+        | the tables ParentChildRel, RNandRBRel, MainHeadingDetailData, RNDetailData, supplementMainHeading
+        | and offspringAndAncestorRel, the columns are the same as their tsv files.
+
+    allCategory: dict
+        category abbreviation to its name, eg. {"C": "Diseases"}.
+
+    dataPath: String
+        the directory of the tables.
+
+    storage: String
+        One of the value in ("bcolz", "npy").
+
+    .. note::
+        | MeSHICData of dataPath is computed from the old tables, it is removed.
+        | The IC values are then computed from the new tables on use, with maxIDInCategory written here,
+        | or run pyMeSHSim.Sim.ICScore.InformationContent.createICData to store them again.
+    """
+    if not os.path.exists(dataPath):
+        os.makedirs(dataPath)
+    ICDataPath = os.path.join(dataPath, "MeSHICData")
+    if os.path.exists(ICDataPath):
+        sys.stderr.write("removing the stale IC table %s\n" % ICDataPath)
+        shutil.rmtree(ICDataPath)
+    # file 1 process ParentChildRel.tsv
+    df1 = parentChild.sort_values(["Category", "Child"])
+    df1 = df1.reset_index(drop=True)
+    writeTable(df=df1, rootdir=os.path.join(dataPath, "ParentChildRel"), attrs={"myattr": _categoryRange(df=df1)},
+               storage=storage)
+
+    # file 2 process RNandRBRel.tsv
+    df2 = RNandRB.sort_values(["Category", "RNconcept"])
+    df2 = df2.reset_index(drop=True)
+    writeTable(df=df2, rootdir=os.path.join(dataPath, "RNandRBRel"), attrs={"myattr": _categoryRange(df=df2)},
+               storage=storage)
+
+    # file 3 process MainHeadingDetailData.tsv
+    df3 = mainHeading.sort_values(["Category", "MeSHID"])
+    df3 = df3.reset_index(drop=True)
+    # node statistics of each MeSH ID in each category, so the filter need not search the descendants
+    df3 = df3.merge(nodeStatistics(MHData=df3), on=["MeSHID", "Category"], how="left")
+    # set disease category semantic type
+    semanticTypes = list(set(df3.loc[df3["Category"] == "C", "Semantic_Type"]))
+    attrs = {"myattr": _categoryRange(df=df3), "DiseaseCategoryST": semanticTypes, "allCategory": allCategory,
+             "maxIDInCategory": _maxIDInCategory(df=df3, categories=list(allCategory) + ["all"])}
+    writeTable(df=df3, rootdir=os.path.join(dataPath, "MainHeadingDetailData"), attrs=attrs, storage=storage)
+
+    # file 4 process RNDetailData.tsv
+    # it has no Category columns, so we don't give myattr
+    writeTable(df=RNDetail, rootdir=os.path.join(dataPath, "RNDetailData"), storage=storage)
+
+    #file 5 process supplementMainHeading.tsv
+    writeTable(df=supplement, rootdir=os.path.join(dataPath, "supplementMainHeading"), storage=storage)
+
+    #file 6 process the offspring and ancestor relation file
+    df6 = offspringAncestor.sort_values(["Category", "Offspring"])
+    df6 = df6.reset_index(drop=True)
+    writeTable(df=df6, rootdir=os.path.join(dataPath, "offspringAndAncestorRel"), attrs={"myattr": _categoryRange(df=df6)},
+               storage=storage)
+
+    # the tables opened in this process are read again
+    for (path, store) in dataStore._instances.items():
+        if path is not None and os.path.realpath(path) == os.path.realpath(dataPath):
+            store.reset()
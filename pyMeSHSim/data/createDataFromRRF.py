@@ -0,0 +1,249 @@
+"""
+.. note::
+    This module is useful for developer, general user can skip this module
+    It creates the data set from the UMLS RRF files, without loading them into a database.
+
+eg.
+
+    python -m pyMeSHSim.data.createDataFromRRF /home/UMLS/2024AA/META newData --srdef /home/UMLS/2024AA/NET/SRDEF
+"""
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import argparse
+import csv
+import os
+import shutil
+import sys
+import pandas as pd
+from .createData import createBcolzData, umlsMaps
+
+# field names of the RRF files, see the UMLS Reference Manual
+# each line ends with "|", so there is an empty last field
+RRFColumns = {"MRCONSO": ["CUI", "LAT", "TS", "LUI", "STT", "SUI", "ISPREF", "AUI", "SAUI", "SCUI", "SDUI", "SAB",
+                          "TTY", "CODE", "STR", "SRL", "SUPPRESS", "CVF"],
+              "MRREL": ["CUI1", "AUI1", "STYPE1", "REL", "CUI2", "AUI2", "STYPE2", "RELA", "RUI", "SRUI", "SAB", "SL",
+                        "RG", "DIR", "SUPPRESS", "CVF"],
+              "MRSAT": ["CUI", "LUI", "SUI", "METAUI", "STYPE", "CODE", "ATUI", "SATUI", "ATN", "SAB", "ATV",
+                        "SUPPRESS", "CVF"],
+              "MRSTY": ["CUI", "TUI", "STN", "STY", "ATUI", "CVF"],
+              "SRDEF": ["RT", "UI", "STY_RL", "STN_RTN", "DEF", "EX", "UN", "NH", "ABR", "RIN"]}
+
+
+def readRRF(path=None, table=None, usecols=None, chunksize=1000000):
+    """Read a RRF file in chunks, only some columns are parsed.
+
+    **parameter**
+
+    path: String
+        the RRF file, eg. META/MRSAT.RRF.
+
+    table: String
+        the table name, one of the keys of RRFColumns.
+
+    usecols: list
+        the columns to parse.
+
+    chunksize: int
+        number of lines in one chunk.
+
+    **return**
+
+    generator of pandas.DataFrame, all columns are string.
+    """
+    names = RRFColumns[table] + ["_end"]
+    reader = pd.read_csv(path, sep="|", header=None, names=names, usecols=usecols, dtype=str,
+                         quoting=csv.QUOTE_NONE, keep_default_na=False, na_filter=False, encoding="utf-8",
+                         chunksize=chunksize)
+    for chunk in reader:
+        yield chunk
+
+
+def readSemanticTypes(path=None, chunksize=1000000):
+    """Read the abbreviations of the semantic types from the SRDEF file of the semantic network.
+
+    **return**
+
+    dict, semantic type ID to its abbreviation, eg. {"T047": "dsyn"}.
+    """
+    abbreviations = {}
+    for chunk in readRRF(path=path, table="SRDEF", usecols=["RT", "UI", "ABR"], chunksize=chunksize):
+        chunk = chunk[chunk["RT"] == "STY"]
+        abbreviations.update(zip(chunk["UI"], chunk["ABR"]))
+    return abbreviations
+
+
+class rrfMaps(umlsMaps):
+    """Hash maps of the MeSH information, read from the RRF files of UMLS Metathesaurus.
+
+    | The files are read in chunks and only the rows of MeSH (SAB=MSH) are kept,
+    | so a multi-GB file is never in memory.
+    | It is used by createBcolzData in place of umlsMaps, and creates the same tables.
+
+    **parameter**
+
+    metaPath: String
+        the META directory of UMLS, which contains MRCONSO.RRF, MRREL.RRF, MRSAT.RRF and MRSTY.RRF.
+
+    srdefPath: String or None
+        | the SRDEF file of the semantic network, it gives the semantic type abbreviations.
+        | default None, the semantic type ID is kept.
+
+    chunksize: int
+        number of lines in one chunk.
+
+    **attribute**
+
+    relations: dict
+        relation, "PAR" or "RN", to list of tuple (CUI1, CUI2).
+
+    **see also**
+
+    pyMeSHSim.data.createData.umlsMaps
+    """
+
+    def __init__(self, metaPath=None, srdefPath=None, chunksize=1000000):
+        self.metaPath = metaPath
+        self.chunksize = chunksize
+        self._initMaps()
+        self._readMRSAT()
+        self._readMRREL()
+        self._readMRCONSO()
+        self._readMRSTY(srdefPath=srdefPath)
+
+    def _read(self, table=None, usecols=None):
+        path = os.path.join(self.metaPath, table + ".RRF")
+        sys.stderr.write("reading %s\n" % path)
+        return readRRF(path=path, table=table, usecols=usecols, chunksize=self.chunksize)
+
+    def _readMRSAT(self):
+        """Load the MN and TH attributes of MeSH."""
+        for chunk in self._read(table="MRSAT", usecols=["CUI", "CODE", "ATN", "SAB", "ATV"]):
+            chunk = chunk[(chunk["SAB"] == "MSH") & chunk["ATN"].isin(["MN", "TH"])]
+            mn = chunk.loc[chunk["ATN"] == "MN", ["CUI", "CODE", "ATV"]].drop_duplicates()
+            self._addMN(rows=mn.itertuples(index=False, name=None))
+            th = chunk.loc[chunk["ATN"] == "TH", ["CUI", "CODE"]].drop_duplicates()
+            self._addTH(rows=th.itertuples(index=False, name=None))
+
+    def _readMRREL(self):
+        """Load the PAR and RN relations of MeSH."""
+        parts = []
+        for chunk in self._read(table="MRREL", usecols=["CUI1", "REL", "CUI2", "SAB"]):
+            chunk = chunk[(chunk["SAB"] == "MSH") & chunk["REL"].isin(["PAR", "RN"])]
+            parts.append(chunk[["CUI1", "CUI2", "REL"]].drop_duplicates())
+        relations = pd.concat(parts, ignore_index=True).drop_duplicates()
+        self.relations = {}
+        for (rel, df) in relations.groupby("REL"):
+            self.relations[rel] = list(df[["CUI1", "CUI2"]].itertuples(index=False, name=None))
+
+    def _readMRCONSO(self):
+        """Load the preferred name of the MeSH concepts.
+
+        | The preferred atom (TS=P, STT=PF, ISPREF=Y) of each concept is used, otherwise the first TS=P atom.
+        """
+        parts = []
+        for chunk in self._read(table="MRCONSO", usecols=["CUI", "TS", "STT", "ISPREF", "SAB", "STR"]):
+            chunk = chunk[(chunk["SAB"] == "MSH") & (chunk["TS"] == "P")]
+            rank = (chunk["STT"] != "PF").astype(int) + (chunk["ISPREF"] != "Y").astype(int)
+            parts.append(chunk[["CUI", "STR"]].assign(rank=rank))
+        names = pd.concat(parts, ignore_index=True)
+        names = names.sort_values(["CUI", "rank"], kind="mergesort").drop_duplicates(subset="CUI")
+        self.cuiName = dict(zip(names["CUI"], names["STR"]))
+
+    def _readMRSTY(self, srdefPath=None):
+        """Load the first semantic type of the MeSH concepts."""
+        abbreviations = {}
+        if srdefPath is not None:
+            abbreviations = readSemanticTypes(path=srdefPath, chunksize=self.chunksize)
+        # the concepts of MeSH, other concepts are skipped
+        cuis = set(self.cuiName) | set(self.cuiDui) | set(self.cuiTH)
+        for chunk in self._read(table="MRSTY", usecols=["CUI", "TUI"]):
+            chunk = chunk[chunk["CUI"].isin(cuis)]
+            for (cui, tui) in zip(chunk["CUI"], chunk["TUI"]):
+                self.cuiSemanticType.setdefault(cui, abbreviations.get(tui, tui))
+
+    def prefetch(self, cuis=None):
+        """All names and semantic types of MeSH are loaded, nothing to do."""
+        return None
+
+    def getRelation(self, rel="PAR"):
+        """Get the distinct concept pairs of a relation of MeSH.
+
+        **return**
+
+        list of tuple (CUI1, CUI2)
+        """
+        return list(self.relations.get(rel, []))
+
+    def iterRelation(self, rel="PAR"):
+        """Iterate the distinct concept pairs of a relation of MeSH."""
+        return iter(self.relations.get(rel, []))
+
+
+def createRRFData(metaPath=None, dataPath=None, srdefPath=None, workPath=".", storage="bcolz", ICfile=None):
+    """Create the six tables from the RRF files.
+
+    | The intermediate tsv files and logs of createBcolzData are written in workPath.
+
+    **parameter**
+
+    metaPath: String
+        the META directory of UMLS.
+
+    dataPath: String
+        the directory of the tables.
+
+    srdefPath: String or None
+        the SRDEF file of the semantic network.
+
+    workPath: String
+        the directory of the intermediate files.
+
+    storage: String
+        One of the value in ("bcolz", "npy").
+
+    ICfile: String or None
+        | the concept frequency file, each line is "MeSHID<>frequency".
+        | default: MeSH_IC.tsv in this package.
+    """
+    maps = rrfMaps(metaPath=metaPath, srdefPath=srdefPath)
+    if ICfile is None:
+        ICfile = os.path.join(os.path.dirname(os.path.abspath(__file__)), "MeSH_IC.tsv")
+    dataPath = os.path.abspath(dataPath)
+    if not os.path.exists(workPath):
+        os.makedirs(workPath)
+    # createBcolzData reads and writes its files in the current directory
+    shutil.copy(ICfile, os.path.join(workPath, "MeSH_IC.tsv"))
+    cwd = os.getcwd()
+    os.chdir(workPath)
+    try:
+        builder = createBcolzData(maps=maps)
+        builder.createParentChildRelTable()
+        builder.createRNandRBRelTable()
+        builder.createMainHeadingDetailData()
+        builder.createRNDetailData()
+        builder.createSupMainHeadingDetailData()
+        builder.createOffspringAndAncestorRel()
+        builder.constructBcolz(storage=storage, dataPath=dataPath)
+    finally:
+        os.chdir(cwd)
+
+
+def main(argv=None):
+    """Command line interface of createRRFData."""
+    parser = argparse.ArgumentParser(description="Create the pyMeSHSim data from the UMLS RRF files.")
+    parser.add_argument("meta", help="META directory of UMLS, with MRCONSO.RRF, MRREL.RRF, MRSAT.RRF, MRSTY.RRF")
+    parser.add_argument("output", help="directory of the tables")
+    parser.add_argument("--srdef", default=None, help="SRDEF file of the semantic network, for the abbreviations")
+    parser.add_argument("--workdir", default=".", help="directory of the intermediate files")
+    parser.add_argument("--storage", default="bcolz", choices=["bcolz", "npy"], help="table format")
+    parser.add_argument("--ic-file", default=None, help='concept frequency file, "MeSHID<>frequency" per line')
+    args = parser.parse_args(argv)
+    createRRFData(metaPath=args.meta, dataPath=args.output, srdefPath=args.srdef, workPath=args.workdir,
+                  storage=args.storage, ICfile=args.ic_file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
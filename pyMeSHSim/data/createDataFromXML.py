@@ -0,0 +1,397 @@
+"""
+.. note::
+    This module is useful for developer, general user can skip this module
+    It creates the data set from the MeSH XML files, without the UMLS database.
+
+eg.
+
+    python -m pyMeSHSim.data.createDataFromXML desc2024.xml supp2024.xml newData \
+        --meta /home/UMLS/2024AA/META --srdef /home/UMLS/2024AA/NET/SRDEF
+"""
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import argparse
+import gzip
+import os
+import sys
+import xml.etree.ElementTree as ET
+import pandas as pd
+from .createData import offspringAndAncestorTable, writeTables
+from .createDataFromRRF import readRRF, readSemanticTypes
+
+# name of each MeSH category, it is not in the XML files
+# V (Publication Characteristics) is not a "MeSH Category" concept in UMLS, so it is not in allCategory
+categoryNames = {"A": "Anatomy",
+                 "B": "Organisms",
+                 "C": "Diseases",
+                 "D": "Chemicals and Drugs",
+                 "E": "Analytical, Diagnostic and Therapeutic Techniques and Equipment",
+                 "F": "Psychiatry and Psychology",
+                 "G": "Phenomena and Processes",
+                 "H": "Disciplines and Occupations",
+                 "I": "Anthropology, Education, Sociology and Social Phenomena",
+                 "J": "Technology, Industry, Agriculture",
+                 "K": "Humanities",
+                 "L": "Information Science",
+                 "M": "Named Groups",
+                 "N": "Health Care",
+                 "Z": "Geographicals"}
+
+
+def iterRecords(path=None, tag=None):
+    """Parse the records of a MeSH XML file one by one.
+
+    | The parsed records are removed from the tree, so the memory doesn't grow with the file.
+
+    **parameter**
+
+    path: String
+        descYYYY.xml or suppYYYY.xml, it can be gzip compressed.
+
+    tag: String
+        record tag, "DescriptorRecord" or "SupplementalRecord".
+
+    **return**
+
+    generator of xml.etree.ElementTree.Element, it is cleared after the next record is read.
+    """
+    handle = gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+    try:
+        root = None
+        for (event, elem) in ET.iterparse(handle, events=("start", "end")):
+            if root is None:
+                root = elem
+            elif event == "end" and elem.tag == tag:
+                yield elem
+                root.clear()
+    finally:
+        handle.close()
+
+
+def readUMLSConcepts(metaPath=None, chunksize=1000000):
+    """Read the UMLS ID and semantic type of the MeSH concepts from the RRF files of UMLS.
+
+    | The XML files of recent MeSH years have no ConceptUMLSUI and SemanticTypeList,
+    | the MeSH concept UI (eg. "M0014585") is the SCUI of the MeSH atoms in MRCONSO.
+
+    **parameter**
+
+    metaPath: String
+        the META directory of UMLS, which contains MRCONSO.RRF and MRSTY.RRF.
+
+    chunksize: int
+        number of lines in one chunk.
+
+    **return**
+
+    tuple of dict, MeSH concept UI to UMLS ID, and UMLS ID to list of semantic type ID.
+    """
+    conceptCuis = {}
+    path = os.path.join(metaPath, "MRCONSO.RRF")
+    sys.stderr.write("reading %s\n" % path)
+    for chunk in readRRF(path=path, table="MRCONSO", usecols=["CUI", "SCUI", "SAB"], chunksize=chunksize):
+        chunk = chunk[(chunk["SAB"] == "MSH") & (chunk["SCUI"] != "")]
+        for (scui, cui) in zip(chunk["SCUI"], chunk["CUI"]):
+            conceptCuis.setdefault(scui, cui)
+    cuis = set(conceptCuis.values())
+    cuiTuis = {}
+    path = os.path.join(metaPath, "MRSTY.RRF")
+    sys.stderr.write("reading %s\n" % path)
+    for chunk in readRRF(path=path, table="MRSTY", usecols=["CUI", "TUI"], chunksize=chunksize):
+        chunk = chunk[chunk["CUI"].isin(cuis)]
+        for (cui, tui) in zip(chunk["CUI"], chunk["TUI"]):
+            tuis = cuiTuis.setdefault(cui, [])
+            if tui not in tuis:
+                tuis.append(tui)
+    return (conceptCuis, cuiTuis)
+
+
+def _parseConcepts(record=None, conceptCuis=None, cuiTuis=None):
+    """Get the concepts of a record.
+
+    | The UMLS ID and semantic types missing in the record are looked up in conceptCuis and cuiTuis,
+    | see readUMLSConcepts.
+
+    **return**
+
+    list of tuple (UMLS ID, concept name, list of semantic type ID, is preferred),
+    the UMLS ID is "" and the list is empty if they are not found.
+    """
+    concepts = []
+    for concept in record.iterfind("ConceptList/Concept"):
+        cui = concept.findtext("ConceptUMLSUI", default="")
+        if cui == "" and conceptCuis is not None:
+            cui = conceptCuis.get(concept.findtext("ConceptUI", default=""), "")
+        name = concept.findtext("ConceptName/String", default="")
+        tuis = [tui.text for tui in concept.iterfind("SemanticTypeList/SemanticType/SemanticTypeUI")]
+        if len(tuis) == 0 and cuiTuis is not None:
+            tuis = list(cuiTuis.get(cui, []))
+        concepts.append((cui, name, tuis, concept.get("PreferredConceptYN") == "Y"))
+    return concepts
+
+
+class createXMLData(object):
+    """A class to construct the base data from NLM's MeSH XML files.
+
+    | The descriptor file is read into a small summary of each descriptor,
+    | the supplementary concept file is streamed, only the rows of the tables are kept.
+    | It creates the same six tables as createBcolzData.
+
+    .. note::
+        | The UMLS ID and semantic type come from ConceptUMLSUI and SemanticTypeList of the concepts.
+        | They are not in the XML files of recent MeSH years, give metaPath to read them from UMLS.
+        | Without them UMLSID, Semantic_Type, supplementMainHeading and DiseaseCategoryST are empty,
+        | and MetaMap results can't be mapped to this data, a warning is written.
+        | Frequence comes from ICfile, the descriptors which are not in it have frequency 0,
+        | so the default MeSH_IC.tsv gives 0 to the descriptors added after it.
+
+    **parameter**
+
+    descPath: String
+        descYYYY.xml, it can be gzip compressed.
+
+    suppPath: String
+        suppYYYY.xml, it can be gzip compressed.
+
+    ICfile: String
+        | the concept frequency file, each line is "MeSHID<>frequency".
+        | default: MeSH_IC.tsv in this package.
+
+    semanticTypes: dict or None
+        | semantic type ID to its abbreviation, eg. {"T047": "dsyn"}, from SRDEF of UMLS.
+        | default None, the abbreviations of srdefPath, otherwise the semantic type ID is kept.
+
+    metaPath: String or None
+        | the META directory of UMLS, the missing UMLS ID and semantic types are read from its
+        | MRCONSO.RRF and MRSTY.RRF, see readUMLSConcepts.
+        | default None, only the XML files are used.
+
+    srdefPath: String or None
+        the SRDEF file of the semantic network, for the semantic type abbreviations.
+
+    **attribute**
+
+    descriptors: dict
+        MeSH ID to tuple (name, list of tree code, list of concept), see readDescriptors.
+
+    **see also**
+
+    pyMeSHSim.data.createData.createBcolzData
+    """
+
+    def __init__(self, descPath=None, suppPath=None, ICfile=None, semanticTypes=None, metaPath=None,
+                 srdefPath=None):
+        self.descPath = descPath
+        self.suppPath = suppPath
+        if ICfile is None:
+            ICfile = os.path.join(os.path.dirname(os.path.abspath(__file__)), "MeSH_IC.tsv")
+        self.ICfile = ICfile
+        (self.conceptCuis, self.cuiTuis) = (None, None)
+        if metaPath is not None:
+            (self.conceptCuis, self.cuiTuis) = readUMLSConcepts(metaPath=metaPath)
+        if semanticTypes is None and srdefPath is not None:
+            semanticTypes = readSemanticTypes(path=srdefPath)
+        self.semanticTypes = semanticTypes if semanticTypes is not None else {}
+        self.descriptors = None
+
+    def _semanticType(self, tuis=None):
+        """Get the abbreviation of the first semantic type, "" if there is none."""
+        if len(tuis) == 0:
+            return ""
+        return self.semanticTypes.get(tuis[0], tuis[0])
+
+    def readDescriptors(self):
+        """Read the descriptor file.
+
+        **return**
+
+        dict, MeSH ID to tuple (name, list of tree code, list of concept),
+        the preferred concept is the first one.
+        """
+        sys.stderr.write("Reading the descriptors of %s\n" % self.descPath)
+        descriptors = {}
+        for record in iterRecords(path=self.descPath, tag="DescriptorRecord"):
+            dui = record.findtext("DescriptorUI")
+            name = record.findtext("DescriptorName/String")
+            treeCodes = [code.text for code in record.iterfind("TreeNumberList/TreeNumber")]
+            concepts = sorted(_parseConcepts(record=record, conceptCuis=self.conceptCuis, cuiTuis=self.cuiTuis),
+                              key=lambda concept: not concept[3])
+            descriptors[dui] = (name, treeCodes, concepts)
+        self.descriptors = descriptors
+        self._checkUMLSID()
+        return descriptors
+
+    def _checkUMLSID(self):
+        """Warn about the descriptors whose preferred concept has no UMLS ID."""
+        missing = sum(1 for (name, treeCodes, concepts) in self.descriptors.values()
+                      if len(concepts) == 0 or concepts[0][0] == "")
+        if missing == 0:
+            return
+        if missing == len(self.descriptors):
+            sys.stderr.write("Warning: no ConceptUMLSUI is found in %s, UMLSID, Semantic_Type and "
+                             "supplementMainHeading will be empty, and MetaMap results can't be mapped to this data. "
+                             "Give the META directory of UMLS to read them from MRCONSO.RRF and MRSTY.RRF.\n"
+                             % self.descPath)
+        else:
+            sys.stderr.write("Warning: %s of %s descriptors have no UMLS ID\n" % (missing, len(self.descriptors)))
+
+    def _getDescriptors(self):
+        if self.descriptors is None:
+            self.readDescriptors()
+        return self.descriptors
+
+    def createParentChildRel(self):
+        """Create the parent-child relation table from the tree codes.
+
+        | The parent of a tree code is the code without its last part.
+        | As in UMLS, a pair of descriptors is related in each category both of them belong to.
+
+        **return**
+
+        pandas.DataFrame, columns "Child", "Parent", "Category".
+        """
+        descriptors = self._getDescriptors()
+        codeOwner = {}
+        letters = {}
+        for (dui, (name, treeCodes, concepts)) in descriptors.items():
+            letters[dui] = set(code[0] for code in treeCodes)
+            for code in treeCodes:
+                codeOwner[code] = dui
+        pairs = set()
+        for (dui, (name, treeCodes, concepts)) in descriptors.items():
+            for code in treeCodes:
+                if "." in code:
+                    parent = codeOwner.get(code.rsplit(".", 1)[0])
+                    if parent is not None:
+                        pairs.add((dui, parent))
+        rows = [(child, parent, cat) for (child, parent) in pairs for cat in letters[child] & letters[parent]]
+        return pd.DataFrame(rows, columns=["Child", "Parent", "Category"])
+
+    def _readIC(self):
+        """Read the concept frequency file."""
+        ICdict = {}
+        with open(self.ICfile, "r") as handle:
+            for line in handle:
+                [icdui, freq] = line.strip("\n").split("<>")
+                ICdict[icdui] = int(freq)
+        return ICdict
+
+    def createMainHeadingDetailData(self, parentChild=None):
+        """Create the detail information of the descriptors in the parent-child relation table.
+
+        **return**
+
+        pandas.DataFrame, one row for each tree code,
+        columns "MeSHID", "UMLSID", "Tree_Code", "Preferred_Name", "Category", "Frequence", "Semantic_Type".
+        """
+        descriptors = self._getDescriptors()
+        ICdict = self._readIC()
+        rows = []
+        duis = set(parentChild["Child"]) | set(parentChild["Parent"])
+        noFrequence = len(duis - set(ICdict))
+        if noFrequence > 0:
+            sys.stderr.write("Warning: %s descriptors are not in %s, their Frequence is 0\n"
+                             % (noFrequence, self.ICfile))
+        for dui in duis:
+            (name, treeCodes, concepts) = descriptors[dui]
+            (cui, conceptName, tuis, preferred) = concepts[0] if len(concepts) > 0 else ("", "", [], True)
+            semtypes = self._semanticType(tuis=tuis)
+            for tc in treeCodes:
+                rows.append((dui, cui, tc, name, tc[0], ICdict.get(dui, 0), semtypes))
+        return pd.DataFrame(rows, columns=["MeSHID", "UMLSID", "Tree_Code", "Preferred_Name", "Category",
+                                           "Frequence", "Semantic_Type"])
+
+    def createSupMainHeadingDetailData(self, parentChild=None):
+        """Create the UMLS ID of all concepts of the descriptors in the parent-child relation table.
+
+        **return**
+
+        pandas.DataFrame, columns "MeSHID", "UMLSID".
+        """
+        descriptors = self._getDescriptors()
+        rows = []
+        for dui in set(parentChild["Child"]) | set(parentChild["Parent"]):
+            for (cui, conceptName, tuis, preferred) in descriptors[dui][2]:
+                if cui != "":
+                    rows.append((dui, cui))
+        return pd.DataFrame(rows, columns=["MeSHID", "UMLSID"])
+
+    def createRNTables(self):
+        """Stream the supplementary concept file, and create the RN relation and RN detail tables.
+
+        | A supplementary concept is a narrow concept of each descriptor it is mapped to,
+        | in each category of the descriptor.
+
+        **return**
+
+        tuple of pandas.DataFrame,
+        RNandRBRel with columns "RNconcept", "RBconcept", "Category",
+        RNDetailData with columns "MeSHID", "UMLSID", "Preferred_Name", "Semantic_Type".
+        """
+        descriptors = self._getDescriptors()
+        sys.stderr.write("Reading the supplementary concepts of %s\n" % self.suppPath)
+        relRows = []
+        detailRows = []
+        for record in iterRecords(path=self.suppPath, tag="SupplementalRecord"):
+            scr = record.findtext("SupplementalRecordUI")
+            categories = set()
+            for mapped in record.iterfind("HeadingMappedToList/HeadingMappedTo/DescriptorReferredTo/DescriptorUI"):
+                # the main heading is starred
+                dui = mapped.text.lstrip("*")
+                if dui not in descriptors:
+                    continue
+                for cat in set(code[0] for code in descriptors[dui][1]):
+                    categories.add((scr, dui, cat))
+            if len(categories) == 0:
+                continue
+            relRows.extend(categories)
+            for (cui, conceptName, tuis, preferred) in _parseConcepts(record=record, conceptCuis=self.conceptCuis,
+                                                                      cuiTuis=self.cuiTuis):
+                detailRows.append((scr, cui, conceptName, self._semanticType(tuis=tuis)))
+        return (pd.DataFrame(relRows, columns=["RNconcept", "RBconcept", "Category"]),
+                pd.DataFrame(detailRows, columns=["MeSHID", "UMLSID", "Preferred_Name", "Semantic_Type"]))
+
+    def constructBcolz(self, dataPath=None, storage="bcolz"):
+        """Create the six tables and write them to dataPath.
+
+        **parameter**
+
+        dataPath: String
+            the directory of the tables.
+
+        storage: String
+            One of the value in ("bcolz", "npy").
+        """
+        parentChild = self.createParentChildRel()
+        mainHeading = self.createMainHeadingDetailData(parentChild=parentChild)
+        (RNandRB, RNDetail) = self.createRNTables()
+        allCategory = dict((cat, categoryNames[cat]) for cat in set(mainHeading["Category"]) if cat in categoryNames)
+        writeTables(parentChild=parentChild, RNandRB=RNandRB, mainHeading=mainHeading, RNDetail=RNDetail,
+                    supplement=self.createSupMainHeadingDetailData(parentChild=parentChild),
+                    offspringAncestor=offspringAndAncestorTable(parentChild=parentChild),
+                    allCategory=allCategory, dataPath=dataPath, storage=storage)
+        sys.stderr.write("Done the construct bcolz function\n")
+
+
+def main(argv=None):
+    """Command line interface of createXMLData."""
+    parser = argparse.ArgumentParser(description="Create the pyMeSHSim data from the MeSH XML files.")
+    parser.add_argument("desc", help="descYYYY.xml or descYYYY.xml.gz")
+    parser.add_argument("supp", help="suppYYYY.xml or suppYYYY.xml.gz")
+    parser.add_argument("output", help="directory of the tables")
+    parser.add_argument("--storage", default="bcolz", choices=["bcolz", "npy"], help="table format")
+    parser.add_argument("--ic-file", default=None, help='concept frequency file, "MeSHID<>frequency" per line')
+    parser.add_argument("--meta", default=None,
+                        help="META directory of UMLS, the UMLS ID and semantic types are read from its "
+                             "MRCONSO.RRF and MRSTY.RRF if the XML files don't have them")
+    parser.add_argument("--srdef", default=None, help="SRDEF file of the semantic network, for the abbreviations")
+    args = parser.parse_args(argv)
+    createXMLData(descPath=args.desc, suppPath=args.supp, ICfile=args.ic_file, metaPath=args.meta,
+                  srdefPath=args.srdef).constructBcolz(dataPath=args.output, storage=args.storage)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
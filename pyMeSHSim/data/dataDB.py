@@ -2,29 +2,219 @@
 # Organization: HuaZhong Agricultural University
 
 #!/usr/bin/python3
+import os
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+
+
+class PoolExhaustedError(RuntimeError):
+    """A thread asks for a connection while it holds all connections of the pool."""
+    pass
+
+
+class connectionPool(object):
+    """A small pool of database connections, each thread takes its own connection.
+
+    | When all connections are used, a thread waits for one to be returned by another thread.
+    | If the thread itself holds all of them, eg. it queries while the generator of dataDB.iterate is open
+    | on a pool of size 1, no connection can come back, so PoolExhaustedError is raised instead of waiting.
+
+    **parameter**
+
+    connect: function
+        create a new connection.
+
+    size: int
+        the max number of connections.
+    """
+
+    def __init__(self, connect=None, size=2):
+        self.connect = connect
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        # number of connections taken by each thread
+        self._held = {}
+
+    def _hold(self, count=None):
+        thread = threading.get_ident()
+        with self._lock:
+            held = self._held.get(thread, 0) + count
+            if held == 0:
+                del self._held[thread]
+            else:
+                self._held[thread] = held
+
+    def _take(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created = self._created + 1
+            exhausted = not create and self._held.get(threading.get_ident(), 0) >= self.size
+        if create:
+            try:
+                return self.connect()
+            except Exception:
+                with self._lock:
+                    self._created = self._created - 1
+                raise
+        if exhausted:
+            raise PoolExhaustedError("all %s connections of the pool are used by this thread, "
+                                     "read the open iterate generator to the end or close it first, "
+                                     "or give a larger pool" % self.size)
+        # all connections are used by other threads, wait for one
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self):
+        """Take a connection, it is returned to the pool after use.
+
+        PoolExhaustedError is raised if this thread already holds all connections.
+        """
+        connection = self._take()
+        self._hold(count=1)
+        try:
+            yield connection
+        finally:
+            self._hold(count=-1)
+            self._idle.put(connection)
+
+    def close(self):
+        """Close the idle connections."""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            connection.close()
+            with self._lock:
+                self._created = self._created - 1
 
-import pymysql
 
 class dataDB(object):
-    def __init__(self):
-        self.host = "localhost"
-        self.userName = "zhluo"
-        self.password = "luozh123"
-        self.database = "umls"
-        self.db = pymysql.connect(self.host, self.userName, self.password, self.database)
-        self.cursor = self.db.cursor()
+    """Query the UMLS database.
+
+    | The connections are kept in a pool, so several build stages can query in parallel, one connection each.
+    | A large result can be read in batches by iterate, with a server-side cursor of MySQL,
+    | so it is not held in client memory.
+    | The connection of iterate is kept while its generator is open. With a pool of size 1, eg. with connection,
+    | another query of the same thread in this time raises PoolExhaustedError, see connectionPool.
+
+    **parameter**
+
+    connection: DB-API connection or None
+        | an opened connection, eg. sqlite3.connect("umls.db") with the tables MRREL, MRSAT, MRCONSO, MRSTY, SRDEF.
+        | it is the only connection of the pool, so the queries can't be nested in iterate.
+
+    connect: function or None
+        | create a new connection, eg. lambda: sqlite3.connect("umls.db", check_same_thread=False).
+
+    host, user, password, database, port:
+        | the UMLS MySQL database, used if connection and connect are None.
+        | default: the environment variables PYMESHSIM_DB_HOST, PYMESHSIM_DB_USER, PYMESHSIM_DB_PASSWORD,
+        | PYMESHSIM_DB_NAME and PYMESHSIM_DB_PORT.
+        | user and password have no default, the program exits if they are not given;
+        | host is "localhost", database is "umls" and port is 3306 otherwise.
+
+    poolSize: int
+        the max number of connections.
+
+    batchSize: int
+        number of rows read at one time by iterate.
+    """
+
+    def __init__(self, connection=None, connect=None, host=None, user=None, password=None, database=None,
+                 port=None, poolSize=2, batchSize=10000):
+        self.batchSize = batchSize
+        self.streaming = False
+        if connection is not None:
+            connect = lambda: connection
+            poolSize = 1
+        elif connect is None:
+            self.userName = user if user is not None else os.environ.get("PYMESHSIM_DB_USER")
+            self.password = password if password is not None else os.environ.get("PYMESHSIM_DB_PASSWORD")
+            if self.userName is None or self.password is None:
+                sys.stderr.write("the user and password of the UMLS database are not given, "
+                                 "set the parameters user and password, or the environment variables "
+                                 "PYMESHSIM_DB_USER and PYMESHSIM_DB_PASSWORD\n")
+                exit(1)
+            import pymysql
+            import pymysql.cursors
+            self.host = host if host is not None else os.environ.get("PYMESHSIM_DB_HOST", "localhost")
+            self.database = database if database is not None else os.environ.get("PYMESHSIM_DB_NAME", "umls")
+            self.port = int(port if port is not None else os.environ.get("PYMESHSIM_DB_PORT", 3306))
+            connect = lambda: pymysql.connect(host=self.host, user=self.userName, password=self.password,
+                                              database=self.database, port=self.port)
+            # unbuffered cursor, the rows are read from the server while they are used
+            self.streaming = True
+            self._streamCursor = pymysql.cursors.SSCursor
+        self.poolSize = poolSize
+        self.pool = connectionPool(connect=connect, size=poolSize)
 
     def fetch_all(self, sql_cmd=None):
-        self.cursor.execute(sql_cmd)
-        result = self.cursor.fetchall()
+        with self.pool.connection() as db:
+            cursor = db.cursor()
+            try:
+                cursor.execute(sql_cmd)
+                result = cursor.fetchall()
+            finally:
+                cursor.close()
         return result
 
     def fetch_one(self, sql_cmd=None):
-        self.cursor.execute(sql_cmd)
-        result = self.cursor.fetchone()
+        with self.pool.connection() as db:
+            cursor = db.cursor()
+            try:
+                cursor.execute(sql_cmd)
+                result = cursor.fetchone()
+            finally:
+                cursor.close()
         return result
 
+    def iterate(self, sql_cmd=None, batchSize=None):
+        """Read the result of a query in batches.
+
+        | The connection is kept until all rows are read or the generator is closed.
+
+        **parameter**
+
+        sql_cmd: String
+
+        batchSize: int
+            number of rows read at one time, default self.batchSize.
+
+        **return**
+
+        generator of row tuple
+        """
+        if batchSize is None:
+            batchSize = self.batchSize
+        with self.pool.connection() as db:
+            cursor = db.cursor(self._streamCursor) if self.streaming else db.cursor()
+            try:
+                cursor.execute(sql_cmd)
+                while True:
+                    rows = cursor.fetchmany(batchSize)
+                    if len(rows) == 0:
+                        break
+                    for row in rows:
+                        yield row
+            finally:
+                # an unbuffered cursor reads the remaining rows when it is closed
+                cursor.close()
+
+    def close(self):
+        """Close the idle connections."""
+        self.pool.close()
+
 
 
 if __name__ == '__main__':
-    dataclient = dataDB()
\ No newline at end of file
+    dataclient = dataDB()
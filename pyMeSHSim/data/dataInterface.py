@@ -2,13 +2,14 @@
 # Organization: HuaZhong Agricultural University
 
 #!/usr/bin/python3
-import bcolz as bz
 import pandas as pd
 import sys, os
+from collections import OrderedDict
+from .dataStore import dataStore
 
 
 class dataHandle():
-    """This class is used to parse MeSH data, which stored in bcolz.
+    """This class is used to parse MeSH data, which stored in bcolz or memory-mapped npy columns.
 
     | It contains 6 tables: parent child relation table, RN and RB relation table, main heading detail data table, and RN detail data table,
     | supplement main heading table, offspring and ancestor table.
@@ -16,7 +17,9 @@ class dataHandle():
     **parameters**
 
     path: string
-        The directory path, which contain all the bcolz file.
+        | The directory path, which contain all the table.
+        | default: None, means the environment variable PYMESHSIM_DATA_PATH or the data in this package.
+        | each table can be in bcolz or npy format, see pyMeSHSim.data.storage.
 
     **attribute**
 
@@ -35,27 +38,76 @@ class dataHandle():
     _totalDataFilePath: String
         the path to table totalData.
 
+    _ICDataFilePath: String
+        the path to table MeSHICData, the precomputed IC value of main heading concepts.
+
     allCategory: list
         contain all category in MeSH
 
+    _store: dataStore
+        the data store shared by all objects in this process, opened tables and data caches are kept in it.
+
     **see also**
 
     pyMeSHSim.data.createData
     """
-    def __init__(self):
-        path = os.path.realpath(__file__)
-        self._dataPath = os.path.join(os.path.dirname(path), "testData")
+    def __init__(self, path=None):
+        if path is None:
+            path = os.environ.get("PYMESHSIM_DATA_PATH")
+        if path is None:
+            path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "testData")
+        self._dataPath = path
         self._parChdRelFilePath = os.path.join(self._dataPath, "ParentChildRel")
         self._RNRBRelFilePath = os.path.join(self._dataPath, "RNandRBRel")
         self._RNDetailDataFilePath = os.path.join(self._dataPath, "RNDetailData")
         self._MainHeadingDetailDataFilePath = os.path.join(self._dataPath, "MainHeadingDetailData")
         self._supMainHeadingDetailDataFilePath = os.path.join(self._dataPath, "supplementMainHeading")
         self._offspringAncestorDataFilePath = os.path.join(self._dataPath, "offspringAndAncestorRel")
+        self._ICDataFilePath = os.path.join(self._dataPath, "MeSHICData")
+        self._store = dataStore.getInstance(path=self._dataPath)
         #self.allCategory = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z', 'all']
         self.allCategory = list(self.getAllCategory().keys()) + ["all"]
         self.maxIDInCategory = self._getMaxIDInCategory()
 
-    def getRelData(self, data=None, category="all"):
+    @staticmethod
+    def _readData(bz1=None, start=None, end=None, columns=None):
+        """Read a row range of a table into a DataFrame.
+
+        | Only rows [start, end) of the selected columns are read,
+        | for bcolz only the chunks covering them are decompressed, for npy only their pages are loaded.
+        | The DataFrame index is the row number in the whole table.
+
+        **parameter**
+
+        bz1: bcolzTable or npyTable, see pyMeSHSim.data.storage
+
+        start: int or None
+            first row, None means 0.
+
+        end: int or None
+            last row (not included), None means the table length.
+
+        columns: list or None
+            columns to read, None means all columns.
+
+        **return**
+
+        DataFrame object
+        """
+        if columns is None:
+            columns = bz1.names
+        for col in columns:
+            if col not in bz1.names:
+                sys.stderr.write("error: the column %s is not in our data\n" % col)
+                exit(1)
+        if start is None:
+            start = 0
+        if end is None:
+            end = len(bz1)
+        data = OrderedDict((col, bz1.readColumn(name=col, start=start, end=end)) for col in columns)
+        return pd.DataFrame(data, index=pd.RangeIndex(start, start + len(data[columns[0]])))
+
+    def getRelData(self, data=None, category="all", columns=None):
         """This method used to select data from table ParentChildRel or RNandRBRel.
 
 
@@ -76,6 +128,10 @@ class dataHandle():
 
             | default: "all"
 
+        columns: list or None
+            | columns to read, only these columns will be decompressed.
+            | default: None, means all columns.
+
         **return**
 
         DataFrame object
@@ -89,33 +145,34 @@ class dataHandle():
             sys.stderr.write("error: the data %s is not in our data\n" % data)
         else:
             filePath = dataSet[data]
-            bz1 = bz.open(rootdir=filePath, mode="r")
+            bz1 = self._store.openTable(filePath=filePath)
         if category is None:
             category = "all"
         if category not in self.allCategory:
             sys.stderr.write("error: the category %s is not in our data." % category)
             exit(1)
         if category == "all":
-            df1 = bz1.todataframe()
+            df1 = self._readData(bz1=bz1, columns=columns)
             return df1
         else:
             try:
-                (start, end) = bz1.attrs["myattr"][category]
+                (start, end) = self._store.getAttr(filePath=filePath, name="myattr")[category]
             except:
                 sys.stderr.write("data %s has no category %s" % (data, category))
                 exit(1)
-            df1 = bz1.todataframe()
             end = end + 1
-            dftmp = df1[start: end]
+            dftmp = self._readData(bz1=bz1, start=start, end=end, columns=columns)
             return dftmp
 
     #def getTreeSubnodeDetailData(self, category="all"):
-    def getMainHeadingDetailData(self, category="all"):
+    def getMainHeadingDetailData(self, category="all", columns=None):
         """This method used to select data from table totalData.
 
         | MainHeadingDetailData table contains all information about descriptors in ParentChildRel table.
         | columns in this table is:
-        | MeSHID, UMLSID, Tree_Code, Preferred_Name, Category, Frequence, Semantic_Type
+        | MeSHID, UMLSID, Tree_Code, Preferred_Name, Category, Frequence, Semantic_Type,
+        | Descendant_Count, Depth, Tree_Positions
+        | the last three are the node statistics of the MeSH ID in the category of the row.
 
         **parameter**
 
@@ -124,31 +181,34 @@ class dataHandle():
             | "all" means select all data
             | default: "all"
 
+        columns: list or None
+            | columns to read, only these columns will be decompressed.
+            | default: None, means all columns.
+
         **return**
 
         DataFrame object
         """
-        bz1 = bz.open(rootdir=self._MainHeadingDetailDataFilePath, mode="r")
+        bz1 = self._store.openTable(filePath=self._MainHeadingDetailDataFilePath)
         if category is None:
             category = "all"
         if category not in self.allCategory:
             sys.stderr.write("error: the category %s is not in our data.\n" % category)
             exit(1)
         if category == "all":
-            df1 = bz1.todataframe()
+            df1 = self._readData(bz1=bz1, columns=columns)
             return df1
         else:
             try:
-                (start, end) = bz1.attrs["myattr"][category]
+                (start, end) = self._store.getAttr(filePath=self._MainHeadingDetailDataFilePath, name="myattr")[category]
             except:
                 sys.stderr.write("data has no category %s" % category)
                 exit(1)
-            df1 = bz1.todataframe()
             end = end + 1
-            dftmp = df1[start: end]
+            dftmp = self._readData(bz1=bz1, start=start, end=end, columns=columns)
             return dftmp
 
-    def getRNDetailData(self):
+    def getRNDetailData(self, columns=None):
         """This method used to select data from table RNdetailData.
 
         | RNdetailData contains full information about the narrow concept in MeSH.
@@ -161,8 +221,8 @@ class dataHandle():
         dataframe object
         """
 
-        bz1 = bz.open(rootdir=self._RNDetailDataFilePath, mode="r")
-        df1 = bz1.todataframe()
+        bz1 = self._store.openTable(filePath=self._RNDetailDataFilePath)
+        df1 = self._readData(bz1=bz1, columns=columns)
         return df1
 
 
@@ -173,48 +233,73 @@ class dataHandle():
 
         list
         """
-        bz1 = bz.open(rootdir=self._MainHeadingDetailDataFilePath, mode="r")
-        semanticTypes = bz1.attrs["DiseaseCategoryST"]
+        semanticTypes = self._store.getAttr(filePath=self._MainHeadingDetailDataFilePath, name="DiseaseCategoryST")
         return semanticTypes
 
-    def getSupplementMainHeadingData(self):
+    def getSupplementMainHeadingData(self, columns=None):
         """Get supplementary main heading data."""
-        bz1 = bz.open(rootdir=self._supMainHeadingDetailDataFilePath, mode="r")
-        df1 = bz1.todataframe()
+        bz1 = self._store.openTable(filePath=self._supMainHeadingDetailDataFilePath)
+        df1 = self._readData(bz1=bz1, columns=columns)
         return df1
 
-    def getOffspringAncestorData(self, category="all"):
-        """Get offsping and ancestor data."""
+    def getOffspringAncestorData(self, category="all", columns=None):
+        """Get offsping and ancestor data.
+
+        | Only rows of the category and the selected columns are decompressed.
+        """
 
-        bz1 = bz.open(rootdir=self._offspringAncestorDataFilePath, mode="r")
+        bz1 = self._store.openTable(filePath=self._offspringAncestorDataFilePath)
         if category is None:
             category = "all"
         if category not in self.allCategory:
             sys.stderr.write("error: the category %s is not in our data.\n" % category)
             exit(1)
         if category == "all":
-            df1 = bz1.todataframe()
+            df1 = self._readData(bz1=bz1, columns=columns)
             return df1
         else:
             try:
-                (start, end) = bz1.attrs["myattr"][category]
+                (start, end) = self._store.getAttr(filePath=self._offspringAncestorDataFilePath, name="myattr")[category]
             except:
                 sys.stderr.write("data has no category %s" % category)
                 exit(1)
-            df1 = bz1.todataframe()
             end = end + 1
-            dftmp = df1[start: end]
+            dftmp = self._readData(bz1=bz1, start=start, end=end, columns=columns)
             return dftmp
 
+    def getICData(self, category=None):
+        """Get the precomputed IC value of main heading concepts in one category.
+
+        | MeSHICData table has three columns "MeSHID", "Category", "IC".
+        | It is created by pyMeSHSim.Sim.ICScore.InformationContent.createICData.
+
+        **parameter**
+
+        category: string
+            one of the value in ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'V', 'Z', 'all')
+
+        **return**
+
+        None if the table is not created, otherwise tuple of (DataFrame, max IC value of the category)
+        """
+        if not os.path.exists(self._ICDataFilePath):
+            return None
+        bz1 = self._store.openTable(filePath=self._ICDataFilePath)
+        categotyDict = self._store.getAttr(filePath=self._ICDataFilePath, name="myattr")
+        if category not in categotyDict:
+            return None
+        (start, end) = categotyDict[category]
+        df1 = self._readData(bz1=bz1, start=start, end=end + 1, columns=["MeSHID", "IC"])
+        maxIC = self._store.getAttr(filePath=self._ICDataFilePath, name="maxICInCategory")[category]
+        return (df1, maxIC)
+
     def getAllCategory(self):
         """Get all category."""
-        bz1 = bz.open(rootdir=self._MainHeadingDetailDataFilePath, mode="r")
-        cateDict = bz1.attrs["allCategory"]
+        cateDict = self._store.getAttr(filePath=self._MainHeadingDetailDataFilePath, name="allCategory")
         return cateDict
 
     def _getMaxIDInCategory(self):
         """Get max IC terms."""
-        bz1 = bz.open(rootdir=self._MainHeadingDetailDataFilePath, mode="r")
-        cateDict = bz1.attrs["maxIDInCategory"]
+        cateDict = self._store.getAttr(filePath=self._MainHeadingDetailDataFilePath, name="maxIDInCategory")
         return cateDict
 
@@ -0,0 +1,125 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+from . import storage
+
+
+class dataStore(object):
+    """This class keeps the MeSH data shared by all objects in one process.
+
+    | There is one store for each data directory, it is created on first use by getInstance.
+    | Opened tables, their attrs, and the data caches of dataHandle and its subclasses are kept here,
+    | so a new duiFunc, MeSHProcess, MetaMap or Concept object reuses what the others have loaded.
+
+    **parameter**
+
+    path: string
+        The directory path, which contain all the table.
+
+    **attribute**
+
+    dataPath: String
+        The directory path, which contain all the table.
+
+    tables: dict
+        opened table, key is the table path.
+
+    attrs: dict
+        attrs of table, key is tuple of (table path, attr name).
+
+    caches: dict
+        data cache shared by all objects, key is the attribute name.
+
+    **see also**
+
+    pyMeSHSim.data.dataInterface.dataHandle
+    """
+
+    _instances = {}
+
+    def __init__(self, path=None):
+        self.dataPath = path
+        self.tables = {}
+        self.attrs = {}
+        self.caches = {}
+
+    @classmethod
+    def getInstance(cls, path=None):
+        """Get the store of one data directory, create it on first use."""
+        if path not in cls._instances:
+            cls._instances[path] = cls(path=path)
+        return cls._instances[path]
+
+    def openTable(self, filePath=None):
+        """Open a table in read mode, the table is opened only once.
+
+        **return**
+
+        pyMeSHSim.data.storage.bcolzTable or pyMeSHSim.data.storage.npyTable object
+        """
+        if filePath not in self.tables:
+            self.tables[filePath] = storage.openTable(rootdir=filePath)
+        return self.tables[filePath]
+
+    def getAttr(self, filePath=None, name=None):
+        """Get one attr of a table, it is read only once."""
+        if (filePath, name) not in self.attrs:
+            self.attrs[(filePath, name)] = self.openTable(filePath=filePath).attrs[name]
+        return self.attrs[(filePath, name)]
+
+    def getCache(self, name=None, default=None):
+        """Get one shared data cache, default is a function to create its initial value."""
+        if name not in self.caches:
+            self.caches[name] = default()
+        return self.caches[name]
+
+    def setCache(self, name=None, value=None):
+        """Replace one shared data cache."""
+        self.caches[name] = value
+
+    def reset(self, filePath=None):
+        """Forget the opened tables, attrs and data caches after the data on disk has been changed.
+
+        **parameter**
+
+        filePath: String or None
+            | the table which has been changed, only it is reopened on next use.
+            | None means all tables.
+            | data caches are always cleared, because they may be derived from any table.
+        """
+        if filePath is None:
+            self.tables = {}
+            self.attrs = {}
+        else:
+            self.tables.pop(filePath, None)
+            for key in [key for key in self.attrs if key[0] == filePath]:
+                del self.attrs[key]
+        self.caches = {}
+
+
+def storeProperty(name=None, default=None):
+    """Make an attribute whose value is kept in the shared dataStore of the object.
+
+    **parameter**
+
+    name: String
+        the attribute name.
+
+    default: function
+        create the initial value, eg. dict for an empty cache.
+
+    **return**
+
+    property object
+    """
+    if default is None:
+        default = lambda: None
+
+    def getter(self):
+        return self._store.getCache(name=name, default=default)
+
+    def setter(self, value):
+        self._store.setCache(name=name, value=value)
+
+    return property(getter, setter)
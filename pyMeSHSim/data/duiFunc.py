@@ -4,7 +4,12 @@
 #!/usr/bin/python3
 import re
 import sys
+import numpy as np
+import pandas as pd
 from ..data.dataInterface import dataHandle
+from ..data.dataStore import storeProperty
+from ..data.IDResolver import IDResolver
+from .treeStatistics import nodeStatistics
 
 
 class duiFunc(dataHandle):
@@ -26,18 +31,41 @@ class duiFunc(dataHandle):
 
     RNtoRBData: dataframe or None
         data cache for RNtoRBData.
+
+    supplementMainHeadingData: dataframe or None
+        data cache for supplementMainHeading.
+
+    keyIndex: dict
+        | key to row-range index of the cached tables, built on first use.
+        | key is (table name, column name), value is (row order, {key: (start, end)}).
+
+    resolver: IDResolver or None
+        identifier maps over MainHeadingDetailData, supplementMainHeading and RNDetailData, built on first use.
+
+    nodeStatisticsData: DataFrame or None
+        node statistics of each main heading and category, see getNodeStatistics.
+
+    descendantTotal: Series or None
+        number of descendants of each main heading in all its categories, indexed by MeSH ID.
     """
 
+    # data caches are kept in the shared dataStore, so all objects in one process load the data only once
+    parChdRelData = storeProperty(name="parChdRelData")
+    MainHeadingDetailData = storeProperty(name="MainHeadingDetailData")
+    RNDetailData = storeProperty(name="RNDetailData")
+    supplementMainHeadingData = storeProperty(name="supplementMainHeadingData")
+    RNRBRelData = storeProperty(name="RNRBRelData")
+    parChdRelDataInCategory = storeProperty(name="parChdRelDataInCategory", default=dict)
+    RNRBRelDataInCategory = storeProperty(name="RNRBRelDataInCategory", default=dict)
+    offspringAncestorDataInCategory = storeProperty(name="offspringAncestorDataInCategory", default=dict)
+    MainHeadingDetailDataInCategory = storeProperty(name="MainHeadingDetailDataInCategory", default=dict)
+    keyIndex = storeProperty(name="keyIndex", default=dict)
+    resolver = storeProperty(name="resolver")
+    nodeStatisticsData = storeProperty(name="nodeStatisticsData")
+    descendantTotal = storeProperty(name="descendantTotal")
+
     def __init__(self):
         dataHandle.__init__(self)
-        self.parChdRelData = None
-        self.MainHeadingDetailData = None
-        self.RNDetailData = None
-        self.RNRBRelData = None
-        self.parChdRelDataInCategory = {}
-        self.RNRBRelDataInCategory = {}
-        self.offspringAncestorDataInCategory = {}
-        self.MainHeadingDetailDataInCategory = {}
 
     def checkDui(self, dui=None):
         """Check the MeSH ID, if it is legal.
@@ -89,6 +117,140 @@ class duiFunc(dataHandle):
             return True
         return False
 
+    def _getCacheData(self, data=None):
+        """Get MainHeadingDetailData, RNDetailData or supplementMainHeading from cache, load it on first use.
+
+        **parameter**
+
+        data: String
+            One of the value in ("MainHeadingDetailData", "RNDetailData", "supplementMainHeading").
+
+        **return**
+
+        DataFrame object
+        """
+        if data == "MainHeadingDetailData":
+            if self.MainHeadingDetailData is None:
+                self.MainHeadingDetailData = self.getMainHeadingDetailData()
+            return self.MainHeadingDetailData
+        if data == "RNDetailData":
+            if self.RNDetailData is None:
+                self.RNDetailData = self.getRNDetailData()
+            return self.RNDetailData
+        if data == "supplementMainHeading":
+            if self.supplementMainHeadingData is None:
+                self.supplementMainHeadingData = self.getSupplementMainHeadingData()
+            return self.supplementMainHeadingData
+        sys.stderr.write("error: the data %s is not in our data\n" % data)
+        exit(1)
+
+    def _getKeyIndex(self, data=None, queryCol=None):
+        """Get the key to row-range index of one column, build it on first use.
+
+        | Rows are ordered by the key, so all rows of one key are in a range of the order array.
+
+        **parameter**
+
+        data: String
+            One of the value in ("MainHeadingDetailData", "RNDetailData", "supplementMainHeading").
+
+        queryCol: String
+            column name in the data.
+
+        **return**
+
+        tuple of (numpy array, dict)
+        """
+        if (data, queryCol) not in self.keyIndex:
+            df = self._getCacheData(data=data)
+            (codes, uniqKeys) = pd.factorize(df[queryCol].astype(str))
+            order = np.argsort(codes, kind="stable")
+            ends = np.cumsum(np.bincount(codes, minlength=len(uniqKeys)))
+            starts = ends - np.bincount(codes, minlength=len(uniqKeys))
+            ranges = dict(zip(list(uniqKeys), zip(starts.tolist(), ends.tolist())))
+            self.keyIndex[(data, queryCol)] = (order, ranges)
+        return self.keyIndex[(data, queryCol)]
+
+    def selectRows(self, key=None, queryCol=None, data=None):
+        """Select all rows whose queryCol value is key, by one index lookup.
+
+        **parameter**
+
+        key: String
+            MeSH ID, UMLS ID or tree code.
+
+        queryCol: String
+            column name in the data.
+
+        data: String
+            One of the value in ("MainHeadingDetailData", "RNDetailData").
+
+        **return**
+
+        None or DataFrame object
+        """
+        (order, ranges) = self._getKeyIndex(data=data, queryCol=queryCol)
+        if key not in ranges:
+            return None
+        (start, end) = ranges[key]
+        df = self._getCacheData(data=data)
+        return df.iloc[order[start:end]]
+
+    @staticmethod
+    def _rowsToRecord(rows=None):
+        """Convert rows of one concept to a dict, every value is the list of its unique values."""
+        record = {}
+        for col in rows.columns:
+            record[col] = list(set(rows[col]))
+        return record
+
+    def getRecordByDui(self, dui=None):
+        """Get all attributes of a MeSH concept by one lookup.
+
+        | Main heading concept is searched in MainHeadingDetailData.
+        | SCR concept is searched in RNDetailData.
+
+        **parameter**
+
+        dui: String
+            MeSH ID.
+
+        **return**
+
+        None or dict, key is column name, value is list of unique values.
+        """
+        if dui.startswith("D"):
+            rows = self.selectRows(key=dui, queryCol="MeSHID", data="MainHeadingDetailData")
+        elif dui.startswith("C"):
+            rows = self.selectRows(key=dui, queryCol="MeSHID", data="RNDetailData")
+        else:
+            rows = None
+        if rows is None:
+            sys.stderr.write("Your string %s is not in the data\n" % dui)
+            return None
+        return self._rowsToRecord(rows=rows)
+
+    def getRecordByCui(self, cui=None):
+        """Get all attributes of a UMLS concept by one lookup.
+
+        | MainHeadingDetailData is searched first, then RNDetailData.
+
+        **parameter**
+
+        cui: String
+            UMLS ID.
+
+        **return**
+
+        None or dict, key is column name, value is list of unique values.
+        """
+        rows = self.selectRows(key=cui, queryCol="UMLSID", data="MainHeadingDetailData")
+        if rows is None:
+            rows = self.selectRows(key=cui, queryCol="UMLSID", data="RNDetailData")
+        if rows is None:
+            return None
+        return self._rowsToRecord(rows=rows)
+
     def selectDataByDui(self, dui=None, selectCol=None, queryCol=None):
         """Selecting value in diffirent table.
 
@@ -108,29 +270,19 @@ class duiFunc(dataHandle):
         None or list
         """
         if dui.startswith("D"):
-            if self.MainHeadingDetailData is None:
-                df = self.getMainHeadingDetailData()
-                self.MainHeadingDetailData = df
-            else:
-                df = self.MainHeadingDetailData
+            rows = self.selectRows(key=dui, queryCol=queryCol, data="MainHeadingDetailData")
             # semantictype is a series
-            result = df[selectCol][df[queryCol] == dui]
-            if result.empty:
+            if rows is None:
                 sys.stderr.write("Your string %s is not in the data\n" % dui)
                 return None
-            return list(set(result))
+            return list(set(rows[selectCol]))
 
         if dui.startswith("C"):
-            if self.RNDetailData is None:
-                df = self.getRNDetailData()
-                self.RNDetailData = df
-            else:
-                df = self.RNDetailData
-            result = df[selectCol][df[queryCol] == dui]
-            if result.empty:
+            rows = self.selectRows(key=dui, queryCol=queryCol, data="RNDetailData")
+            if rows is None:
                 sys.stderr.write("your string %s is not in the data\n" % dui)
                 return None
-            return list(set(result))
+            return list(set(rows[selectCol]))
 
     def selectDataByCui(self, cui=None, selectCol=None, queryCol=None):
         """Select value in diffirent pandas dataframe, not suggestion.
@@ -151,29 +303,18 @@ class duiFunc(dataHandle):
         None or list
         """
         # retrive TreeSubnodeDetailData
-        if self.MainHeadingDetailData is None:
-            df = self.getMainHeadingDetailData()
-            self.MainHeadingDetailData = df
-        else:
-            df = self.MainHeadingDetailData
-
-        result = df[selectCol][df[queryCol] == cui]
-        if result.empty:
+        rows = self.selectRows(key=cui, queryCol=queryCol, data="MainHeadingDetailData")
+        if rows is None:
             if selectCol == "Tree_Code":
                 return None
             # retrive RNdetailData
-            if self.RNDetailData is None:
-                df = self.getRNDetailData()
-                self.RNDetailData = df
-            else:
-                df = self.RNDetailData
-            result = df[selectCol][df[queryCol] == cui]
-            if result.empty:
+            rows = self.selectRows(key=cui, queryCol=queryCol, data="RNDetailData")
+            if rows is None:
                 #sys.stderr.write("the string %s not in the MeSH data\n" % cui)
                 return None
-            return list(set(result))
+            return list(set(rows[selectCol]))
         else:
-            return list(set(result))
+            return list(set(rows[selectCol]))
 
     def getSemanticType(self, dui=None, cui=None):
         """Useing mesh ID or UMLS ID to get the concept semantic type.
@@ -288,17 +429,7 @@ class duiFunc(dataHandle):
             sys.stderr.write("this is an invalid UMLS ID\n")
             exit(1)
 
-        result = self.selectDataByCui(cui=cui, selectCol="MeSHID", queryCol="UMLSID")
-        if result is None:
-            MeSHID = self._queryDataInSupplementData(cui=cui)
-            if MeSHID is None:
-                MeSHID = self._queryDataInRNDetailData(cui=cui)
-                return MeSHID
-            else:
-                return MeSHID
-        else:
-            MeSHID = result[0]
-            return MeSHID
+        return self.getIDResolver().cuiToDui.get(cui)
 
     def _queryDataInSupplementData(self, cui=None):
         """Query MeSH ID by UMLS ID in supplementMainHeadingData."""
@@ -306,14 +437,11 @@ class duiFunc(dataHandle):
         if not self.checkCui(cui=cui):
             sys.stderr.write("this is an invalid UMLS ID\n")
             exit(1)
-        df1 = self.getSupplementMainHeadingData()
-        result = df1["MeSHID"][df1["UMLSID"] == cui]
-        if result.empty:
+        rows = self.selectRows(key=cui, queryCol="UMLSID", data="supplementMainHeading")
+        if rows is None:
             return None
         else:
-            MeSHID = list(set(result))[0]
-            # print(MeSHID)
-            # exit(1)
+            MeSHID = list(set(rows["MeSHID"]))[0]
             return MeSHID
 
     def _queryDataInRNDetailData(self, cui=None):
@@ -322,14 +450,52 @@ class duiFunc(dataHandle):
         if not self.checkCui(cui=cui):
             sys.stderr.write("this is an invalid UMLS ID\n")
             exit(1)
-        df1 = self.getRNDetailData()
-        result = df1["MeSHID"][df1["UMLSID"] == cui]
-        if result.empty:
+        rows = self.selectRows(key=cui, queryCol="UMLSID", data="RNDetailData")
+        if rows is None:
             return None
         else:
-            MeSHID = list(set(result))[0]
+            MeSHID = list(set(rows["MeSHID"]))[0]
             return MeSHID
 
+    def getIDResolver(self):
+        """Get the identifier resolver, it is built once from the three concept tables.
+
+        **return**
+
+        IDResolver object
+        """
+        if self.resolver is None:
+            self.resolver = IDResolver(MHData=self._getCacheData(data="MainHeadingDetailData"),
+                                       supplementData=self._getCacheData(data="supplementMainHeading"),
+                                       RNData=self._getCacheData(data="RNDetailData"))
+        return self.resolver
+
+    def resolveIDs(self, values=None, source=None, target=None):
+        """Map a list of identifiers to another type of identifier in one call.
+
+        | eg. resolveIDs(values=["C0011849", "C0020538"], source="cui", target="dui").
+
+        **parameter**
+
+        values: list
+            list of identifier.
+
+        source: String
+            type of values, one of the value in ("cui", "dui", "treeCode", "name").
+
+        target: String
+            type of the result, one of the value in ("cui", "dui", "treeCode", "name").
+
+        **return**
+
+        list, None for the identifier not in the data.
+
+        **see also**
+
+        pyMeSHSim.data.IDResolver
+        """
+        return self.getIDResolver().resolveBatch(values=values, source=source, target=target)
+
     def getUMLSIDbyMeSHID(self, dui=None):
         """Get UMLS ID from MeSH ID.
 
@@ -439,17 +605,11 @@ class duiFunc(dataHandle):
                 sys.stderr.write("this is an invalid MeSH ID\n")
                 exit(1)
             if dui.startswith("D"):
-                if self.MainHeadingDetailData is None:
-                    df = self.getMainHeadingDetailData()
-                    self.MainHeadingDetailData = df
-                else:
-                    df = self.MainHeadingDetailData
-                # semantictype is a series
-                result = df["Category"][df["MeSHID"] == dui]
-                if result.empty:
+                rows = self.selectRows(key=dui, queryCol="MeSHID", data="MainHeadingDetailData")
+                if rows is None:
                     sys.stderr.write("your string %s is not in the data\n" % dui)
                     return None
-                return list(set(result))
+                return list(set(rows["Category"]))
 
             if dui.startswith("C"):
                 if self.RNRBRelData is None:
@@ -481,16 +641,11 @@ class duiFunc(dataHandle):
         regx = re.compile("^[A-Z][0-9][0-9](\.[0-9][0-9][0-9])*$")
         result = regx.match(treeCode)
         if result:
-            if self.MainHeadingDetailData is None:
-                df = self.getMainHeadingDetailData()
-                self.MainHeadingDetailData = df
-            else:
-                df = self.MainHeadingDetailData
-            result = df["MeSHID"][df["Tree_Code"] == treeCode]
-            if result.empty:
+            rows = self.selectRows(key=treeCode, queryCol="Tree_Code", data="MainHeadingDetailData")
+            if rows is None:
                 sys.stderr.write("your string %s is not in the data\n" % treeCode)
                 return None
-            return list(set(result))[0]
+            return list(set(rows["MeSHID"]))[0]
         else:
             sys.stderr.write("this is an invalid tree code\n")
             exit(1)
@@ -525,6 +680,62 @@ class duiFunc(dataHandle):
         else:
             return result[0]
 
+    def getNodeStatistics(self, duis=None, category=None):
+        """Get the node statistics of main headings.
+
+        | Descendant_Count, Depth and Tree_Positions are computed when the data is built,
+        | and stored in table MainHeadingDetailData, see pyMeSHSim.data.treeStatistics.nodeStatistics.
+        | For the data built without these columns, they are computed on first use.
+
+        **parameter**
+
+        duis: list or None
+            MeSH ID, None means all main headings.
+
+        category: String or None
+            one category abbreviation, None means all categories.
+
+        **return**
+
+        DataFrame with columns "MeSHID", "Category", "Descendant_Count", "Depth", "Tree_Positions",
+        one row for each MeSH ID and category.
+        """
+        if self.nodeStatisticsData is None:
+            df = self._getCacheData(data="MainHeadingDetailData")
+            if "Descendant_Count" in df.columns:
+                stats = df[["MeSHID", "Category", "Descendant_Count", "Depth", "Tree_Positions"]]
+                stats = stats.drop_duplicates(["MeSHID", "Category"])
+            else:
+                stats = nodeStatistics(MHData=df)
+            self.nodeStatisticsData = stats.reset_index(drop=True)
+        stats = self.nodeStatisticsData
+        if category is not None:
+            stats = stats[stats["Category"] == category]
+        if duis is not None:
+            stats = stats[stats["MeSHID"].isin(list(duis))]
+        return stats
+
+    def getDescendantCount(self, duis=None):
+        """Get the number of descendants of many MeSH ID by one vectorized lookup.
+
+        | The descendants in all categories of a concept are added up, a concept in k categories
+        | is counted k - 1 times, the same as the descendant list of metamapFilter.discardNodeHigh.
+        | The concept not in MainHeadingDetailData, eg. supplementary concept, has no descendant.
+
+        **parameter**
+
+        duis: list
+            MeSH ID.
+
+        **return**
+
+        numpy array of int, in the order of duis.
+        """
+        if self.descendantTotal is None:
+            stats = self.getNodeStatistics()
+            self.descendantTotal = (stats["Descendant_Count"] + 1).groupby(stats["MeSHID"]).sum() - 1
+        return self.descendantTotal.reindex(list(duis)).fillna(0).astype(np.int64).to_numpy()
+
     def getAllMHsConceptInOneCategory(self, category=None):
         """Get all MHs in one category."""
         if category not in self.MainHeadingDetailDataInCategory:
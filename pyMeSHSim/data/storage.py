@@ -0,0 +1,263 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Storage backends of the MeSH tables.
+
+| A table is a directory, it can be stored in two formats:
+| "bcolz": the compressed bcolz ctable.
+| "npy": one memory-mapped .npy file for each column, attrs in __attrs__.json, column names in __names__.json.
+| The npy format is read without decompression, the pages are loaded by the OS on first access,
+| so processes on one host share the page cache.
+"""
+import json
+import os
+import shutil
+import sys
+import numpy as np
+
+# string column wider than this is stored as utf-8 bytes plus offsets, instead of fixed-width unicode
+MAX_FIXED_WIDTH = 16
+
+
+class bcolzTable(object):
+    """This class reads a bcolz ctable.
+
+    **parameter**
+
+    rootdir: String
+        the table directory.
+
+    **attribute**
+
+    names: list
+        column names.
+
+    attrs: dict
+        the attrs of the table.
+    """
+    format = "bcolz"
+
+    def __init__(self, rootdir=None):
+        import bcolz as bz
+        self.table = bz.open(rootdir=rootdir, mode="r")
+        self.names = list(self.table.names)
+        self.attrs = dict(self.table.attrs)
+
+    def __len__(self):
+        return len(self.table)
+
+    def readColumn(self, name=None, start=None, end=None):
+        """Read rows [start, end) of one column, only the chunks covering them are decompressed."""
+        return self.table.cols[name][start: end]
+
+
+class npyTable(object):
+    """This class reads a table stored as memory-mapped npy columns.
+
+    | Numeric and short string columns are one .npy file, read as a view of the mapped file.
+    | Long string columns are a .offsets.npy and a .data.npy file of utf-8 bytes, only the rows read are decoded.
+
+    **parameter**
+
+    rootdir: String
+        the table directory.
+
+    **attribute**
+
+    names: list
+        column names.
+
+    attrs: dict
+        the attrs of the table.
+    """
+    format = "npy"
+
+    def __init__(self, rootdir=None):
+        self.rootdir = rootdir
+        with open(os.path.join(rootdir, "__names__.json")) as handle:
+            meta = json.load(handle)
+        self.names = meta["names"]
+        self.kinds = meta["kinds"]
+        self.length = meta["length"]
+        with open(os.path.join(rootdir, "__attrs__.json")) as handle:
+            self.attrs = json.load(handle)
+        self.columns = {}
+
+    def __len__(self):
+        return self.length
+
+    def _load(self, fileName=None):
+        if fileName not in self.columns:
+            self.columns[fileName] = np.load(os.path.join(self.rootdir, fileName), mmap_mode="r")
+        return self.columns[fileName]
+
+    def readColumn(self, name=None, start=None, end=None):
+        """Read rows [start, end) of one column."""
+        if self.kinds[name] == "fixed":
+            return self._load(fileName=name + ".npy")[start: end]
+        offsets = self._load(fileName=name + ".offsets.npy")
+        data = self._load(fileName=name + ".data.npy")
+        (start, end, step) = slice(start, end).indices(self.length)
+        pos = offsets[start: end + 1]
+        raw = data[pos[0]: pos[-1]].tobytes()
+        rel = (pos - pos[0]).tolist()
+        values = np.empty(end - start, dtype=object)
+        values[:] = [raw[rel[i]: rel[i + 1]].decode("utf-8") for i in range(end - start)]
+        return values
+
+
+def tableFormat(rootdir=None):
+    """Get the storage format of a table directory, "npy" or "bcolz"."""
+    if os.path.exists(os.path.join(rootdir, "__names__.json")):
+        return "npy"
+    return "bcolz"
+
+
+def openTable(rootdir=None):
+    """Open a table in read mode, the format is detected from the directory.
+
+    **return**
+
+    bcolzTable or npyTable object
+    """
+    if tableFormat(rootdir=rootdir) == "npy":
+        return npyTable(rootdir=rootdir)
+    return bcolzTable(rootdir=rootdir)
+
+
+def _jsonValue(value=None):
+    """Convert numpy value in attrs to python value."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError("%r is not JSON serializable" % value)
+
+
+def _columnArray(values=None):
+    """Convert a column to a numeric or fixed-width unicode numpy array."""
+    if values.dtype.kind in "biuf":
+        return np.ascontiguousarray(values)
+    return values.astype(str)
+
+
+def _writeNpy(df=None, rootdir=None, attrs=None):
+    """Write a DataFrame as npy columns, the directory is replaced."""
+    if os.path.exists(rootdir):
+        shutil.rmtree(rootdir)
+    os.makedirs(rootdir)
+    kinds = {}
+    for name in df.columns:
+        values = _columnArray(values=df[name].to_numpy())
+        if values.dtype.kind != "U" or values.dtype.itemsize // 4 <= MAX_FIXED_WIDTH:
+            np.save(os.path.join(rootdir, name + ".npy"), values)
+            kinds[name] = "fixed"
+            continue
+        encoded = [value.encode("utf-8") for value in values.tolist()]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        np.save(os.path.join(rootdir, name + ".offsets.npy"), offsets)
+        np.save(os.path.join(rootdir, name + ".data.npy"), np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        kinds[name] = "varlen"
+    with open(os.path.join(rootdir, "__names__.json"), "w") as handle:
+        json.dump({"names": list(df.columns), "kinds": kinds, "length": len(df)}, handle)
+    with open(os.path.join(rootdir, "__attrs__.json"), "w") as handle:
+        json.dump(attrs, handle, default=_jsonValue)
+
+
+def writeTable(df=None, rootdir=None, attrs=None, storage="bcolz"):
+    """Write a DataFrame as a table, an existing table in rootdir is replaced.
+
+    **parameter**
+
+    df: DataFrame
+
+    rootdir: String
+        the table directory.
+
+    attrs: dict or None
+        attrs of the table, values must be json serializable.
+
+    storage: String
+        One of the value in ("bcolz", "npy").
+    """
+    if attrs is None:
+        attrs = {}
+    if storage == "npy":
+        _writeNpy(df=df, rootdir=rootdir, attrs=attrs)
+    elif storage == "bcolz":
+        import bcolz as bz
+        # string columns are written as fixed-width unicode, not python objects
+        columns = [_columnArray(values=df[name].to_numpy()) for name in df.columns]
+        bz1 = bz.ctable(columns=columns, names=list(df.columns), rootdir=rootdir, mode="w")
+        for (name, value) in attrs.items():
+            bz1.attrs[name] = value
+        bz1.flush()
+    else:
+        sys.stderr.write("error: the storage %s is not supported\n" % storage)
+        exit(1)
+
+
+def setTableAttr(rootdir=None, name=None, value=None):
+    """Set one attr of an existing table."""
+    if tableFormat(rootdir=rootdir) == "npy":
+        path = os.path.join(rootdir, "__attrs__.json")
+        with open(path) as handle:
+            attrs = json.load(handle)
+        attrs[name] = value
+        with open(path, "w") as handle:
+            json.dump(attrs, handle, default=_jsonValue)
+    else:
+        import bcolz as bz
+        bz1 = bz.open(rootdir=rootdir, mode="a")
+        bz1.attrs[name] = value
+        bz1.flush()
+
+
+def convertTable(source=None, target=None, storage="npy"):
+    """Convert one table to another storage format.
+
+    **parameter**
+
+    source: String
+        the table directory to read, in any format.
+
+    target: String
+        the table directory to write.
+
+    storage: String
+        One of the value in ("bcolz", "npy").
+    """
+    import pandas as pd
+    table = openTable(rootdir=source)
+    df = pd.DataFrame(dict((name, table.readColumn(name=name)) for name in table.names), columns=table.names)
+    attrs = dict((name, table.attrs[name]) for name in table.attrs)
+    writeTable(df=df, rootdir=target, attrs=attrs, storage=storage)
+
+
+def convertData(source=None, target=None, storage="npy"):
+    """Convert all tables in a data directory to another storage format.
+
+    | eg. convertData(source="pyMeSHSim/data/testData", target="/data/MeSHnpy"),
+    | then set the environment variable PYMESHSIM_DATA_PATH to "/data/MeSHnpy" to use it.
+
+    **parameter**
+
+    source: String
+        the directory contains all tables.
+
+    target: String
+        the directory to write all tables.
+
+    storage: String
+        One of the value in ("bcolz", "npy").
+    """
+    if not os.path.exists(target):
+        os.makedirs(target)
+    for name in sorted(os.listdir(source)):
+        path = os.path.join(source, name)
+        if not os.path.isdir(path):
+            continue
+        sys.stderr.write("converting table %s\n" % name)
+        convertTable(source=path, target=os.path.join(target, name), storage=storage)
@@ -0,0 +1,123 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Closure of the MeSH hierarchy and the node statistics of main headings.
+
+| These functions only need MainHeadingDetailData, so the data builders and duiFunc use them
+| without the similarity modules. pyMeSHSim.Sim.TreeCodeIndex builds its ancestor bitsets with packAncestors.
+"""
+import numpy as np
+import pandas as pd
+
+
+def packAncestors(edges=None, size=None):
+    """Get the packed ancestor bitset of a directed acyclic graph.
+
+    | Rows are filled from the top concepts down,
+    | each row is the union of the rows of its direct parents and the parents themselves.
+
+    **parameter**
+
+    edges: numpy array
+        unique (child, parent) pairs of node index, shape (number of edges, 2), no self loop.
+
+    size: int
+        number of nodes.
+
+    **return**
+
+    uint64 array of shape (size, number of 64 bit words), bit j of row i is set if j is a proper ancestor of i.
+    """
+    words = (size + 63) // 64
+    bits = np.zeros((size, words), dtype=np.uint64)
+    # visit a node after all its parents, so the rows of the parents are complete
+    order = np.argsort(edges[:, 1], kind="stable")
+    childOffset = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edges[:, 1], minlength=size), out=childOffset[1:])
+    children = edges[order, 0].tolist()
+    childOffset = childOffset.tolist()
+    pending = np.bincount(edges[:, 0], minlength=size).tolist()
+    stack = [i for i in range(size) if pending[i] == 0]
+    while stack:
+        node = stack.pop()
+        row = bits[node].copy()
+        row[node >> 6] |= np.uint64(1 << (node & 63))
+        for i in range(childOffset[node], childOffset[node + 1]):
+            item = children[i]
+            bits[item] |= row
+            pending[item] -= 1
+            if pending[item] == 0:
+                stack.append(item)
+    return bits
+
+
+def countDescendants(bits=None):
+    """Count the rows with each bit set, it is the number of descendants of each node of packAncestors.
+
+    **return**
+
+    numpy array of int, one value for each row of bits.
+    """
+    counts = np.zeros(bits.shape[1] * 64, dtype=np.int64)
+    step = max(1, 2**24 // max(1, counts.size))
+    for start in range(0, len(bits), step):
+        block = np.unpackbits(bits[start: start + step].view(np.uint8), axis=1, bitorder="little")
+        counts += block.sum(axis=0, dtype=np.int64)
+    return counts[0: len(bits)]
+
+
+def nodeStatistics(MHData=None):
+    """Get the node statistics of every main heading in each of its category.
+
+    | Descendant_Count: number of descendants in the category, the same as getDescendant without the concept itself.
+    | Depth: depth of the highest tree code in the category, a top tree code such as "C04" has depth 1.
+    | Tree_Positions: number of tree codes in the category.
+
+    **parameter**
+
+    MHData: DataFrame
+        MainHeadingDetailData, it has columns "MeSHID", "Tree_Code", "Category".
+
+    **return**
+
+    DataFrame with columns "MeSHID", "Category", "Descendant_Count", "Depth", "Tree_Positions",
+    one row for each MeSH ID and category.
+    """
+    codes = MHData["Tree_Code"].to_numpy(dtype=str)
+    owners = MHData["MeSHID"].to_numpy(dtype=str)
+    frame = pd.DataFrame({"MeSHID": owners, "Category": MHData["Category"].to_numpy(), "Tree_Code": codes,
+                          "Depth": (np.char.count(codes, ".") + 1).astype(np.int32)})
+    stats = frame.groupby(["MeSHID", "Category"], sort=False).agg(Depth=("Depth", "min"),
+                                                                  Tree_Positions=("Tree_Code", "nunique"))
+    stats = stats.reset_index()
+
+    # direct parent-child relations between MeSH ID, through any tree code
+    codeOwner = dict(zip(codes.tolist(), owners.tolist()))
+    duis = np.array(sorted(set(codeOwner.values())), dtype=str)
+    child = []
+    parent = []
+    for (code, dui) in codeOwner.items():
+        pos = code.rfind(".")
+        if pos >= 0 and code[0: pos] in codeOwner:
+            child.append(dui)
+            parent.append(codeOwner[code[0: pos]])
+    child = np.searchsorted(duis, np.array(child, dtype=str))
+    parent = np.searchsorted(duis, np.array(parent, dtype=str))
+    letters = np.array([code[0: 1] for code in codeOwner])
+    codeDuis = np.searchsorted(duis, np.array(list(codeOwner.values()), dtype=str))
+
+    stats["Descendant_Count"] = 0
+    for category in stats["Category"].unique():
+        # a relation is in the category when both MeSH ID have a tree code in it
+        local = np.full(len(duis), -1, dtype=np.int64)
+        members = np.unique(codeDuis[letters == category])
+        local[members] = np.arange(len(members))
+        (c, p) = (local[child], local[parent])
+        keep = (c >= 0) & (p >= 0) & (c != p)
+        edges = np.unique(np.stack([c[keep], p[keep]], axis=1), axis=0).reshape(-1, 2)
+        counts = np.zeros(len(duis), dtype=np.int64)
+        counts[members] = countDescendants(bits=packAncestors(edges=edges, size=len(members)))
+        rows = (stats["Category"] == category).to_numpy()
+        stats.loc[rows, "Descendant_Count"] = counts[np.searchsorted(duis, stats["MeSHID"][rows].to_numpy())]
+    return stats[["MeSHID", "Category", "Descendant_Count", "Depth", "Tree_Positions"]]
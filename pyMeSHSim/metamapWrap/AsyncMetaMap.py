@@ -0,0 +1,194 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import asyncio
+import functools
+import os
+import sys
+import threading
+import weakref
+
+from .MetaMapSession import MetaMapSessionError
+
+
+class AsyncMetaMap(object):
+    """This class runs MetaMap as asyncio subprocesses, so many texts are processed from one event loop.
+
+    | The text is written to the stdin of MetaMap and its result is read from stdout, no temporary file is used.
+    | At most concurrency MetaMap processes run at the same time, the other texts wait for a free slot.
+    | A MetaMap which gives no result in timeout seconds, or whose task is cancelled, is killed.
+    | The cache and the parser of the results, which loads the MeSH data at its first use, run in the default
+    | executor, so they don't block the event loop.
+    | The MetaMap servers should have been started, see MetaMap.startMetaMap.
+
+    eg.
+
+        annotator = AsyncMetaMap(path="/home/UMLS/public_mm/bin/metamap16", concurrency=8)
+        concepts = await annotator.annotate(text="lung cancer")
+
+    **parameter**
+
+    path: String
+        metamap path, eg. "/home/Project/UMLS/public_mm/bin/metamap16".
+
+    concurrency: int
+        the max number of running MetaMap processes.
+
+    timeout: int or float or None
+        seconds to wait for the result of one text, None means no limit.
+
+    cache: MetaMapCache object or None
+        | the texts found in it are not sent to MetaMap, and the new results are stored in it.
+        | default: None.
+
+    options: keyword arguments
+        MetaMap options, the same as runMetaMap, eg. source, semantic_types, conjunction.
+
+    **see also**
+
+    | pyMeSHSim.metamapWrap.MetamapInterface.MetaMap.runMetaMap
+    | pyMeSHSim.metamapWrap.MetaMapSession
+    """
+
+    def __init__(self, path=None, concurrency=4, timeout=60, cache=None, **options):
+        from .MetamapInterface import MetaMap
+        self.metamap = MetaMap(path=path)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.cache = cache
+        # MetaMap reads stdin and writes stdout when no file is given, one line is one record with --sldi
+        options["sldi"] = True
+        options["sldiID"] = False
+        self.command = [self.metamap.metamap] + self.metamap._buildOptions(**options)
+        self.cacheOptions = [os.path.basename(self.command[0])] + self.command[1:]
+        # a semaphore belongs to one event loop, each loop which uses this object has its own, see _getSemaphore
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._parseLock = threading.Lock()
+
+    def _getSemaphore(self):
+        """Get the semaphore of the running event loop, it limits the running MetaMap processes."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    @staticmethod
+    async def _inThread(func=None, **kwargs):
+        """Run a blocking function in the default executor of the running event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, **kwargs))
+
+    def _parse(self, output=None):
+        """Parse the output of MetaMap into concept dicts, one thread at a time."""
+        from .MetamapInterface import MetaMap
+        with self._parseLock:
+            return [item.toDict() for item in MetaMap.iterMMI(text_handle=output.splitlines())]
+
+    async def annotate(self, text=None):
+        """Annotate one text.
+
+        **parameter**
+
+        text: String
+            free text, the line breaks are replaced by space, so it is one record.
+
+        **return**
+
+        list of concept dict, the same as MetaMap.runMetaMap.
+
+        MetaMapSessionError is raised if MetaMap fails or gives no result in timeout seconds.
+        """
+        if text is None or not isinstance(text, str):
+            sys.stderr.write("text must be string\n")
+            exit(1)
+        record = " ".join(text.split())
+        if record == "":
+            return []
+        cacheKey = None
+        if self.cache is not None:
+            cacheKey = self.cache.makeKey(text=record, options=self.cacheOptions)
+            concepts = await self._inThread(func=self.cache.get, key=cacheKey)
+            if concepts is not None:
+                return concepts
+        return await self._annotateRecord(record=record, cacheKey=cacheKey)
+
+    async def _annotateRecord(self, record=None, cacheKey=None):
+        """Run MetaMap for a record which is not in the cache, and store its result."""
+        async with self._getSemaphore():
+            output = await self._run(record=record)
+        concepts = await self._inThread(func=self._parse, output=output)
+        if self.cache is not None:
+            await self._inThread(func=self.cache.put, key=cacheKey, concepts=concepts)
+        return concepts
+
+    async def _run(self, record=None):
+        """Run one MetaMap process for one record, and kill it on timeout or cancellation.
+
+        **return**
+
+        String, the output of MetaMap.
+        """
+        process = await asyncio.create_subprocess_exec(*self.command, stdin=asyncio.subprocess.PIPE,
+                                                       stdout=asyncio.subprocess.PIPE,
+                                                       stderr=asyncio.subprocess.DEVNULL)
+        try:
+            (stdout, _) = await asyncio.wait_for(process.communicate(input=(record + "\n").encode("utf-8")),
+                                                 timeout=self.timeout)
+        except asyncio.TimeoutError:
+            await self._kill(process=process)
+            raise MetaMapSessionError("MetaMap gives no result in %s seconds" % self.timeout)
+        except BaseException:
+            # cancelled by the caller
+            await self._kill(process=process)
+            raise
+        if process.returncode != 0:
+            raise MetaMapSessionError("MetaMap exits with code %s" % process.returncode)
+        return stdout.decode("utf-8", errors="replace")
+
+    @staticmethod
+    async def _kill(process=None):
+        """Kill a MetaMap process and wait for it, so no zombie is left."""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
+    async def annotateMany(self, texts=None, returnExceptions=False):
+        """Annotate many texts concurrently, each distinct text is run once.
+
+        **parameter**
+
+        texts: list
+            free texts.
+
+        returnExceptions: True or False
+            | False: the first error is raised.
+            | True: the error of a text is returned in place of its result.
+
+        **return**
+
+        list of the result of each text, in the order of texts.
+        """
+        for text in texts:
+            if text is None or not isinstance(text, str):
+                sys.stderr.write("text must be string\n")
+                exit(1)
+        records = [" ".join(text.split()) for text in texts]
+        uniqRecords = [record for record in set(records) if record != ""]
+        found = {}
+        keys = {}
+        if self.cache is not None:
+            keys = {record: self.cache.makeKey(text=record, options=self.cacheOptions) for record in uniqRecords}
+            # one query for all texts
+            cached = await self._inThread(func=self.cache.getMany, keys=list(keys.values()))
+            found = {record: cached[key] for (record, key) in keys.items() if key in cached}
+        missing = [record for record in uniqRecords if record not in found]
+        results = await asyncio.gather(*[self._annotateRecord(record=record, cacheKey=keys.get(record))
+                                         for record in missing], return_exceptions=returnExceptions)
+        found.update(zip(missing, results))
+        found[""] = []
+        return [found[record] for record in records]
@@ -0,0 +1,287 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Annotate a large corpus with a pool of MetaMap workers.
+
+| The input is in sldiID format, one record per line, "id|text".
+| Each worker process keeps one MetaMap session alive, see pyMeSHSim.metamapWrap.MetaMapSession.
+| The result is written as JSON lines, {"id": record id, "concepts": list of concept dict},
+| the output file is also the checkpoint, the records already in it are skipped when the job is run again.
+
+eg.
+
+    python -m pyMeSHSim.metamapWrap.BatchAnnotator --metamap /home/UMLS/public_mm/bin/metamap16 \\
+        --workers 16 abstracts.txt abstracts.jsonl
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+
+from .Concept import Concept
+from .MetaMapCache import MetaMapCache
+from .MetaMapSession import MetaMapSessionError
+
+# MetaMap session of the worker process, and the arguments to open it, set by _initWorker
+_workerSession = None
+_workerArgs = None
+
+
+def readRecords(path=None, textConvert=False):
+    """Read the records of a sldiID format file.
+
+    **parameter**
+
+    path: String
+        input file, each line is "id|text", the line without "|" or text is skipped.
+
+    textConvert: True or False
+        | replace the "|" in text by space.
+        | default False, the text is everything after the first "|".
+
+    **return**
+
+    generator of tuple (id, text)
+    """
+    with open(path) as handle:
+        for line in handle:
+            line = line.rstrip("\n")
+            pos = line.find("|")
+            if pos <= 0:
+                continue
+            text = line[pos + 1:]
+            if textConvert:
+                text = text.replace("|", " ")
+            if text.strip() == "":
+                continue
+            yield (line[0: pos], text)
+
+
+def readCheckpoint(path=None):
+    """Get the record id in an output file, an incomplete last line of a crashed job is removed.
+
+    | A line is complete only with its "\n", a crash can split the write of a valid JSON line and its "\n",
+    | then the results of the next run would be appended to that line.
+
+    **return**
+
+    set of string
+    """
+    done = set()
+    if not os.path.exists(path):
+        return done
+    validSize = 0
+    with open(path, "rb") as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                done.add(json.loads(line.decode("utf-8"))["id"])
+            except (ValueError, KeyError):
+                break
+            validSize = validSize + len(line)
+    if validSize < os.path.getsize(path):
+        sys.stderr.write("remove the incomplete result at the end of %s\n" % path)
+        with open(path, "rb+") as handle:
+            handle.truncate(validSize)
+    return done
+
+
+def _openWorkerSession():
+    """Open the MetaMap session of the worker process, if it is not open."""
+    global _workerSession
+    if _workerSession is None:
+        from .MetamapInterface import MetaMap
+        (path, options) = _workerArgs
+        options = dict(options)
+        # each worker opens its own connection to the shared cache file
+        cachePath = options.pop("cachePath", None)
+        if cachePath is not None:
+            options["cache"] = MetaMapCache(path=cachePath)
+        _workerSession = MetaMap(path=path).openSession(**options)
+    return _workerSession
+
+
+def _initWorker(path=None, options=None):
+    """Start the MetaMap session of one worker process.
+
+    | If MetaMap is not ready, the worker still starts, the session is opened again for the next record,
+    | so the pool doesn't restart the worker again and again.
+    """
+    global _workerArgs
+    _workerArgs = (path, options)
+    try:
+        _openWorkerSession()
+    except MetaMapSessionError as e:
+        sys.stderr.write("worker %d: %s\n" % (os.getpid(), e))
+
+
+def _annotateRecord(record=None):
+    """Annotate one record in a worker process.
+
+    **return**
+
+    tuple of (id, list of concept dict or None, error message or None)
+    """
+    (recordID, text) = record
+    try:
+        return (recordID, _openWorkerSession().annotate(text=text), None)
+    except MetaMapSessionError as e:
+        return (recordID, None, str(e))
+
+
+class BatchAnnotator(object):
+    """This class shards the records of a corpus across a pool of MetaMap worker processes.
+
+    | Each worker starts MetaMap once and annotates many records through its session,
+    | so the throughput grows with the number of workers, until the cores or the MetaMap servers are busy.
+
+    **parameter**
+
+    path: String
+        metamap path, eg. "/home/Project/UMLS/public_mm/bin/metamap16".
+
+    workers: int
+        number of worker processes, default the number of cores.
+
+    ordered: True or False
+        | True: results are returned in the order of the records.
+        | False: results are returned as they complete, a slow record doesn't block the others.
+
+    chunksize: int
+        records sent to a worker at one time.
+
+    options: keyword arguments
+        | options of MetaMap.openSession, eg. semantic_types, timeout.
+        | cachePath: a MetaMapCache file shared by all workers, repeated texts are sent to MetaMap once.
+
+    **see also**
+
+    | pyMeSHSim.metamapWrap.MetamapInterface.MetaMap.openSession
+    | pyMeSHSim.metamapWrap.MetaMapSession
+    """
+
+    def __init__(self, path=None, workers=None, ordered=True, chunksize=1, **options):
+        if path is None or path == "":
+            sys.stderr.write("metamap path can't be None\n")
+            exit(1)
+        self.path = path
+        self.workers = workers if workers is not None else multiprocessing.cpu_count()
+        self.ordered = ordered
+        self.chunksize = chunksize
+        self.options = options
+
+    @staticmethod
+    def _preloadData():
+        """Load the MeSH data used to parse the MetaMap results.
+
+        | It is loaded before the pool is created, so the forked workers share it instead of loading it again.
+        """
+        duiFunction = Concept.getDuiFunction()
+        duiFunction.getIDResolver()
+        duiFunction._getKeyIndex(data="MainHeadingDetailData", queryCol="MeSHID")
+
+    def annotate(self, records=None):
+        """Annotate the records.
+
+        **parameter**
+
+        records: iterable
+            tuple of (id, text), eg. readRecords(path).
+
+        **return**
+
+        generator of tuple (id, list of concept dict or None, error message or None)
+        """
+        self._preloadData()
+        pool = multiprocessing.Pool(processes=self.workers, initializer=_initWorker,
+                                    initargs=(self.path, self.options))
+        try:
+            if self.ordered:
+                results = pool.imap(_annotateRecord, records, chunksize=self.chunksize)
+            else:
+                results = pool.imap_unordered(_annotateRecord, records, chunksize=self.chunksize)
+            for result in results:
+                yield result
+        finally:
+            # a worker's MetaMap reads the end of its stdin and exits when the worker is terminated
+            pool.terminate()
+            pool.join()
+
+    def annotateFile(self, inputPath=None, outputPath=None, textConvert=False, flushEvery=100):
+        """Annotate a sldiID format file, and append the results to a JSON lines file.
+
+        | The records already in the output file are skipped, so a crashed job is resumed by running it again.
+        | The failed records are not written, they are tried again in the next run.
+
+        **parameter**
+
+        inputPath: String
+            input file, each line is "id|text".
+
+        outputPath: String
+            output file, each line is {"id": record id, "concepts": list of concept dict}.
+
+        textConvert: True or False
+            replace the "|" in text by space.
+
+        flushEvery: int
+            flush the output file after this number of results.
+
+        **return**
+
+        tuple of (number of annotated records, number of failed records)
+        """
+        done = readCheckpoint(path=outputPath)
+        if len(done) > 0:
+            sys.stderr.write("skip %d records in %s\n" % (len(done), outputPath))
+        records = (record for record in readRecords(path=inputPath, textConvert=textConvert)
+                   if record[0] not in done)
+        annotated = 0
+        failed = 0
+        with open(outputPath, "a") as handle:
+            for (recordID, concepts, error) in self.annotate(records=records):
+                if error is not None:
+                    sys.stderr.write("record %s failed: %s\n" % (recordID, error))
+                    failed = failed + 1
+                    continue
+                handle.write(json.dumps({"id": recordID, "concepts": concepts}) + "\n")
+                annotated = annotated + 1
+                if annotated % flushEvery == 0:
+                    handle.flush()
+        return (annotated, failed)
+
+
+def main(argv=None):
+    """Command line interface of BatchAnnotator."""
+    parser = argparse.ArgumentParser(description="Annotate a sldiID format corpus with a pool of MetaMap workers.")
+    parser.add_argument("input", help='input file, each line is "id|text"')
+    parser.add_argument("output", help="output JSON lines file, the records in it are skipped")
+    parser.add_argument("--metamap", required=True, help="metamap path, eg. public_mm/bin/metamap16")
+    parser.add_argument("--workers", type=int, default=None, help="number of MetaMap processes, default cores")
+    parser.add_argument("--unordered", action="store_true", help="write results as they complete")
+    parser.add_argument("--chunksize", type=int, default=1, help="records sent to a worker at one time")
+    parser.add_argument("--source", default="MSH", help="comma separated UMLS sources, default MSH")
+    parser.add_argument("--semantic-types", default=None, help="comma separated semantic types")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds to wait for one record")
+    parser.add_argument("--cache", default=None, help="MetaMap result cache file, shared by the workers")
+    parser.add_argument("--text-convert", action="store_true", help='replace "|" in text by space')
+    args = parser.parse_args(argv)
+
+    options = {"source": args.source.split(","), "timeout": args.timeout}
+    if args.semantic_types is not None:
+        options["semantic_types"] = args.semantic_types.split(",")
+    if args.cache is not None:
+        options["cachePath"] = args.cache
+    annotator = BatchAnnotator(path=args.metamap, workers=args.workers, ordered=not args.unordered,
+                               chunksize=args.chunksize, **options)
+    (annotated, failed) = annotator.annotateFile(inputPath=args.input, outputPath=args.output,
+                                                 textConvert=args.text_convert)
+    sys.stderr.write("annotated %d records, %d failed\n" % (annotated, failed))
+    return 1 if failed > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,20 @@ from ..data.duiFunc import duiFunc
 
 class Concept(object):
     """This is base class of MetaMap in metamapWrap."""
+
+    # duiFunc object shared by all concepts, its data caches are kept in the shared dataStore
+    _duiFunction = None
+
     def __init__(self, **entries):
         self.__dict__.update(entries)
 
+    @classmethod
+    def getDuiFunction(cls):
+        """Get the duiFunc object shared by all concepts."""
+        if Concept._duiFunction is None:
+            Concept._duiFunction = duiFunc()
+        return Concept._duiFunction
+
     def __str__(self):
         return str(self.__dict__)
 
@@ -47,7 +58,7 @@ class Concept(object):
                     'trigger', 'location', 'pos_info', 'tree_codes')
         d = dict(zip(mmi_name, mmi_array))
         if d["cui"] is not None:
-            duiFunction = duiFunc()
+            duiFunction = cls.getDuiFunction()
             MeSHID = duiFunction.getMeSHIDbyUMLSID(cui=d["cui"])
             d["MeSHID"] = MeSHID
         if d["tree_codes"] == "" and d["MeSHID"] is not None and d["MeSHID"].startswith("D"):
@@ -78,7 +89,7 @@ class Concept(object):
         Concept object
         """
         d = {}
-        duiFunction = duiFunc()
+        duiFunction = cls.getDuiFunction()
         flag = 0
         if dui is not None:
             flag = flag + 1
@@ -105,10 +116,15 @@ class Concept(object):
                 sys.stderr.write("this is an invalid MeSH ID\n")
                 exit(1)
 
-            semanticType = duiFunction.getSemanticType(dui=dui)
-            treeCode = duiFunction.getMeSHTreecode(dui=dui)
-            UMLSID = duiFunction.getUMLSIDbyMeSHID(dui=dui)
-            prefferredName = duiFunction.getPrefferedName(dui=dui)
+            # one index lookup for all attributes
+            record = duiFunction.getRecordByDui(dui=dui)
+            if record is None:
+                semanticType, treeCode, UMLSID, prefferredName = None, None, None, None
+            else:
+                semanticType = record["Semantic_Type"][0]
+                treeCode = record.get("Tree_Code")
+                UMLSID = record["UMLSID"][0]
+                prefferredName = record["Preferred_Name"][0]
             d["cui"] = UMLSID
             d["MeSHID"] = dui
             d["semtypes"] = semanticType
@@ -122,10 +138,14 @@ class Concept(object):
             if not duiFunction.checkCui(cui=cui):
                 sys.stderr.write("this is an invalid UMLS ID\n")
                 exit(1)
-            semanticType = duiFunction.getSemanticType(cui=cui)
-            treeCode = duiFunction.getMeSHTreecode(cui=cui)
+            record = duiFunction.getRecordByCui(cui=cui)
+            if record is None:
+                semanticType, treeCode, prefferredName = None, None, None
+            else:
+                semanticType = record["Semantic_Type"][0]
+                treeCode = record.get("Tree_Code")
+                prefferredName = record["Preferred_Name"][0]
             MeSHID = duiFunction.getMeSHIDbyUMLSID(cui=cui)
-            prefferredName = duiFunction.getPrefferedName(cui=cui)
             d["cui"] = cui
             d["MeSHID"] = MeSHID
             d["semtypes"] = semanticType
@@ -133,3 +153,50 @@ class Concept(object):
             d['preferred_name'] = prefferredName
         return cls(**d)
 
+
+class MMIRecord(object):
+    """This class is a lightweight MMI concept, yielded by MetaMap.iterMMI.
+
+    | It has the same attributes as Concept.MMIConcept, but no __dict__,
+    | its MeSHID is resolved with the other records of a batch, see MetaMap.iterMMI.
+    | If MetaMap gives no tree code, tree_codes is resolved from the MeSH ID when it is first used.
+
+    **parameter**
+
+    mmi_array: list
+        The MetaMap result with option -N.
+
+    MeSHID: String or None
+        MeSH ID of the UMLS ID.
+    """
+
+    fields = ('index', 'mm', 'score', 'preferred_name', 'cui', 'semtypes',
+              'trigger', 'location', 'pos_info', 'tree_codes')
+    __slots__ = ('index', 'mm', 'score', 'preferred_name', 'cui', 'semtypes',
+                 'trigger', 'location', 'pos_info', '_mmiTreeCodes', '_treeCodes', 'MeSHID')
+
+    def __init__(self, mmi_array=None, MeSHID=None):
+        values = list(mmi_array) + [None] * (len(self.fields) - len(mmi_array))
+        (self.index, self.mm, self.score, self.preferred_name, self.cui, self.semtypes,
+         self.trigger, self.location, self.pos_info, self._mmiTreeCodes) = values[0: len(self.fields)]
+        self.MeSHID = MeSHID
+        self._treeCodes = None
+
+    @property
+    def tree_codes(self):
+        """String of tree codes given by MetaMap, or the list of tree codes of the MeSH ID."""
+        if self._treeCodes is None:
+            self._treeCodes = self._mmiTreeCodes
+            if self._mmiTreeCodes == "" and self.MeSHID is not None and self.MeSHID.startswith("D"):
+                treeCodes = Concept.getDuiFunction().getIDResolver().fromDui(dui=self.MeSHID, target="treeCode")
+                self._treeCodes = None if treeCodes is None else list(treeCodes)
+        return self._treeCodes
+
+    def toDict(self):
+        """Get the concept dict, the same as the result of MetaMap.runMetaMap."""
+        d = dict((name, getattr(self, name)) for name in self.fields)
+        d["MeSHID"] = self.MeSHID
+        return d
+
+    def __str__(self):
+        return str(self.toDict())
@@ -0,0 +1,224 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class MetaMapCache(object):
+    """This class keeps the MetaMap results on disk, the key is the hash of the text and the MetaMap options.
+
+    | The same sentence processed with the same options is only sent to MetaMap once.
+    | The text is normalized before hashing, the spaces at both ends of a line are removed,
+    | and the spaces in a line are collapsed, the line breaks are kept, because MetaMap splits records by them.
+    | The results are stored as compressed JSON in a sqlite database,
+    | when their total size is above maxBytes, the least recently used results are removed.
+
+    **parameter**
+
+    path: String
+        sqlite database file, created if it doesn't exist.
+
+    maxBytes: int or None
+        | size limit of the stored results, in bytes after compression.
+        | default: 1 GB, None means no limit.
+
+    **attribute**
+
+    connection: sqlite3.Connection
+        the database connection.
+
+    hits, misses: int
+        number of found and missing keys of this object.
+
+    **see also**
+
+    | pyMeSHSim.metamapWrap.MetamapInterface.MetaMap.runMetaMap
+    | pyMeSHSim.metamapWrap.MetaMapSession.MetaMapSession.annotateMany
+    """
+
+    def __init__(self, path=None, maxBytes=1 << 30):
+        self.path = path
+        self.maxBytes = maxBytes
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        # several worker processes may share one cache, wait for the lock of the others
+        # the connection can be used by other threads, eg. the executor of AsyncMetaMap, one at a time
+        self.connection = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._createTables()
+        self.hits = 0
+        self.misses = 0
+
+    def _createTables(self):
+        """Create the tables and triggers, in one transaction which locks the file for writing.
+
+        | The other processes wait for it, so the total size is created and seeded once.
+        """
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS results "
+                                    "(key TEXT PRIMARY KEY, value BLOB, size INTEGER, lastUsed REAL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS resultsLastUsed ON results (lastUsed)")
+            # the total size of old cache files has no key, it is created again
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(totalSize)")]
+            if len(columns) > 0 and "id" not in columns:
+                self.connection.execute("DROP TABLE totalSize")
+                for trigger in ["resultsInsert", "resultsUpdate", "resultsDelete"]:
+                    self.connection.execute("DROP TRIGGER IF EXISTS %s" % trigger)
+            # the total size is kept in one row by triggers, so it is not summed over all results after each put
+            self.connection.execute("CREATE TABLE IF NOT EXISTS totalSize "
+                                    "(id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER)")
+            self.connection.execute("INSERT OR IGNORE INTO totalSize (id, size) "
+                                    "SELECT 0, COALESCE(SUM(size), 0) FROM results")
+            self.connection.execute("CREATE TRIGGER IF NOT EXISTS resultsInsert AFTER INSERT ON results "
+                                    "BEGIN UPDATE totalSize SET size = size + new.size WHERE id = 0; END")
+            self.connection.execute("CREATE TRIGGER IF NOT EXISTS resultsUpdate AFTER UPDATE OF size ON results "
+                                    "BEGIN UPDATE totalSize SET size = size + new.size - old.size WHERE id = 0; END")
+            self.connection.execute("CREATE TRIGGER IF NOT EXISTS resultsDelete AFTER DELETE ON results "
+                                    "BEGIN UPDATE totalSize SET size = size - old.size WHERE id = 0; END")
+        except BaseException:
+            self.connection.rollback()
+            raise
+        self.connection.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def normalizeText(text=None):
+        """Remove the spaces at both ends of each line, and collapse the spaces in a line."""
+        return "\n".join(" ".join(line.split()) for line in text.strip().splitlines())
+
+    @staticmethod
+    def makeKey(text=None, options=None):
+        """Get the key of a text processed with the MetaMap options.
+
+        **parameter**
+
+        text: String
+            free text.
+
+        options: list
+            | the effective MetaMap options, eg. semantic types, sources, -Q, --conj,
+            | and the MetaMap executable name, which contains its version.
+
+        **return**
+
+        String, sha256 hex digest.
+        """
+        content = json.dumps([MetaMapCache.normalizeText(text=text), list(options)])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def getMany(self, keys=None):
+        """Get the results of many keys, each distinct key is looked up once.
+
+        **return**
+
+        dict, key to list of concept dict, the missing keys are not in it.
+        """
+        uniqKeys = list(set(keys))
+        found = {}
+        with self._lock:
+            # sqlite limits the number of parameters of one statement
+            for start in range(0, len(uniqKeys), 500):
+                part = uniqKeys[start: start + 500]
+                rows = self.connection.execute("SELECT key, value FROM results WHERE key IN (%s)" %
+                                               ",".join("?" * len(part)), part).fetchall()
+                for (key, value) in rows:
+                    found[key] = json.loads(zlib.decompress(value).decode("utf-8"))
+            if len(found) > 0:
+                now = time.time()
+                self.connection.executemany("UPDATE results SET lastUsed = ? WHERE key = ?",
+                                            [(now, key) for key in found])
+                self.connection.commit()
+            self.hits = self.hits + len(found)
+            self.misses = self.misses + len(uniqKeys) - len(found)
+        return found
+
+    def get(self, key=None):
+        """Get the result of one key.
+
+        **return**
+
+        None or list of concept dict.
+        """
+        return self.getMany(keys=[key]).get(key)
+
+    def putMany(self, results=None):
+        """Store many results, then remove the least recently used results if the size limit is passed.
+
+        **parameter**
+
+        results: dict
+            key to list of concept dict.
+        """
+        now = time.time()
+        rows = []
+        for (key, concepts) in results.items():
+            value = zlib.compress(json.dumps(concepts).encode("utf-8"))
+            rows.append((key, value, len(value), now))
+        with self._lock:
+            self.connection.executemany("INSERT INTO results (key, value, size, lastUsed) VALUES (?, ?, ?, ?) "
+                                        "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                                        "size = excluded.size, lastUsed = excluded.lastUsed", rows)
+            self.connection.commit()
+            self.evict()
+
+    def put(self, key=None, concepts=None):
+        """Store the result of one key."""
+        self.putMany(results={key: concepts})
+
+    def evict(self):
+        """Remove the least recently used results until the total size is 90% of maxBytes.
+
+        **return**
+
+        number of removed results.
+        """
+        if self.maxBytes is None:
+            return 0
+        with self._lock:
+            total = self.totalSize()
+            if total <= self.maxBytes:
+                return 0
+            target = total - int(self.maxBytes * 0.9)
+            removed = []
+            freed = 0
+            for (key, size) in self.connection.execute("SELECT key, size FROM results ORDER BY lastUsed"):
+                if freed >= target:
+                    break
+                removed.append((key,))
+                freed = freed + size
+            self.connection.executemany("DELETE FROM results WHERE key = ?", removed)
+            self.connection.commit()
+        return len(removed)
+
+    def totalSize(self):
+        """Get the total size of the stored results, in bytes."""
+        with self._lock:
+            return self.connection.execute("SELECT size FROM totalSize WHERE id = 0").fetchone()[0]
+
+    def clear(self):
+        """Remove all results."""
+        with self._lock:
+            self.connection.execute("DELETE FROM results")
+            self.connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
@@ -0,0 +1,163 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import atexit
+import os
+import socket
+import sys
+import time
+
+
+class MetaMapServer(object):
+    """This class controls one MetaMap server, the SKR/MedPost tagger or the word sense disambiguation server.
+
+    | The server is ready when its port accepts a connection,
+    | so a server started by another job or another MetaMap object is found and reused.
+
+    **parameter**
+
+    name: String
+        server name, used in messages.
+
+    ctl: String
+        path of its control script, eg. public_mm/bin/skrmedpostctl.
+
+    port: int
+        the port the server listens on.
+
+    host: String
+        default "localhost".
+
+    **attribute**
+
+    startedHere: True or False
+        the server is started by this object, only such a server is stopped by stop.
+    """
+
+    def __init__(self, name=None, ctl=None, port=None, host="localhost"):
+        self.name = name
+        self.ctl = ctl
+        self.port = port
+        self.host = host
+        self.startedHere = False
+
+    def isReady(self):
+        """Check if the server accepts a connection."""
+        try:
+            connection = socket.create_connection((self.host, self.port), timeout=1)
+        except OSError:
+            return False
+        connection.close()
+        return True
+
+    def start(self):
+        """Run the control script to start the server, if it is not ready and not started by this object.
+
+        | A server started here may still be loading when start is called again, eg. after a timeout,
+        | the script is not run again, which would start a second server on the same port, its port is polled.
+
+        **return**
+
+        True if the script is run, False if the server is already running or started here.
+        """
+        if self.startedHere:
+            return False
+        if self.isReady():
+            sys.stderr.write("%s is running on port %s, reuse it\n" % (self.name, self.port))
+            return False
+        from .MetamapInterface import Basic
+        Basic.run(cmd=self.ctl + "\t" + "start")
+        self.startedHere = True
+        return True
+
+    def stop(self):
+        """Run the control script to stop the server, if it is started by this object."""
+        if not self.startedHere:
+            return
+        from .MetamapInterface import Basic
+        Basic.run(cmd=self.ctl + "\t" + "stop")
+        self.startedHere = False
+
+
+class MetaMapServers(object):
+    """This class starts the servers MetaMap needs, and waits until they are ready.
+
+    | There is one object for each MetaMap bin directory, it is shared by all MetaMap objects in one process.
+    | The servers are started together, and their ports are polled, so a job waits only as long as they need.
+    | The servers already running are reused and are never stopped by this object.
+
+    **parameter**
+
+    binDir: String
+        MetaMap bin directory, which contains skrmedpostctl and wsdserverctl.
+
+    **attribute**
+
+    servers: list
+        MetaMapServer objects, the tagger server on port 1795 and the WSD server on port 5554.
+
+    **see also**
+
+    pyMeSHSim.metamapWrap.MetamapInterface.MetaMap.startMetaMap
+    """
+
+    _instances = {}
+
+    def __init__(self, binDir=None):
+        self.binDir = binDir
+        self.servers = [MetaMapServer(name="SKR/MedPost tagger", ctl=os.path.join(binDir, "skrmedpostctl"), port=1795),
+                        MetaMapServer(name="WSD server", ctl=os.path.join(binDir, "wsdserverctl"), port=5554)]
+        self._stopAtExit = False
+
+    @classmethod
+    def getInstance(cls, binDir=None):
+        """Get the servers of one MetaMap bin directory, create it on first use."""
+        if binDir not in cls._instances:
+            cls._instances[binDir] = cls(binDir=binDir)
+        return cls._instances[binDir]
+
+    def isReady(self):
+        """Check if all servers accept connections."""
+        return all(server.isReady() for server in self.servers)
+
+    def start(self, timeout=120, interval=0.5, stopAtExit=False):
+        """Start the servers which are not running, and wait until all of them are ready.
+
+        **parameter**
+
+        timeout: int or float
+            seconds to wait for the servers.
+
+        interval: float
+            seconds between two polls of the ports.
+
+        stopAtExit: True or False
+            stop the servers started here when the python process exits.
+
+        **return**
+
+        True if all servers are ready, otherwise False.
+        """
+        for server in self.servers:
+            server.start()
+        if stopAtExit and not self._stopAtExit:
+            atexit.register(self.stop)
+            self._stopAtExit = True
+        begin = time.time()
+        deadline = begin + timeout
+        waiting = [server for server in self.servers if not server.isReady()]
+        while waiting:
+            if time.time() >= deadline:
+                for server in waiting:
+                    sys.stderr.write("%s is not ready on port %s after %s seconds\n" % (server.name, server.port, timeout))
+                return False
+            time.sleep(interval)
+            waiting = [server for server in waiting if not server.isReady()]
+        sys.stderr.write("MetaMap servers are ready in %.1f seconds\n" % (time.time() - begin))
+        return True
+
+    def stop(self):
+        """Stop the servers started here, the servers started by others are kept."""
+        for server in self.servers:
+            server.stop()
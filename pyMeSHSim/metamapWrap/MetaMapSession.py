@@ -0,0 +1,284 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+import os
+import queue
+import sys
+import threading
+import time
+from subprocess import Popen, PIPE, TimeoutExpired
+
+
+class MetaMapSessionError(RuntimeError):
+    """MetaMap gives no result for a text after all restarts."""
+    pass
+
+
+class MetaMapSession(object):
+    """This class keeps one MetaMap process alive and streams the texts through its stdin and stdout.
+
+    | MetaMap is started once with the option --indicate_citation_end,
+    | it writes the line "'EOT'." after the result of each input record,
+    | so the result of one text is all lines before this mark, and no temporary file is needed.
+    | A reader thread puts the output lines into a queue, so a dead or stuck MetaMap is found by a timeout.
+    | Then MetaMap is restarted and the text is sent again.
+
+    **parameter**
+
+    command: list
+        | MetaMap executable and its options, without input and output file.
+        | eg. [path] + MetaMap._buildOptions(), see MetaMap.openSession.
+
+    parser: function
+        | parse one output line, return None or a concept dict.
+        | default: MetaMap._parseMMILine.
+
+    sldi: True or False
+        | True if the options contain --sldi, one line is one record.
+        | otherwise a blank line is written after each text.
+
+    timeout: int or float
+        seconds to wait for the result of one text.
+
+    startTimeout: int or float
+        seconds to wait for the result of the first text after MetaMap is started, it loads its data first.
+
+    retries: int
+        times to restart MetaMap and send one text again.
+
+    cache: MetaMapCache object or None
+        | the texts found in it are not sent to MetaMap, and the new results are stored in it.
+        | default: None.
+
+    **attribute**
+
+    process: Popen object or None
+        the running MetaMap.
+
+    lines: queue.Queue
+        output lines of the running MetaMap, None after its stdout is closed.
+
+    restarts: int
+        times MetaMap has been restarted.
+
+    **see also**
+
+    pyMeSHSim.metamapWrap.MetamapInterface.MetaMap.openSession
+    """
+
+    endMark = "'EOT'."
+    endOption = "--indicate_citation_end"
+    probeText = "ready"
+
+    def __init__(self, command=None, parser=None, sldi=True, timeout=60, startTimeout=120, retries=1, cache=None):
+        if command is None or len(command) == 0:
+            sys.stderr.write("metamap command can't be None\n")
+            exit(1)
+        self.command = list(command)
+        if self.endOption not in self.command:
+            self.command.append(self.endOption)
+        if parser is None:
+            from .MetamapInterface import MetaMap
+            parser = MetaMap._parseMMILine
+        self.parser = parser
+        self.sldi = sldi
+        self.timeout = timeout
+        self.startTimeout = startTimeout
+        self.retries = retries
+        self.cache = cache
+        # the cache key depends on the MetaMap version and options, not on the session
+        self.cacheOptions = [os.path.basename(self.command[0])] + [item for item in self.command[1:]
+                                                                   if item != self.endOption]
+        self.process = None
+        self.lines = None
+        self.restarts = 0
+
+    def __enter__(self):
+        if not self.isAlive():
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def _readLines(stream=None, lines=None):
+        """Put every line of stream into the queue, then None."""
+        try:
+            for line in stream:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        lines.put(None)
+
+    def isAlive(self):
+        """Check if MetaMap is running."""
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Start MetaMap, and wait until it gives the result of a probe text.
+
+        | MetaMap is stopped again if it gives no result in startTimeout seconds.
+        """
+        sys.stderr.write("Running %s ...\n" % " ".join(self.command))
+        self.process = Popen(self.command, stdin=PIPE, stdout=PIPE, universal_newlines=True, bufsize=1,
+                             errors="replace")
+        self.lines = queue.Queue()
+        reader = threading.Thread(target=self._readLines, kwargs={"stream": self.process.stdout, "lines": self.lines})
+        reader.daemon = True
+        reader.start()
+        try:
+            self._send(text=self.probeText)
+            self._receive(timeout=self.startTimeout)
+        except (OSError, MetaMapSessionError):
+            self.stop(kill=True)
+            raise MetaMapSessionError("MetaMap %s is not ready" % self.command[0])
+
+    def stop(self, kill=False):
+        """Stop MetaMap.
+
+        **parameter**
+
+        kill: True or False
+            | False: its stdin is closed, it is killed if it doesn't exit in 5 seconds.
+            | True: it is killed at once, it is used when MetaMap is stuck or has failed.
+        """
+        if self.process is None:
+            return
+        if kill and self.process.poll() is None:
+            self.process.kill()
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+        self.process = None
+
+    def restart(self):
+        """Stop and start MetaMap."""
+        self.stop()
+        self.restarts = self.restarts + 1
+        self.start()
+
+    @staticmethod
+    def _record(text=None):
+        """Join the lines of a text, so it is one record."""
+        return " ".join(text.split())
+
+    def _send(self, text=None):
+        """Write one text as one record."""
+        record = self._record(text=text)
+        if self.sldi:
+            self.process.stdin.write(record + "\n")
+        else:
+            self.process.stdin.write(record + "\n\n")
+        self.process.stdin.flush()
+
+    def _receive(self, timeout=None):
+        """Read the output lines of one record, until the end mark.
+
+        **return**
+
+        list of string
+        """
+        deadline = time.time() + timeout
+        result = []
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise MetaMapSessionError("MetaMap gives no result in %s seconds" % timeout)
+            try:
+                line = self.lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                try:
+                    code = self.process.wait(timeout=1)
+                except TimeoutExpired:
+                    code = None
+                raise MetaMapSessionError("MetaMap closes its output, exit code %s" % code)
+            if line.strip() == self.endMark:
+                return result
+            result.append(line)
+
+    def annotate(self, text=None):
+        """Send one text to MetaMap and parse its result.
+
+        | If MetaMap exits or gives no result in timeout seconds, it is restarted and the text is sent again,
+        | MetaMapSessionError is raised after retries restarts.
+        | If the session has a cache, the text found in it is not sent to MetaMap.
+
+        **parameter**
+
+        text: String
+            free text, the line breaks are replaced by space, so it is one record.
+
+        **return**
+
+        list of concept dict, the same as MetaMap.runMetaMap.
+        """
+        return self.annotateMany(texts=[text])[0]
+
+    def annotateMany(self, texts=None):
+        """Annotate many texts, each distinct text is looked up in the cache and sent to MetaMap only once.
+
+        **parameter**
+
+        texts: list
+            free texts.
+
+        **return**
+
+        list of the result of each text, in the order of texts.
+        """
+        for text in texts:
+            if text is None or not isinstance(text, str):
+                sys.stderr.write("text must be string\n")
+                exit(1)
+        records = [self._record(text=text) for text in texts]
+        results = {"": []}
+        if self.cache is not None:
+            keys = dict((record, self.cache.makeKey(text=record, options=self.cacheOptions))
+                        for record in set(records) if record != "")
+            found = self.cache.getMany(keys=list(keys.values()))
+            for (record, key) in keys.items():
+                if key in found:
+                    results[record] = found[key]
+        newResults = {}
+        for record in records:
+            if record not in results:
+                results[record] = self._annotateRecord(record=record)
+                if self.cache is not None:
+                    newResults[keys[record]] = results[record]
+        if len(newResults) > 0:
+            self.cache.putMany(results=newResults)
+        return [results[record] for record in records]
+
+    def _annotateRecord(self, record=None):
+        """Send one record to MetaMap, restart MetaMap on failure."""
+        for attempt in range(self.retries + 1):
+            try:
+                if not self.isAlive():
+                    self.stop()
+                    self.start()
+                self._send(text=record)
+                lines = self._receive(timeout=self.timeout)
+            except (OSError, MetaMapSessionError) as e:
+                sys.stderr.write("MetaMap session failed: %s\n" % e)
+                # a MetaMap which gives no result in time would not exit after its stdin is closed
+                self.stop(kill=True)
+                self.restarts = self.restarts + 1
+                continue
+            concepts = []
+            for line in lines:
+                concept = self.parser(line=line)
+                if concept is not None:
+                    concepts.append(concept)
+            return concepts
+        raise MetaMapSessionError("MetaMap gives no result after %s restarts" % self.retries)
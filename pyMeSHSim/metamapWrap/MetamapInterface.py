@@ -5,11 +5,12 @@
 import os
 import re
 import sys
-import time
 from subprocess import *
 import tempfile
 
-from .Concept import Concept
+from .Concept import Concept, MMIRecord
+from .MetaMapServers import MetaMapServers
+from .MetaMapSession import MetaMapSession
 from ..data.dataInterface import dataHandle
 
 
@@ -90,19 +91,137 @@ class MetaMap(object):
         self.mminName = ('index', 'mm', 'score', 'preferred_name', 'cui', 'semtypes',
                          'trigger', 'location', 'pos_info', 'tree_codes')
 
-    def startMetaMap(self):
-        """Start metamap service"""
+    def startMetaMap(self, timeout=120, stopAtExit=False):
+        """Start metamap service.
 
-        cmd = self.skrmedpostctl + "\t" + "start"
-        Basic.run(cmd)
-        time.sleep(5)
-        cmd = self.wsdserverctl + "\t" + "start"
-        Basic.run(cmd)
-        time.sleep(10)
+        | The servers already running are reused, the others are started,
+        | then their ports are polled until they are ready, instead of sleeping a fixed time.
+
+        **parameter**
+
+        timeout: int or float
+            seconds to wait for the servers.
+
+        stopAtExit: True or False
+            stop the servers started here when the python process exits.
+
+        **return**
+
+        True if the servers are ready, otherwise False.
+
+        **see also**
+
+        pyMeSHSim.metamapWrap.MetaMapServers
+        """
+        servers = MetaMapServers.getInstance(binDir=self.metamapBinDir)
+        return servers.start(timeout=timeout, stopAtExit=stopAtExit)
+
+    def stopMetaMap(self):
+        """Stop metamap service, only the servers started by startMetaMap in this process are stopped."""
+        MetaMapServers.getInstance(binDir=self.metamapBinDir).stop()
+
+    def openSession(self, source=["MSH"], semantic_types=None, ignore_word_order=True, conjunction=True,
+                    composite_phrases=4, silent=True, sldi=True, term_processing=True, timeout=60, startTimeout=120,
+                    retries=1, cache=None):
+        """Start a MetaMap process which is kept alive to process many texts.
+
+        | runMetaMap starts a new MetaMap for each text, and its startup takes several seconds.
+        | The session pays it once, each text is written to the stdin of MetaMap and its result is read from stdout.
+        | The MetaMap servers should have been started, see startMetaMap.
+
+        **parameters**
+
+        source, semantic_types, ignore_word_order, conjunction, composite_phrases, silent, sldi, term_processing:
+            the same as runMetaMap.
+
+        timeout: int or float
+            seconds to wait for the result of one text, MetaMap is restarted after it.
+
+        startTimeout: int or float
+            seconds to wait for MetaMap to be ready.
+
+        retries: int
+            times to restart MetaMap for one text.
+
+        cache: MetaMapCache object or None
+            the texts found in the cache are not sent to MetaMap.
+
+        **return**
+
+        MetaMapSession object, call its annotate method for each text, and stop method at last.
+
+        **see also**
+
+        pyMeSHSim.metamapWrap.MetaMapSession
+        """
+        options = self._buildOptions(source=source, semantic_types=semantic_types,
+                                     ignore_word_order=ignore_word_order, conjunction=conjunction,
+                                     composite_phrases=composite_phrases, silent=silent, sldi=sldi,
+                                     term_processing=term_processing)
+        session = MetaMapSession(command=[self.metamap] + options, parser=self._parseMMILine, sldi=sldi,
+                                 timeout=timeout, startTimeout=startTimeout, retries=retries, cache=cache)
+        session.start()
+        return session
+
+    def _buildOptions(self, source=["MSH"], semantic_types=None, ignore_word_order=True, conjunction=True,
+                      composite_phrases=4, silent=True, sldi=True, sldiID=False, term_processing=True):
+        """Build the MetaMap command line options, the parameters are the same as runMetaMap.
+
+        **return**
+
+        list of string, each option and its value is one item.
+        """
+        options = ["-N"]
+
+        #set ST, if None skip this parameter
+        if semantic_types is not None:
+            if isinstance(semantic_types, list) and len(semantic_types) > 0:
+                restrictST = ",".join(semantic_types)
+            else:
+                sys.stderr.write("semantic_types is invalid type, need a list\n")
+                exit(1)
+            options += ["-J", restrictST]
+
+        #set source
+        if isinstance(source, list) and len(source) >0:
+            sourceUMLS = ",".join(source)
+            options += ["-R", sourceUMLS]
+
+        #set i
+        if ignore_word_order is True:
+            options.append("-i")
+
+        #set z
+        if term_processing is True:
+            options.append("-z")
+
+        #get metamap version, set conj
+        exe = os.path.basename(self.metamap)
+        result = re.match("metamap(\d*)", exe)
+        if result and result.groups()[0] != "":
+            version = int(result.groups()[0])
+        else:
+            version = 0
+        if conjunction is True and version >= 16:
+            options.append("--conj")
+        #set Q
+        if isinstance(composite_phrases, int):
+            options += ["-Q", str(composite_phrases)]
+        #set silent
+        if silent is True:
+            options.append("--silent")
+        #set sldi and sldiID
+        if sldi is True and sldiID is True:
+            sys.stderr.write("sldi and sldiID can't be simultaneously turned On")
+        if sldi is True:
+            options.append("--sldi")
+        if sldiID is True:
+            options.append("--sldiID")
+        return options
 
     def runMetaMap(self, text=None, source=["MSH"], semantic_types=None, ignore_word_order=True, \
                    conjunction=True, composite_phrases=4, silent=True, sldi=True, sldiID=False, \
-                   term_processing=True, input_file_path=None, text_convert=False
+                   term_processing=True, input_file_path=None, text_convert=False, cache=None
                    ):
         """The main method run the MetaMap.
 
@@ -193,6 +312,11 @@ class MetaMap(object):
             | The software will mistake.
             | default False.
 
+        cache: MetaMapCache object or None
+            | if the text has been processed with the same options, its result is taken from the cache,
+            | and MetaMap is not run. Only used with text.
+            | default None.
+
         **return**
 
         list of concept object or None.
@@ -220,53 +344,16 @@ class MetaMap(object):
                 sys.stderr.write("file doesn't exits\n")
                 exit(1)
 
-        initCMD = [self.metamap, "-N"]
-
-        #set ST, if None skip this parameter
-        if semantic_types is not None:
-            if isinstance(semantic_types, list) and len(semantic_types) > 0:
-                restrictST = ",".join(semantic_types)
-            else:
-                sys.stderr.write("semantic_types is invalid type, need a list\n")
-                exit(1)
-            initCMD.append("-J %s" % restrictST)
-
-        #set source
-        if isinstance(source, list) and len(source) >0:
-            sourceUMLS = ",".join(source)
-            sourceUMLS = "-R " + sourceUMLS
-            initCMD.append(sourceUMLS)
-
-        #set i
-        if ignore_word_order is True:
-            initCMD.append("-i")
-
-        #set z
-        if term_processing is True:
-            initCMD.append("-z")
-
-        #get metamap version, set conj
-        exe = os.path.basename(self.metamap)
-        result = re.match("metamap(\d*)", exe)
-        if result:
-            version = int(result.groups()[0])
-        else:
-            version = 0
-        if conjunction is True and version >= 16:
-            initCMD.append("--conj")
-        #set Q
-        if isinstance(composite_phrases, int):
-            initCMD.append("-Q %s" % composite_phrases)
-        #set silent
-        if silent is True:
-            initCMD.append("--silent")
-        #set sldi and sldiID
-        if sldi is True and sldiID is True:
-            sys.stderr.write("sldi and sldiID can't be simultaneously turned On")
-        if sldi is True:
-            initCMD.append("--sldi")
-        if sldiID is True:
-            initCMD.append("--sldiID")
+        initCMD = [self.metamap] + self._buildOptions(source=source, semantic_types=semantic_types,
+                                                      ignore_word_order=ignore_word_order, conjunction=conjunction,
+                                                      composite_phrases=composite_phrases, silent=silent, sldi=sldi,
+                                                      sldiID=sldiID, term_processing=term_processing)
+        #look up the cache, the key depends on the MetaMap version and options
+        if cache is not None and text is not None:
+            cacheKey = cache.makeKey(text=text, options=[os.path.basename(self.metamap)] + initCMD[1:])
+            concepts = cache.get(key=cacheKey)
+            if concepts is not None:
+                return concepts
         #input file
         if text is not None:
             inputFile = tempfile.NamedTemporaryFile(mode="w", delete=True)
@@ -287,6 +374,8 @@ class MetaMap(object):
             sys.stderr.write(p.stdout.read())
             exit(1)
         concepts = self._parseMMI(outputFile)
+        if cache is not None and text is not None:
+            cache.put(key=cacheKey, concepts=concepts)
         return concepts
 
     def _parseMMI(self, text_handle=None):
@@ -301,20 +390,73 @@ class MetaMap(object):
 
         list of dict
         """
-        concepts = []
         if text_handle is None:
             sys.stderr("No MetaMap result")
             exit(1)
-        for line in text_handle:
-            if line is "\n" or line is None:
-                continue
-            mmi_array = line.strip("\n").split("|")
-            #select the only mmi output
-            #except from mmi, there are "ua" and "aa", more
-            if mmi_array[1] == "MMI":
-                concept = Concept.MMIConcept(mmi_array=mmi_array)
-                concepts.append(concept.__dict__)
+        concepts = [record.toDict() for record in self.iterMMI(text_handle=text_handle)]
         text_handle.close()
         return concepts
 
+    @staticmethod
+    def iterMMI(text_handle=None, batchSize=1000):
+        """Parse the MMI output of MetaMap lazily.
+
+        | The lines are read while they are written, only batchSize MMI lines are kept in memory.
+        | The distinct UMLS ID of each batch are mapped to MeSH ID by one IDResolver.resolveBatch call,
+        | and the tree codes are only resolved when they are used, see Concept.MMIRecord.
+
+        **parameter**
+
+        text_handle: file handle or iterable of string
+            MetaMap output with option -N, eg. an open file or the stdout of MetaMap.
 
+        batchSize: int
+            number of MMI lines resolved together.
+
+        **return**
+
+        generator of MMIRecord object.
+
+        **see also**
+
+        pyMeSHSim.metamapWrap.Concept.MMIRecord
+        """
+        resolver = Concept.getDuiFunction().getIDResolver()
+        batch = []
+        for line in text_handle:
+            mmi_array = line.rstrip("\n").split("|")
+            #select the only mmi output
+            if len(mmi_array) > 1 and mmi_array[1] == "MMI":
+                batch.append(mmi_array)
+            if len(batch) >= batchSize:
+                for record in MetaMap._resolveMMIBatch(batch=batch, resolver=resolver):
+                    yield record
+                batch = []
+        for record in MetaMap._resolveMMIBatch(batch=batch, resolver=resolver):
+            yield record
+
+    @staticmethod
+    def _resolveMMIBatch(batch=None, resolver=None):
+        """Create the MMIRecord of a batch of MMI lines, their UMLS ID are resolved together."""
+        cuis = [mmi_array[4] if len(mmi_array) > 4 else None for mmi_array in batch]
+        uniqCuis = list(set(cuis))
+        MeSHIDs = dict(zip(uniqCuis, resolver.resolveBatch(values=uniqCuis, source="cui", target="dui")))
+        return [MMIRecord(mmi_array=mmi_array, MeSHID=MeSHIDs[cui]) for (mmi_array, cui) in zip(batch, cuis)]
+
+    @staticmethod
+    def _parseMMILine(line=None):
+        """Parse one line of the MetaMap output.
+
+        **return**
+
+        None if the line is not a MMI result, otherwise the concept dict.
+        """
+        if line is None or line.strip("\n") == "":
+            return None
+        mmi_array = line.strip("\n").split("|")
+        #select the only mmi output
+        #except from mmi, there are "ua" and "aa", more
+        if len(mmi_array) > 1 and mmi_array[1] == "MMI":
+            concept = Concept.MMIConcept(mmi_array=mmi_array)
+            return concept.__dict__
+        return None
@@ -12,9 +12,16 @@ setup(
     keywords=['MeSH', 'Metamap', 'similarity'],
     packages=find_packages(),
     include_package_data=True,
+    entry_points={
+        'console_scripts': ['pymeshsim-annotate=pyMeSHSim.metamapWrap.BatchAnnotator:main']
+    },
 
     classifiers=[
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)',
         'Operating System :: POSIX',
         'Development Status :: 1 - Alpha',
@@ -22,6 +29,9 @@ setup(
         'Topic :: Scientific/Engineering :: Bio-Informatics',
         'Topic :: Scientific/Engineering :: Bio-Meidecine'
         ],
+    # AsyncMetaMap uses asyncio.get_running_loop
+    python_requires='>=3.7',
     install_requires=['bcolz>=1.2.1',
+                        'numpy',
                         'pandas']
 )
@@ -0,0 +1,58 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Fixtures shared by the tests of the table builders."""
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from pyMeSHSim.data.createData import createBcolzData
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+ICFILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pyMeSHSim", "data",
+                      "MeSH_IC.tsv")
+TABLES = ["ParentChildRel", "topDescription", "RNandRBRel", "RBtoRN", "MainHeadingDetailData", "RNDetailData",
+          "supplementMainHeading", "offspringAndAncestorRel"]
+
+
+@pytest.fixture
+def umlsDB(tmp_path):
+    """The UMLS stand-in tests/data/umls.sql as a SQLite file."""
+    path = str(tmp_path / "umls.db")
+    connection = sqlite3.connect(path)
+    with open(os.path.join(DATA, "umls.sql")) as handle:
+        connection.executescript(handle.read())
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def buildTables():
+    """Write the tsv files of createBcolzData in workPath, and read them as sorted lines."""
+
+    def build(workPath=None, maps=None, DBclient=None):
+        os.makedirs(workPath)
+        shutil.copy(ICFILE, os.path.join(workPath, "MeSH_IC.tsv"))
+        cwd = os.getcwd()
+        os.chdir(workPath)
+        try:
+            builder = createBcolzData(DBclient=DBclient, maps=maps)
+            builder.createParentChildRelTable()
+            builder.createRNandRBRelTable()
+            builder.createMainHeadingDetailData()
+            builder.createRNDetailData()
+            builder.createSupMainHeadingDetailData()
+            builder.createOffspringAndAncestorRel()
+        finally:
+            os.chdir(cwd)
+        tables = {}
+        for name in TABLES:
+            with open(os.path.join(workPath, name + ".tsv")) as handle:
+                lines = handle.read().splitlines()
+            # the rows are written in the order of sets, which is not fixed
+            tables[name] = (lines[0], sorted(lines[1:]))
+        return tables
+    return build
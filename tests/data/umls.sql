@@ -0,0 +1,1201 @@
+-- A small stand-in of the UMLS tables, for tests/test_createData.py.
+-- It is a subset of the MeSH tables in pyMeSHSim/data/testData, only the columns used by pyMeSHSim.data.createData.
+CREATE TABLE MRCONSO (CUI text, STR text, TS text, SAB text);
+INSERT INTO "MRCONSO" VALUES('C0001418','Adenocarcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001418','adenocarcinoma','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001420','Adenocarcinoma, Papillary','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001420','adenocarcinoma, papillary','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001576','Adnexal Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001576','adnexal disease','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001614','Adrenal Cortex Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001614','adrenal cortex disease','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001618','Adrenal Cortex Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001618','adrenal cortex neoplasm','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001621','Adrenal Gland Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001621','adrenal gland disease','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001624','Adrenal Gland Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0001624','adrenal gland neoplasm','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0003047','Animal Diseases','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0003047','animal diseases','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0004615','Bacterial Infections and Mycoses','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0004615','bacterial infections and mycoses','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0004936','Disorders, Mental','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0006145','Breast Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0006145','breast disease','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0006261','Bronchial Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0006277','Bronchitides','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007093','Carcinoid Heart Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007095','Carcinoid Tumor','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007097','Carcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007099','Carcinoma in Situ','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007120','Adenocarcinoma, Bronchiolo-Alveolar','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007124','Carcinoma, Intraductal, Noninfiltrating','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007129','Carcinoma, Merkel Cell','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007130','Adenocarcinoma, Mucinous','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007134','Carcinoma, Renal Cell','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007135','Adenocarcinoma, Scirrhous','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0007222','Cardiovascular Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0008497','Choriocarcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0008677','Bronchitis, Chronic','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0010606','Carcinoma, Adenoid Cystic','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0010631','Cystadenocarcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0011993','Vipoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0012242','Digestive System Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0012243','Digestive System Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0012674','Diseases (MeSH Category)','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0012922','DNA Virus Infections','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0014130','Diseases of Endocrine System','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0014132','Endocrine Gland Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0014170','Endometrial Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0017150','Gastrinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0017411','Diseases, Female Genital','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0017416','Female Genital Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0017689','Glucagonoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0018050','Gonadal Disorders','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0018799','Diseases, Heart','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0022658','Diseases, Kidney','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0022665','Kidney Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0022790','Krukenberg Tumor','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0023743','Linitis Plastica','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0023895','Diseases, Liver','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0023903','Liver Neoplasm','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0024115','Diseases, Lung','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0024117','Pulmonary Disease, Chronic Obstructive','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0024586','Carcinoid Syndrome, Malignant','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0027651','Neoplasms','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0027652','Neoplasms by Histologic Type','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0027653','Neoplasms by Site','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0027658','Neoplasms, Germ Cell and Embryonal','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0027660','Epithelial Neoplasm, Glandular','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0027665','Neoplasms, Nerve Tissue','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0029928','Disease, Ovarian','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0030186','Extramammary Pagets Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0030286','Disease, Pancreatic','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0030297','Neoplasm, Pancreatic','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0032962','Complication, Pregnancy','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0032966','Complication, Neoplastic Pregnancy','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0034049','Adenomatoses, Ovine Pulmonary','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0034067','Pulmonary Emphysema','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0035242','Diseases, Respiratory Tract','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0035243','Infection, Respiratory Tract','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0035369','Retroviridae Infections','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0035690','RNA Virus Infections','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0036946','Disease, Sheep','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0037274','Disease, Skin','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0037661','Somatostatinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0039058','Pathological Conditions, Signs and Symptoms','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0041182','Trophoblastic Neoplasms','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0041374','Infection, Tumor Virus','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0042065','Neoplasm, Urogenital','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0042075','Disease, Urologic','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0042076','Neoplasm, Urologic','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0042131','Disease, Uterine','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0042138','Neoplasm, Uterine','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0042769','Disease, Virus','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0149654','Conduct Disorder','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0149951','Ovarian Fibromata','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0152013','Lung adenocarcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0154084','Breast Carcinoma In Situ','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0154084','breast carcinoma in situ','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C0175166','Skin and Connective Tissue Diseases','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206093','Neuroectodermal Tumors','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206666','Trophoblastic Tumor, Placental Site','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206681','Adenocarcinoma, Clear Cell','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206682','Adenocarcinoma, Follicular','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206683','Carcinoma, Papillary, Follicular','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206684','Adenocarcinoma, Sebaceous','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206685','Carcinoma, Acinar Cell','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206686','Adrenocortical Carcinomas','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206687','Carcinoma, Endometrioid','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206692','Carcinoma, Lobular','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206693','Carcinoma, Medullary','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206694','Carcinoma, Mucoepidermoid','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206695','Carcinoma, Neuroendocrine','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206696','Carcinoma, Signet Ring Cell','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206697','Carcinoma, Skin Appendage','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206698','Cholangiocarcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206699','Cystadenocarcinoma, Mucinous','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206700','Cystadenocarcinoma, Papillary','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206701','Cystadenocarcinoma, Serous','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206702','Klatskins Tumor','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206754','Neuroendocrine Tumors','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206766','Neoplasms, Adnexal and Skin Appendage','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206767','Neoplasms, Cystic, Mucinous, and Serous','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0206768','Neoplasms, Ductal, Lobular, and Medullary','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0235974','Pancreatic Carcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0236964','Attention Deficit and Disruptive Behavior Disorders','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0237020','Teratoma, Ovarian','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0265797','Emphysema, congenital lobar','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0268318','Cholestasis, Intrahepatic, Of Pregnancy','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0269680','Pruritic urticarial papules plaques of pregnancy','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0271583','ACTH Deficiency, Isolated','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0334276','in Situ, Adenocarcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0340036','Immotile cilia syndrome, due to excessively long cilia','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0346153','Breast Cancer, Familial','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0431109','Choroid Plexus Carcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0546476','Keratoacanthoma familial','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0600260','Lung Disease, Obstructive','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0887833','Carcinoma, Pancreatic Ductal','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0919267','Neoplasm, Ovarian','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C0949804','Polyomavirus Infection','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1134719','Carcinoma, Ductal, Breast','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1135873','Choriocarcinoma, Non gestational','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1176475','Ductal Carcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1256741','MeSH Descriptors','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1256749','Psychiatry and Psychology (MeSH Category)','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1263846','Attention Deficit Disorder with Hyperactivity','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1266065','Eccrine Porocarcinoma','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1266101','Thymic epithelial tumor','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1328479','Carcinoma, Islet Cell','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1384901','Cystic Disease Of Lung','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1458155','Breast Neoplasms','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1458155','breast neoplasms','S','MSH');
+INSERT INTO "MRCONSO" VALUES('C1520159','Wolffian tumor','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1535926','Neurodevelopmental Disorders','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1708350','Leiomyomatosis and renal cell cancer, hereditary','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1720765','Female Urogenital Diseases and Pregnancy Complications','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1720887','Female Urogenital Diseases','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1720894','Male Urogenital Diseases','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1833053','Proprotein Convertase 1 3 Deficiency','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1840586','Histiocytosis, Progressive Mucinous','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1845343','Epilepsy, X-Linked, with Variable Learning Disabilities and Behavior Disorders','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1848813','Thyrocerebral-retinal syndrome','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1849554','Lymphangiectasia pulmonary congenital','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1851718','Emphysema, Hereditary Pulmonary','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1854729','Mucus Inspissation of Respiratory Tract','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1857314','Dermatoleukodystrophy','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1858302','Ectodermal Dysplasia-Skin Fragility Syndrome','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1859971','Adrenocortical Unresponsiveness To Acth With Postreceptor Defect','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1863649','Neuroendocrine Carcinoma of Salivary Glands, Sensorineural Hearing Loss, and Enamel Hypoplasia','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C1868647','Erosive Adenomatosis','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2239176','Carcinoma, Hepatocellular','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2673196','Lipoprotein Glomerulopathy','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2676033','Hepatoblastoma Caused By Somatic Mutation','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2676788','Joubert Syndrome 9','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2749137','Retinitis Pigmentosa, X-Linked, And Sinorespiratory Infections, With Or Without Deafness','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2930839','Islet cell tumor syndrome','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2930967','Gastro-enteropancreatic neuroendocrine tumor','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2931144','Radiation induced angiosarcoma of the breast','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2931296','Yorifuji Okuno syndrome','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2931303','Zuska''s Disease','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C2931410','Florid cystic endosalpingiosis of the uterus','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C3489727','Pruritic urticarial papules and plaques of pregnancy, familial','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C3489728','Familial intrahepatic cholestasis of pregnancy','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C3496549','Male Germ Cell Tumor','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C3501777','Renal Tubulopathy, Diabetes Mellitus, and Cerebellar Ataxia due to Duplication of Mitochondrial DNA','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C3714514','Infection','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C3850167','Morphological and Microscopic Findings','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C9000001','Concept C9000001','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C9000002','Concept C9000002','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C9000003','Concept C9000003','P','MSH');
+INSERT INTO "MRCONSO" VALUES('C9000004','Concept C9000004','P','MSH');
+CREATE TABLE MRREL (CUI1 text, CUI2 text, REL text);
+INSERT INTO "MRREL" VALUES('C0001418','C0007097','PAR');
+INSERT INTO "MRREL" VALUES('C0001418','C0152013','RN');
+INSERT INTO "MRREL" VALUES('C0001420','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0001576','C0017411','PAR');
+INSERT INTO "MRREL" VALUES('C0001576','C1520159','RN');
+INSERT INTO "MRREL" VALUES('C0001576','C9000003','RN');
+INSERT INTO "MRREL" VALUES('C0001614','C0001621','PAR');
+INSERT INTO "MRREL" VALUES('C0001614','C1859971','RN');
+INSERT INTO "MRREL" VALUES('C0001614','C9000004','RN');
+INSERT INTO "MRREL" VALUES('C0001618','C0001614','PAR');
+INSERT INTO "MRREL" VALUES('C0001618','C0001624','PAR');
+INSERT INTO "MRREL" VALUES('C0001621','C0014130','PAR');
+INSERT INTO "MRREL" VALUES('C0001624','C0001621','PAR');
+INSERT INTO "MRREL" VALUES('C0001624','C0014132','PAR');
+INSERT INTO "MRREL" VALUES('C0003047','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0004615','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0004936','C1256749','PAR');
+INSERT INTO "MRREL" VALUES('C0004936','C1845343','RN');
+INSERT INTO "MRREL" VALUES('C0006145','C0037274','PAR');
+INSERT INTO "MRREL" VALUES('C0006145','C2931303','RN');
+INSERT INTO "MRREL" VALUES('C0006261','C0035242','PAR');
+INSERT INTO "MRREL" VALUES('C0006277','C0006261','PAR');
+INSERT INTO "MRREL" VALUES('C0006277','C0035243','PAR');
+INSERT INTO "MRREL" VALUES('C0006277','C0340036','RN');
+INSERT INTO "MRREL" VALUES('C0006277','C0600260','PAR');
+INSERT INTO "MRREL" VALUES('C0007093','C0018799','PAR');
+INSERT INTO "MRREL" VALUES('C0007093','C0024586','PAR');
+INSERT INTO "MRREL" VALUES('C0007095','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0007095','C0206754','PAR');
+INSERT INTO "MRREL" VALUES('C0007097','C0027660','PAR');
+INSERT INTO "MRREL" VALUES('C0007097','C0431109','RN');
+INSERT INTO "MRREL" VALUES('C0007097','C0546476','RN');
+INSERT INTO "MRREL" VALUES('C0007099','C0007097','PAR');
+INSERT INTO "MRREL" VALUES('C0007120','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0007124','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0007124','C0154084','PAR');
+INSERT INTO "MRREL" VALUES('C0007124','C0206768','PAR');
+INSERT INTO "MRREL" VALUES('C0007129','C0041374','PAR');
+INSERT INTO "MRREL" VALUES('C0007129','C0206695','PAR');
+INSERT INTO "MRREL" VALUES('C0007129','C0949804','PAR');
+INSERT INTO "MRREL" VALUES('C0007130','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0007130','C0206767','PAR');
+INSERT INTO "MRREL" VALUES('C0007134','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0007134','C0022665','PAR');
+INSERT INTO "MRREL" VALUES('C0007135','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0007222','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0008497','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0008497','C0041182','PAR');
+INSERT INTO "MRREL" VALUES('C0008677','C0006277','PAR');
+INSERT INTO "MRREL" VALUES('C0008677','C0024117','PAR');
+INSERT INTO "MRREL" VALUES('C0010606','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0010631','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0010631','C0206767','PAR');
+INSERT INTO "MRREL" VALUES('C0010631','C2931410','RN');
+INSERT INTO "MRREL" VALUES('C0011993','C0206695','PAR');
+INSERT INTO "MRREL" VALUES('C0011993','C1328479','PAR');
+INSERT INTO "MRREL" VALUES('C0012242','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0012243','C0012242','PAR');
+INSERT INTO "MRREL" VALUES('C0012243','C0027653','PAR');
+INSERT INTO "MRREL" VALUES('C0012674','C1256741','PAR');
+INSERT INTO "MRREL" VALUES('C0012922','C0042769','PAR');
+INSERT INTO "MRREL" VALUES('C0014130','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0014130','C0271583','RN');
+INSERT INTO "MRREL" VALUES('C0014130','C1833053','RN');
+INSERT INTO "MRREL" VALUES('C0014132','C0014130','PAR');
+INSERT INTO "MRREL" VALUES('C0014132','C0027653','PAR');
+INSERT INTO "MRREL" VALUES('C0014170','C0042138','PAR');
+INSERT INTO "MRREL" VALUES('C0017150','C1328479','PAR');
+INSERT INTO "MRREL" VALUES('C0017411','C1720887','PAR');
+INSERT INTO "MRREL" VALUES('C0017416','C0042065','PAR');
+INSERT INTO "MRREL" VALUES('C0017689','C1328479','PAR');
+INSERT INTO "MRREL" VALUES('C0018050','C0014130','PAR');
+INSERT INTO "MRREL" VALUES('C0018799','C0007222','PAR');
+INSERT INTO "MRREL" VALUES('C0018799','C2931296','RN');
+INSERT INTO "MRREL" VALUES('C0022658','C0042075','PAR');
+INSERT INTO "MRREL" VALUES('C0022658','C1848813','RN');
+INSERT INTO "MRREL" VALUES('C0022658','C2673196','RN');
+INSERT INTO "MRREL" VALUES('C0022658','C2676788','RN');
+INSERT INTO "MRREL" VALUES('C0022658','C3501777','RN');
+INSERT INTO "MRREL" VALUES('C0022665','C0022658','PAR');
+INSERT INTO "MRREL" VALUES('C0022665','C0042076','PAR');
+INSERT INTO "MRREL" VALUES('C0022790','C0206696','PAR');
+INSERT INTO "MRREL" VALUES('C0023743','C0007135','PAR');
+INSERT INTO "MRREL" VALUES('C0023895','C0012242','PAR');
+INSERT INTO "MRREL" VALUES('C0023903','C0012243','PAR');
+INSERT INTO "MRREL" VALUES('C0023903','C0023895','PAR');
+INSERT INTO "MRREL" VALUES('C0024115','C0035242','PAR');
+INSERT INTO "MRREL" VALUES('C0024115','C1384901','RN');
+INSERT INTO "MRREL" VALUES('C0024115','C1849554','RN');
+INSERT INTO "MRREL" VALUES('C0024117','C0600260','PAR');
+INSERT INTO "MRREL" VALUES('C0024117','C1854729','RN');
+INSERT INTO "MRREL" VALUES('C0024586','C0007095','PAR');
+INSERT INTO "MRREL" VALUES('C0027651','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0027652','C0027651','PAR');
+INSERT INTO "MRREL" VALUES('C0027653','C0027651','PAR');
+INSERT INTO "MRREL" VALUES('C0027658','C0027652','PAR');
+INSERT INTO "MRREL" VALUES('C0027658','C3496549','RN');
+INSERT INTO "MRREL" VALUES('C0027660','C0027652','PAR');
+INSERT INTO "MRREL" VALUES('C0027660','C1266101','RN');
+INSERT INTO "MRREL" VALUES('C0027665','C0027652','PAR');
+INSERT INTO "MRREL" VALUES('C0029928','C0001576','PAR');
+INSERT INTO "MRREL" VALUES('C0029928','C0018050','PAR');
+INSERT INTO "MRREL" VALUES('C0030186','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0030186','C0206768','PAR');
+INSERT INTO "MRREL" VALUES('C0030286','C0012242','PAR');
+INSERT INTO "MRREL" VALUES('C0030297','C0012243','PAR');
+INSERT INTO "MRREL" VALUES('C0030297','C0014132','PAR');
+INSERT INTO "MRREL" VALUES('C0030297','C0030286','PAR');
+INSERT INTO "MRREL" VALUES('C0030297','C0235974','RN');
+INSERT INTO "MRREL" VALUES('C0030297','C2930839','RN');
+INSERT INTO "MRREL" VALUES('C0030297','C2930967','RN');
+INSERT INTO "MRREL" VALUES('C0032962','C0268318','RN');
+INSERT INTO "MRREL" VALUES('C0032962','C0269680','RN');
+INSERT INTO "MRREL" VALUES('C0032962','C1720765','PAR');
+INSERT INTO "MRREL" VALUES('C0032966','C0027651','PAR');
+INSERT INTO "MRREL" VALUES('C0032966','C0032962','PAR');
+INSERT INTO "MRREL" VALUES('C0034049','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0034049','C0035369','PAR');
+INSERT INTO "MRREL" VALUES('C0034049','C0036946','PAR');
+INSERT INTO "MRREL" VALUES('C0034049','C0041374','PAR');
+INSERT INTO "MRREL" VALUES('C0034067','C0024117','PAR');
+INSERT INTO "MRREL" VALUES('C0034067','C0265797','RN');
+INSERT INTO "MRREL" VALUES('C0034067','C1851718','RN');
+INSERT INTO "MRREL" VALUES('C0035242','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0035243','C0035242','PAR');
+INSERT INTO "MRREL" VALUES('C0035243','C2749137','RN');
+INSERT INTO "MRREL" VALUES('C0035243','C3714514','PAR');
+INSERT INTO "MRREL" VALUES('C0035369','C0035690','PAR');
+INSERT INTO "MRREL" VALUES('C0035690','C0042769','PAR');
+INSERT INTO "MRREL" VALUES('C0036946','C0003047','PAR');
+INSERT INTO "MRREL" VALUES('C0037274','C0175166','PAR');
+INSERT INTO "MRREL" VALUES('C0037274','C1857314','RN');
+INSERT INTO "MRREL" VALUES('C0037274','C1858302','RN');
+INSERT INTO "MRREL" VALUES('C0037661','C0206695','PAR');
+INSERT INTO "MRREL" VALUES('C0037661','C1328479','PAR');
+INSERT INTO "MRREL" VALUES('C0039058','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0041182','C0027658','PAR');
+INSERT INTO "MRREL" VALUES('C0041182','C0032966','PAR');
+INSERT INTO "MRREL" VALUES('C0041374','C0042769','PAR');
+INSERT INTO "MRREL" VALUES('C0042065','C0027653','PAR');
+INSERT INTO "MRREL" VALUES('C0042065','C1720887','PAR');
+INSERT INTO "MRREL" VALUES('C0042065','C1720894','PAR');
+INSERT INTO "MRREL" VALUES('C0042075','C1720887','PAR');
+INSERT INTO "MRREL" VALUES('C0042075','C1720894','PAR');
+INSERT INTO "MRREL" VALUES('C0042076','C0042065','PAR');
+INSERT INTO "MRREL" VALUES('C0042131','C0017411','PAR');
+INSERT INTO "MRREL" VALUES('C0042138','C0017416','PAR');
+INSERT INTO "MRREL" VALUES('C0042138','C0042131','PAR');
+INSERT INTO "MRREL" VALUES('C0042138','C1708350','RN');
+INSERT INTO "MRREL" VALUES('C0042769','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0149654','C0236964','PAR');
+INSERT INTO "MRREL" VALUES('C0154084','C0001418','RN');
+INSERT INTO "MRREL" VALUES('C0154084','C0001618','RB');
+INSERT INTO "MRREL" VALUES('C0154084','C0007099','PAR');
+INSERT INTO "MRREL" VALUES('C0154084','C1458155','PAR');
+INSERT INTO "MRREL" VALUES('C0175166','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C0206093','C0027658','PAR');
+INSERT INTO "MRREL" VALUES('C0206093','C0027665','PAR');
+INSERT INTO "MRREL" VALUES('C0206666','C0008497','PAR');
+INSERT INTO "MRREL" VALUES('C0206681','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206682','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206683','C0001420','PAR');
+INSERT INTO "MRREL" VALUES('C0206683','C0206682','PAR');
+INSERT INTO "MRREL" VALUES('C0206684','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206684','C0206766','PAR');
+INSERT INTO "MRREL" VALUES('C0206685','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206686','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206686','C0001618','PAR');
+INSERT INTO "MRREL" VALUES('C0206687','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206687','C0014170','PAR');
+INSERT INTO "MRREL" VALUES('C0206687','C0919267','PAR');
+INSERT INTO "MRREL" VALUES('C0206692','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206692','C0206768','PAR');
+INSERT INTO "MRREL" VALUES('C0206692','C1458155','PAR');
+INSERT INTO "MRREL" VALUES('C0206693','C0206695','PAR');
+INSERT INTO "MRREL" VALUES('C0206693','C0206768','PAR');
+INSERT INTO "MRREL" VALUES('C0206694','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206694','C0206767','PAR');
+INSERT INTO "MRREL" VALUES('C0206695','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206695','C0206754','PAR');
+INSERT INTO "MRREL" VALUES('C0206695','C1863649','RN');
+INSERT INTO "MRREL" VALUES('C0206696','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206696','C0206767','PAR');
+INSERT INTO "MRREL" VALUES('C0206697','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206697','C0206766','PAR');
+INSERT INTO "MRREL" VALUES('C0206698','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0206699','C0010631','PAR');
+INSERT INTO "MRREL" VALUES('C0206700','C0010631','PAR');
+INSERT INTO "MRREL" VALUES('C0206701','C0010631','PAR');
+INSERT INTO "MRREL" VALUES('C0206702','C0206698','PAR');
+INSERT INTO "MRREL" VALUES('C0206754','C0206093','PAR');
+INSERT INTO "MRREL" VALUES('C0206754','C2930967','RN');
+INSERT INTO "MRREL" VALUES('C0206766','C0027660','PAR');
+INSERT INTO "MRREL" VALUES('C0206767','C0027660','PAR');
+INSERT INTO "MRREL" VALUES('C0206767','C1840586','RN');
+INSERT INTO "MRREL" VALUES('C0206768','C0027660','PAR');
+INSERT INTO "MRREL" VALUES('C0236964','C1535926','PAR');
+INSERT INTO "MRREL" VALUES('C0334276','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C0334276','C0007099','PAR');
+INSERT INTO "MRREL" VALUES('C0334276','C3850167','PAR');
+INSERT INTO "MRREL" VALUES('C0600260','C0024115','PAR');
+INSERT INTO "MRREL" VALUES('C0887833','C0030297','PAR');
+INSERT INTO "MRREL" VALUES('C0887833','C1176475','PAR');
+INSERT INTO "MRREL" VALUES('C0919267','C0014132','PAR');
+INSERT INTO "MRREL" VALUES('C0919267','C0017416','PAR');
+INSERT INTO "MRREL" VALUES('C0919267','C0029928','PAR');
+INSERT INTO "MRREL" VALUES('C0919267','C0149951','RN');
+INSERT INTO "MRREL" VALUES('C0919267','C0237020','RN');
+INSERT INTO "MRREL" VALUES('C0949804','C0012922','PAR');
+INSERT INTO "MRREL" VALUES('C1134719','C1176475','PAR');
+INSERT INTO "MRREL" VALUES('C1134719','C1458155','PAR');
+INSERT INTO "MRREL" VALUES('C1135873','C0008497','PAR');
+INSERT INTO "MRREL" VALUES('C1176475','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C1176475','C0206768','PAR');
+INSERT INTO "MRREL" VALUES('C1256749','C1256741','PAR');
+INSERT INTO "MRREL" VALUES('C1263846','C0236964','PAR');
+INSERT INTO "MRREL" VALUES('C1266065','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C1328479','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C1328479','C0030297','PAR');
+INSERT INTO "MRREL" VALUES('C1458155','C0006145','PAR');
+INSERT INTO "MRREL" VALUES('C1458155','C0027653','PAR');
+INSERT INTO "MRREL" VALUES('C1458155','C0346153','RN');
+INSERT INTO "MRREL" VALUES('C1458155','C1868647','RN');
+INSERT INTO "MRREL" VALUES('C1458155','C2931144','RN');
+INSERT INTO "MRREL" VALUES('C1535926','C0004936','PAR');
+INSERT INTO "MRREL" VALUES('C1720765','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C1720887','C1720765','PAR');
+INSERT INTO "MRREL" VALUES('C1720894','C0012674','PAR');
+INSERT INTO "MRREL" VALUES('C2239176','C0001418','PAR');
+INSERT INTO "MRREL" VALUES('C2239176','C0023903','PAR');
+INSERT INTO "MRREL" VALUES('C2239176','C2676033','RN');
+INSERT INTO "MRREL" VALUES('C2930839','C0001420','RN');
+INSERT INTO "MRREL" VALUES('C3714514','C0004615','PAR');
+INSERT INTO "MRREL" VALUES('C3850167','C0039058','PAR');
+INSERT INTO "MRREL" VALUES('C9000001','C9000002','RN');
+CREATE TABLE MRSAT (CUI text, CODE text, ATN text, ATV text);
+INSERT INTO "MRSAT" VALUES('C0001418','D000230','MN','C04.557.470.200.025');
+INSERT INTO "MRSAT" VALUES('C0001418','D000230','TH','');
+INSERT INTO "MRSAT" VALUES('C0001420','D000231','MN','C04.557.470.200.025.085');
+INSERT INTO "MRSAT" VALUES('C0001420','D000231','TH','');
+INSERT INTO "MRSAT" VALUES('C0001576','D000291','MN','C13.351.500.056');
+INSERT INTO "MRSAT" VALUES('C0001576','D000291','TH','');
+INSERT INTO "MRSAT" VALUES('C0001614','D000303','MN','C19.053.098');
+INSERT INTO "MRSAT" VALUES('C0001614','D000303','TH','');
+INSERT INTO "MRSAT" VALUES('C0001618','D000306','MN','C04.588.322.078.265');
+INSERT INTO "MRSAT" VALUES('C0001618','D000306','MN','C19.053.098.265');
+INSERT INTO "MRSAT" VALUES('C0001618','D000306','MN','C19.053.347.500');
+INSERT INTO "MRSAT" VALUES('C0001618','D000306','MN','C19.344.078.265');
+INSERT INTO "MRSAT" VALUES('C0001618','D000306','TH','');
+INSERT INTO "MRSAT" VALUES('C0001621','D000307','MN','C19.053');
+INSERT INTO "MRSAT" VALUES('C0001621','D000307','TH','');
+INSERT INTO "MRSAT" VALUES('C0001624','D000310','MN','C04.588.322.078');
+INSERT INTO "MRSAT" VALUES('C0001624','D000310','MN','C19.053.347');
+INSERT INTO "MRSAT" VALUES('C0001624','D000310','MN','C19.344.078');
+INSERT INTO "MRSAT" VALUES('C0001624','D000310','TH','');
+INSERT INTO "MRSAT" VALUES('C0003047','D000820','MN','C22');
+INSERT INTO "MRSAT" VALUES('C0003047','D000820','TH','');
+INSERT INTO "MRSAT" VALUES('C0004615','D001423','MN','C01');
+INSERT INTO "MRSAT" VALUES('C0004615','D001423','TH','');
+INSERT INTO "MRSAT" VALUES('C0004930','D001523','TH','');
+INSERT INTO "MRSAT" VALUES('C0004936','D001523','MN','F03');
+INSERT INTO "MRSAT" VALUES('C0004936','D001523','TH','');
+INSERT INTO "MRSAT" VALUES('C0006142','D001943','TH','');
+INSERT INTO "MRSAT" VALUES('C0006145','D001941','MN','C17.800.090');
+INSERT INTO "MRSAT" VALUES('C0006145','D001941','TH','');
+INSERT INTO "MRSAT" VALUES('C0006261','D001982','MN','C08.127');
+INSERT INTO "MRSAT" VALUES('C0006261','D001982','TH','');
+INSERT INTO "MRSAT" VALUES('C0006277','D001991','MN','C08.127.446');
+INSERT INTO "MRSAT" VALUES('C0006277','D001991','MN','C08.381.495.146');
+INSERT INTO "MRSAT" VALUES('C0006277','D001991','MN','C08.730.099');
+INSERT INTO "MRSAT" VALUES('C0006277','D001991','TH','');
+INSERT INTO "MRSAT" VALUES('C0006826','D009369','TH','');
+INSERT INTO "MRSAT" VALUES('C0007093','D002275','MN','C04.557.465.625.650.200.500.205');
+INSERT INTO "MRSAT" VALUES('C0007093','D002275','MN','C04.557.470.200.025.200.500.205');
+INSERT INTO "MRSAT" VALUES('C0007093','D002275','MN','C04.557.580.625.650.200.500.205');
+INSERT INTO "MRSAT" VALUES('C0007093','D002275','MN','C14.280.104');
+INSERT INTO "MRSAT" VALUES('C0007093','D002275','TH','');
+INSERT INTO "MRSAT" VALUES('C0007095','D002276','MN','C04.557.465.625.650.200');
+INSERT INTO "MRSAT" VALUES('C0007095','D002276','MN','C04.557.470.200.025.200');
+INSERT INTO "MRSAT" VALUES('C0007095','D002276','MN','C04.557.580.625.650.200');
+INSERT INTO "MRSAT" VALUES('C0007095','D002276','TH','');
+INSERT INTO "MRSAT" VALUES('C0007097','D002277','MN','C04.557.470.200');
+INSERT INTO "MRSAT" VALUES('C0007097','D002277','TH','');
+INSERT INTO "MRSAT" VALUES('C0007099','D002278','MN','C04.557.470.200.240');
+INSERT INTO "MRSAT" VALUES('C0007099','D002278','TH','');
+INSERT INTO "MRSAT" VALUES('C0007120','D002282','MN','C04.557.470.200.025.030');
+INSERT INTO "MRSAT" VALUES('C0007120','D002282','TH','');
+INSERT INTO "MRSAT" VALUES('C0007124','D002285','MN','C04.557.470.200.025.275');
+INSERT INTO "MRSAT" VALUES('C0007124','D002285','MN','C04.557.470.200.240.187.250');
+INSERT INTO "MRSAT" VALUES('C0007124','D002285','MN','C04.557.470.615.275');
+INSERT INTO "MRSAT" VALUES('C0007124','D002285','TH','');
+INSERT INTO "MRSAT" VALUES('C0007129','D015266','MN','C02.256.721.150');
+INSERT INTO "MRSAT" VALUES('C0007129','D015266','MN','C02.928.216');
+INSERT INTO "MRSAT" VALUES('C0007129','D015266','MN','C04.557.465.625.650.240.325');
+INSERT INTO "MRSAT" VALUES('C0007129','D015266','MN','C04.557.470.200.025.370.325');
+INSERT INTO "MRSAT" VALUES('C0007129','D015266','MN','C04.557.580.625.650.240.325');
+INSERT INTO "MRSAT" VALUES('C0007129','D015266','TH','');
+INSERT INTO "MRSAT" VALUES('C0007130','D002288','MN','C04.557.470.200.025.075');
+INSERT INTO "MRSAT" VALUES('C0007130','D002288','MN','C04.557.470.590.075');
+INSERT INTO "MRSAT" VALUES('C0007130','D002288','TH','');
+INSERT INTO "MRSAT" VALUES('C0007134','D002292','MN','C04.557.470.200.025.390');
+INSERT INTO "MRSAT" VALUES('C0007134','D002292','MN','C04.588.945.947.535.160');
+INSERT INTO "MRSAT" VALUES('C0007134','D002292','MN','C12.758.820.750.160');
+INSERT INTO "MRSAT" VALUES('C0007134','D002292','MN','C12.777.419.473.160');
+INSERT INTO "MRSAT" VALUES('C0007134','D002292','MN','C13.351.937.820.535.160');
+INSERT INTO "MRSAT" VALUES('C0007134','D002292','MN','C13.351.968.419.473.160');
+INSERT INTO "MRSAT" VALUES('C0007134','D002292','TH','');
+INSERT INTO "MRSAT" VALUES('C0007135','D002293','MN','C04.557.470.200.025.095');
+INSERT INTO "MRSAT" VALUES('C0007135','D002293','TH','');
+INSERT INTO "MRSAT" VALUES('C0007222','D002318','MN','C14');
+INSERT INTO "MRSAT" VALUES('C0007222','D002318','TH','');
+INSERT INTO "MRSAT" VALUES('C0008497','D002822','MN','C04.557.465.955.207');
+INSERT INTO "MRSAT" VALUES('C0008497','D002822','MN','C04.557.470.200.025.455');
+INSERT INTO "MRSAT" VALUES('C0008497','D002822','MN','C04.850.908.208');
+INSERT INTO "MRSAT" VALUES('C0008497','D002822','MN','C13.703.720.949.208');
+INSERT INTO "MRSAT" VALUES('C0008497','D002822','TH','');
+INSERT INTO "MRSAT" VALUES('C0008677','D029481','MN','C08.127.446.567');
+INSERT INTO "MRSAT" VALUES('C0008677','D029481','MN','C08.381.495.146.567');
+INSERT INTO "MRSAT" VALUES('C0008677','D029481','MN','C08.381.495.389.500');
+INSERT INTO "MRSAT" VALUES('C0008677','D029481','MN','C08.730.099.567');
+INSERT INTO "MRSAT" VALUES('C0008677','D029481','TH','');
+INSERT INTO "MRSAT" VALUES('C0010606','D003528','MN','C04.557.470.200.025.220');
+INSERT INTO "MRSAT" VALUES('C0010606','D003528','TH','');
+INSERT INTO "MRSAT" VALUES('C0010631','D003536','MN','C04.557.470.200.025.480');
+INSERT INTO "MRSAT" VALUES('C0010631','D003536','MN','C04.557.470.590.480');
+INSERT INTO "MRSAT" VALUES('C0010631','D003536','TH','');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','MN','C04.557.465.625.650.240.847');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','MN','C04.557.470.200.025.370.847');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','MN','C04.588.274.761.500.750');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','MN','C04.588.322.475.500.750');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','MN','C06.301.761.500.750');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','MN','C06.689.667.500.750');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','MN','C19.344.421.500.750');
+INSERT INTO "MRSAT" VALUES('C0011993','D003969','TH','');
+INSERT INTO "MRSAT" VALUES('C0012242','D004066','MN','C06');
+INSERT INTO "MRSAT" VALUES('C0012242','D004066','TH','');
+INSERT INTO "MRSAT" VALUES('C0012243','D004067','MN','C04.588.274');
+INSERT INTO "MRSAT" VALUES('C0012243','D004067','MN','C06.301');
+INSERT INTO "MRSAT" VALUES('C0012243','D004067','TH','');
+INSERT INTO "MRSAT" VALUES('C0012734','D019958','TH','');
+INSERT INTO "MRSAT" VALUES('C0012922','D004266','MN','C02.256');
+INSERT INTO "MRSAT" VALUES('C0012922','D004266','TH','');
+INSERT INTO "MRSAT" VALUES('C0014130','D004700','MN','C19');
+INSERT INTO "MRSAT" VALUES('C0014130','D004700','TH','');
+INSERT INTO "MRSAT" VALUES('C0014132','D004701','MN','C04.588.322');
+INSERT INTO "MRSAT" VALUES('C0014132','D004701','MN','C19.344');
+INSERT INTO "MRSAT" VALUES('C0014132','D004701','TH','');
+INSERT INTO "MRSAT" VALUES('C0014170','D016889','MN','C04.588.945.418.948.585');
+INSERT INTO "MRSAT" VALUES('C0014170','D016889','MN','C13.351.500.852.762.200');
+INSERT INTO "MRSAT" VALUES('C0014170','D016889','MN','C13.351.937.418.875.200');
+INSERT INTO "MRSAT" VALUES('C0014170','D016889','TH','');
+INSERT INTO "MRSAT" VALUES('C0016047','D014412','TH','');
+INSERT INTO "MRSAT" VALUES('C0017150','D015408','MN','C04.557.470.200.025.290.500');
+INSERT INTO "MRSAT" VALUES('C0017150','D015408','MN','C04.588.274.761.500.124');
+INSERT INTO "MRSAT" VALUES('C0017150','D015408','MN','C04.588.322.475.500.124');
+INSERT INTO "MRSAT" VALUES('C0017150','D015408','MN','C06.301.761.500.124');
+INSERT INTO "MRSAT" VALUES('C0017150','D015408','MN','C06.689.667.500.124');
+INSERT INTO "MRSAT" VALUES('C0017150','D015408','MN','C19.344.421.500.124');
+INSERT INTO "MRSAT" VALUES('C0017150','D015408','TH','');
+INSERT INTO "MRSAT" VALUES('C0017411','D005831','MN','C13.351.500');
+INSERT INTO "MRSAT" VALUES('C0017411','D005831','TH','');
+INSERT INTO "MRSAT" VALUES('C0017416','D005833','MN','C04.588.945.418');
+INSERT INTO "MRSAT" VALUES('C0017416','D005833','MN','C13.351.937.418');
+INSERT INTO "MRSAT" VALUES('C0017416','D005833','TH','');
+INSERT INTO "MRSAT" VALUES('C0017689','D005935','MN','C04.557.470.200.025.290.750');
+INSERT INTO "MRSAT" VALUES('C0017689','D005935','MN','C04.588.274.761.500.249');
+INSERT INTO "MRSAT" VALUES('C0017689','D005935','MN','C04.588.322.475.500.249');
+INSERT INTO "MRSAT" VALUES('C0017689','D005935','MN','C06.301.761.500.249');
+INSERT INTO "MRSAT" VALUES('C0017689','D005935','MN','C06.689.667.500.249');
+INSERT INTO "MRSAT" VALUES('C0017689','D005935','MN','C19.344.421.500.249');
+INSERT INTO "MRSAT" VALUES('C0017689','D005935','TH','');
+INSERT INTO "MRSAT" VALUES('C0018050','D006058','MN','C19.391');
+INSERT INTO "MRSAT" VALUES('C0018050','D006058','TH','');
+INSERT INTO "MRSAT" VALUES('C0018799','D006331','MN','C14.280');
+INSERT INTO "MRSAT" VALUES('C0018799','D006331','TH','');
+INSERT INTO "MRSAT" VALUES('C0021367','D018270','TH','');
+INSERT INTO "MRSAT" VALUES('C0022658','D007674','MN','C12.777.419');
+INSERT INTO "MRSAT" VALUES('C0022658','D007674','MN','C13.351.968.419');
+INSERT INTO "MRSAT" VALUES('C0022658','D007674','TH','');
+INSERT INTO "MRSAT" VALUES('C0022665','D007680','MN','C04.588.945.947.535');
+INSERT INTO "MRSAT" VALUES('C0022665','D007680','MN','C12.758.820.750');
+INSERT INTO "MRSAT" VALUES('C0022665','D007680','MN','C12.777.419.473');
+INSERT INTO "MRSAT" VALUES('C0022665','D007680','MN','C13.351.937.820.535');
+INSERT INTO "MRSAT" VALUES('C0022665','D007680','MN','C13.351.968.419.473');
+INSERT INTO "MRSAT" VALUES('C0022665','D007680','TH','');
+INSERT INTO "MRSAT" VALUES('C0022790','D007725','MN','C04.557.470.200.025.415.410');
+INSERT INTO "MRSAT" VALUES('C0022790','D007725','MN','C04.557.470.590.415.410');
+INSERT INTO "MRSAT" VALUES('C0022790','D007725','TH','');
+INSERT INTO "MRSAT" VALUES('C0023743','D008039','MN','C04.557.470.200.025.095.410');
+INSERT INTO "MRSAT" VALUES('C0023743','D008039','TH','');
+INSERT INTO "MRSAT" VALUES('C0023895','D008107','MN','C06.552');
+INSERT INTO "MRSAT" VALUES('C0023895','D008107','TH','');
+INSERT INTO "MRSAT" VALUES('C0023903','D008113','MN','C04.588.274.623');
+INSERT INTO "MRSAT" VALUES('C0023903','D008113','MN','C06.301.623');
+INSERT INTO "MRSAT" VALUES('C0023903','D008113','MN','C06.552.697');
+INSERT INTO "MRSAT" VALUES('C0023903','D008113','TH','');
+INSERT INTO "MRSAT" VALUES('C0024115','D008171','MN','C08.381');
+INSERT INTO "MRSAT" VALUES('C0024115','D008171','TH','');
+INSERT INTO "MRSAT" VALUES('C0024117','D029424','MN','C08.381.495.389');
+INSERT INTO "MRSAT" VALUES('C0024117','D029424','TH','');
+INSERT INTO "MRSAT" VALUES('C0024586','D008303','MN','C04.557.465.625.650.200.500');
+INSERT INTO "MRSAT" VALUES('C0024586','D008303','MN','C04.557.470.200.025.200.500');
+INSERT INTO "MRSAT" VALUES('C0024586','D008303','MN','C04.557.580.625.650.200.500');
+INSERT INTO "MRSAT" VALUES('C0024586','D008303','TH','');
+INSERT INTO "MRSAT" VALUES('C0027651','D009369','MN','C04');
+INSERT INTO "MRSAT" VALUES('C0027651','D009369','TH','');
+INSERT INTO "MRSAT" VALUES('C0027652','D009370','MN','C04.557');
+INSERT INTO "MRSAT" VALUES('C0027652','D009370','TH','');
+INSERT INTO "MRSAT" VALUES('C0027653','D009371','MN','C04.588');
+INSERT INTO "MRSAT" VALUES('C0027653','D009371','TH','');
+INSERT INTO "MRSAT" VALUES('C0027654','D009373','TH','');
+INSERT INTO "MRSAT" VALUES('C0027658','D009373','MN','C04.557.465');
+INSERT INTO "MRSAT" VALUES('C0027658','D009373','TH','');
+INSERT INTO "MRSAT" VALUES('C0027660','D009375','MN','C04.557.470');
+INSERT INTO "MRSAT" VALUES('C0027660','D009375','TH','');
+INSERT INTO "MRSAT" VALUES('C0027665','D009380','MN','C04.557.580');
+INSERT INTO "MRSAT" VALUES('C0027665','D009380','TH','');
+INSERT INTO "MRSAT" VALUES('C0029121','D019958','TH','');
+INSERT INTO "MRSAT" VALUES('C0029928','D010049','MN','C13.351.500.056.630');
+INSERT INTO "MRSAT" VALUES('C0029928','D010049','MN','C19.391.630');
+INSERT INTO "MRSAT" VALUES('C0029928','D010049','TH','');
+INSERT INTO "MRSAT" VALUES('C0030186','D010145','MN','C04.557.470.200.025.660');
+INSERT INTO "MRSAT" VALUES('C0030186','D010145','MN','C04.557.470.615.660');
+INSERT INTO "MRSAT" VALUES('C0030186','D010145','TH','');
+INSERT INTO "MRSAT" VALUES('C0030286','D010182','MN','C06.689');
+INSERT INTO "MRSAT" VALUES('C0030286','D010182','TH','');
+INSERT INTO "MRSAT" VALUES('C0030297','D010190','MN','C04.588.274.761');
+INSERT INTO "MRSAT" VALUES('C0030297','D010190','MN','C04.588.322.475');
+INSERT INTO "MRSAT" VALUES('C0030297','D010190','MN','C06.301.761');
+INSERT INTO "MRSAT" VALUES('C0030297','D010190','MN','C06.689.667');
+INSERT INTO "MRSAT" VALUES('C0030297','D010190','MN','C19.344.421');
+INSERT INTO "MRSAT" VALUES('C0030297','D010190','TH','');
+INSERT INTO "MRSAT" VALUES('C0030357','D014412','TH','');
+INSERT INTO "MRSAT" VALUES('C0032962','D011248','MN','C13.703');
+INSERT INTO "MRSAT" VALUES('C0032962','D011248','TH','');
+INSERT INTO "MRSAT" VALUES('C0032966','D011252','MN','C04.850');
+INSERT INTO "MRSAT" VALUES('C0032966','D011252','MN','C13.703.720');
+INSERT INTO "MRSAT" VALUES('C0032966','D011252','TH','');
+INSERT INTO "MRSAT" VALUES('C0034049','D011648','MN','C02.782.815.725');
+INSERT INTO "MRSAT" VALUES('C0034049','D011648','MN','C02.928.740');
+INSERT INTO "MRSAT" VALUES('C0034049','D011648','MN','C04.557.470.200.025.715');
+INSERT INTO "MRSAT" VALUES('C0034049','D011648','MN','C22.836.715');
+INSERT INTO "MRSAT" VALUES('C0034049','D011648','TH','');
+INSERT INTO "MRSAT" VALUES('C0034067','D011656','MN','C08.381.495.389.750');
+INSERT INTO "MRSAT" VALUES('C0034067','D011656','TH','');
+INSERT INTO "MRSAT" VALUES('C0035242','D012140','MN','C08');
+INSERT INTO "MRSAT" VALUES('C0035242','D012140','TH','');
+INSERT INTO "MRSAT" VALUES('C0035243','D012141','MN','C01.539.739');
+INSERT INTO "MRSAT" VALUES('C0035243','D012141','MN','C08.730');
+INSERT INTO "MRSAT" VALUES('C0035243','D012141','TH','');
+INSERT INTO "MRSAT" VALUES('C0035369','D012192','MN','C02.782.815');
+INSERT INTO "MRSAT" VALUES('C0035369','D012192','TH','');
+INSERT INTO "MRSAT" VALUES('C0035690','D012327','MN','C02.782');
+INSERT INTO "MRSAT" VALUES('C0035690','D012327','TH','');
+INSERT INTO "MRSAT" VALUES('C0036946','D012757','MN','C22.836');
+INSERT INTO "MRSAT" VALUES('C0036946','D012757','TH','');
+INSERT INTO "MRSAT" VALUES('C0037274','D012871','MN','C17.800');
+INSERT INTO "MRSAT" VALUES('C0037274','D012871','TH','');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','MN','C04.557.465.625.650.240.695');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','MN','C04.557.470.200.025.370.695');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','MN','C04.588.274.761.500.500');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','MN','C04.588.322.475.500.500');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','MN','C06.301.761.500.500');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','MN','C06.689.667.500.500');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','MN','C19.344.421.500.500');
+INSERT INTO "MRSAT" VALUES('C0037661','D013005','TH','');
+INSERT INTO "MRSAT" VALUES('C0039058','D013568','MN','C23');
+INSERT INTO "MRSAT" VALUES('C0039058','D013568','TH','');
+INSERT INTO "MRSAT" VALUES('C0041182','D014328','MN','C04.557.465.955');
+INSERT INTO "MRSAT" VALUES('C0041182','D014328','MN','C04.850.908');
+INSERT INTO "MRSAT" VALUES('C0041182','D014328','MN','C13.703.720.949');
+INSERT INTO "MRSAT" VALUES('C0041182','D014328','TH','');
+INSERT INTO "MRSAT" VALUES('C0041374','D014412','MN','C02.928');
+INSERT INTO "MRSAT" VALUES('C0041374','D014412','TH','');
+INSERT INTO "MRSAT" VALUES('C0041671','D001289','TH','');
+INSERT INTO "MRSAT" VALUES('C0041912','D012141','TH','');
+INSERT INTO "MRSAT" VALUES('C0042065','D014565','MN','C04.588.945');
+INSERT INTO "MRSAT" VALUES('C0042065','D014565','MN','C12.758');
+INSERT INTO "MRSAT" VALUES('C0042065','D014565','MN','C13.351.937');
+INSERT INTO "MRSAT" VALUES('C0042065','D014565','TH','');
+INSERT INTO "MRSAT" VALUES('C0042075','D014570','MN','C12.777');
+INSERT INTO "MRSAT" VALUES('C0042075','D014570','MN','C13.351.968');
+INSERT INTO "MRSAT" VALUES('C0042075','D014570','TH','');
+INSERT INTO "MRSAT" VALUES('C0042076','D014571','MN','C04.588.945.947');
+INSERT INTO "MRSAT" VALUES('C0042076','D014571','MN','C12.758.820');
+INSERT INTO "MRSAT" VALUES('C0042076','D014571','MN','C13.351.937.820');
+INSERT INTO "MRSAT" VALUES('C0042076','D014571','TH','');
+INSERT INTO "MRSAT" VALUES('C0042131','D014591','MN','C13.351.500.852');
+INSERT INTO "MRSAT" VALUES('C0042131','D014591','TH','');
+INSERT INTO "MRSAT" VALUES('C0042138','D014594','MN','C04.588.945.418.948');
+INSERT INTO "MRSAT" VALUES('C0042138','D014594','MN','C13.351.500.852.762');
+INSERT INTO "MRSAT" VALUES('C0042138','D014594','MN','C13.351.937.418.875');
+INSERT INTO "MRSAT" VALUES('C0042138','D014594','TH','');
+INSERT INTO "MRSAT" VALUES('C0042769','D014777','MN','C02');
+INSERT INTO "MRSAT" VALUES('C0042769','D014777','TH','');
+INSERT INTO "MRSAT" VALUES('C0086565','D008107','TH','');
+INSERT INTO "MRSAT" VALUES('C0086692','D009369','TH','');
+INSERT INTO "MRSAT" VALUES('C0086768','D003969','TH','');
+INSERT INTO "MRSAT" VALUES('C0149654','D019955','MN','F03.625.094.300');
+INSERT INTO "MRSAT" VALUES('C0149654','D019955','TH','');
+INSERT INTO "MRSAT" VALUES('C0149951','C562391','TH','');
+INSERT INTO "MRSAT" VALUES('C0152013','C538231','TH','');
+INSERT INTO "MRSAT" VALUES('C0153567','D014594','TH','');
+INSERT INTO "MRSAT" VALUES('C0154084','D000071960','MN','C04.557.470.200.240.187');
+INSERT INTO "MRSAT" VALUES('C0154084','D000071960','MN','C04.588.180.130');
+INSERT INTO "MRSAT" VALUES('C0154084','D000071960','MN','C17.800.090.500.130');
+INSERT INTO "MRSAT" VALUES('C0154084','D000071960','TERMUI','T000001');
+INSERT INTO "MRSAT" VALUES('C0154084','D000071960','TH','');
+INSERT INTO "MRSAT" VALUES('C0175166','D017437','MN','C17');
+INSERT INTO "MRSAT" VALUES('C0175166','D017437','TH','');
+INSERT INTO "MRSAT" VALUES('C0205641','D000230','TH','');
+INSERT INTO "MRSAT" VALUES('C0205642','D000230','TH','');
+INSERT INTO "MRSAT" VALUES('C0205643','D000230','TH','');
+INSERT INTO "MRSAT" VALUES('C0205644','D000230','TH','');
+INSERT INTO "MRSAT" VALUES('C0205645','D000230','TH','');
+INSERT INTO "MRSAT" VALUES('C0205695','D002276','TH','');
+INSERT INTO "MRSAT" VALUES('C0205696','D002277','TH','');
+INSERT INTO "MRSAT" VALUES('C0205697','D002277','TH','');
+INSERT INTO "MRSAT" VALUES('C0205698','D002277','TH','');
+INSERT INTO "MRSAT" VALUES('C0205699','D002277','TH','');
+INSERT INTO "MRSAT" VALUES('C0205851','D009373','TH','');
+INSERT INTO "MRSAT" VALUES('C0205852','D009373','TH','');
+INSERT INTO "MRSAT" VALUES('C0205854','D009375','TH','');
+INSERT INTO "MRSAT" VALUES('C0206093','D017599','MN','C04.557.465.625');
+INSERT INTO "MRSAT" VALUES('C0206093','D017599','MN','C04.557.580.625');
+INSERT INTO "MRSAT" VALUES('C0206093','D017599','TH','');
+INSERT INTO "MRSAT" VALUES('C0206666','D018245','MN','C04.557.465.955.207.875');
+INSERT INTO "MRSAT" VALUES('C0206666','D018245','MN','C04.557.470.200.025.455.875');
+INSERT INTO "MRSAT" VALUES('C0206666','D018245','MN','C04.850.908.208.875');
+INSERT INTO "MRSAT" VALUES('C0206666','D018245','MN','C13.703.720.949.208.875');
+INSERT INTO "MRSAT" VALUES('C0206666','D018245','TH','');
+INSERT INTO "MRSAT" VALUES('C0206681','D018262','MN','C04.557.470.200.025.045');
+INSERT INTO "MRSAT" VALUES('C0206681','D018262','TH','');
+INSERT INTO "MRSAT" VALUES('C0206682','D018263','MN','C04.557.470.200.025.060');
+INSERT INTO "MRSAT" VALUES('C0206682','D018263','TH','');
+INSERT INTO "MRSAT" VALUES('C0206683','D018265','MN','C04.557.470.200.025.060.225');
+INSERT INTO "MRSAT" VALUES('C0206683','D018265','MN','C04.557.470.200.025.085.225');
+INSERT INTO "MRSAT" VALUES('C0206683','D018265','TH','');
+INSERT INTO "MRSAT" VALUES('C0206684','D018266','MN','C04.557.470.200.025.105');
+INSERT INTO "MRSAT" VALUES('C0206684','D018266','MN','C04.557.470.550.105');
+INSERT INTO "MRSAT" VALUES('C0206684','D018266','TH','');
+INSERT INTO "MRSAT" VALUES('C0206685','D018267','MN','C04.557.470.200.025.215');
+INSERT INTO "MRSAT" VALUES('C0206685','D018267','TH','');
+INSERT INTO "MRSAT" VALUES('C0206686','D018268','MN','C04.557.470.200.025.152');
+INSERT INTO "MRSAT" VALUES('C0206686','D018268','MN','C04.588.322.078.265.750');
+INSERT INTO "MRSAT" VALUES('C0206686','D018268','MN','C19.053.098.265.750');
+INSERT INTO "MRSAT" VALUES('C0206686','D018268','MN','C19.053.347.500.750');
+INSERT INTO "MRSAT" VALUES('C0206686','D018268','MN','C19.344.078.265.750');
+INSERT INTO "MRSAT" VALUES('C0206686','D018268','TH','');
+INSERT INTO "MRSAT" VALUES('C0206687','D018269','MN','C04.557.470.200.025.240');
+INSERT INTO "MRSAT" VALUES('C0206687','D018269','MN','C04.588.945.418.948.585.124');
+INSERT INTO "MRSAT" VALUES('C0206687','D018269','MN','C13.351.500.056.630.705.331');
+INSERT INTO "MRSAT" VALUES('C0206687','D018269','MN','C13.351.937.418.685.331');
+INSERT INTO "MRSAT" VALUES('C0206687','D018269','MN','C13.351.937.418.875.200.124');
+INSERT INTO "MRSAT" VALUES('C0206687','D018269','MN','C19.391.630.705.331');
+INSERT INTO "MRSAT" VALUES('C0206687','D018269','TH','');
+INSERT INTO "MRSAT" VALUES('C0206692','D018275','MN','C04.557.470.200.025.305');
+INSERT INTO "MRSAT" VALUES('C0206692','D018275','MN','C04.557.470.615.305');
+INSERT INTO "MRSAT" VALUES('C0206692','D018275','MN','C04.588.180.437');
+INSERT INTO "MRSAT" VALUES('C0206692','D018275','MN','C17.800.090.500.437');
+INSERT INTO "MRSAT" VALUES('C0206692','D018275','TH','');
+INSERT INTO "MRSAT" VALUES('C0206693','D018276','MN','C04.557.465.625.650.240.315');
+INSERT INTO "MRSAT" VALUES('C0206693','D018276','MN','C04.557.470.200.025.370.315');
+INSERT INTO "MRSAT" VALUES('C0206693','D018276','MN','C04.557.470.615.315');
+INSERT INTO "MRSAT" VALUES('C0206693','D018276','MN','C04.557.580.625.650.240.315');
+INSERT INTO "MRSAT" VALUES('C0206693','D018276','TH','');
+INSERT INTO "MRSAT" VALUES('C0206694','D018277','MN','C04.557.470.200.025.340');
+INSERT INTO "MRSAT" VALUES('C0206694','D018277','MN','C04.557.470.590.340');
+INSERT INTO "MRSAT" VALUES('C0206694','D018277','TH','');
+INSERT INTO "MRSAT" VALUES('C0206695','D018278','MN','C04.557.465.625.650.240');
+INSERT INTO "MRSAT" VALUES('C0206695','D018278','MN','C04.557.470.200.025.370');
+INSERT INTO "MRSAT" VALUES('C0206695','D018278','MN','C04.557.580.625.650.240');
+INSERT INTO "MRSAT" VALUES('C0206695','D018278','TH','');
+INSERT INTO "MRSAT" VALUES('C0206696','D018279','MN','C04.557.470.200.025.415');
+INSERT INTO "MRSAT" VALUES('C0206696','D018279','MN','C04.557.470.590.415');
+INSERT INTO "MRSAT" VALUES('C0206696','D018279','TH','');
+INSERT INTO "MRSAT" VALUES('C0206697','D018280','MN','C04.557.470.200.025.420');
+INSERT INTO "MRSAT" VALUES('C0206697','D018280','MN','C04.557.470.550.420');
+INSERT INTO "MRSAT" VALUES('C0206697','D018280','TH','');
+INSERT INTO "MRSAT" VALUES('C0206698','D018281','MN','C04.557.470.200.025.450');
+INSERT INTO "MRSAT" VALUES('C0206698','D018281','TH','');
+INSERT INTO "MRSAT" VALUES('C0206699','D018282','MN','C04.557.470.200.025.480.225');
+INSERT INTO "MRSAT" VALUES('C0206699','D018282','MN','C04.557.470.590.480.225');
+INSERT INTO "MRSAT" VALUES('C0206699','D018282','TH','');
+INSERT INTO "MRSAT" VALUES('C0206700','D018283','MN','C04.557.470.200.025.480.230');
+INSERT INTO "MRSAT" VALUES('C0206700','D018283','MN','C04.557.470.590.480.230');
+INSERT INTO "MRSAT" VALUES('C0206700','D018283','TH','');
+INSERT INTO "MRSAT" VALUES('C0206701','D018284','MN','C04.557.470.200.025.480.240');
+INSERT INTO "MRSAT" VALUES('C0206701','D018284','MN','C04.557.470.590.480.240');
+INSERT INTO "MRSAT" VALUES('C0206701','D018284','TH','');
+INSERT INTO "MRSAT" VALUES('C0206702','D018285','MN','C04.557.470.200.025.450.500');
+INSERT INTO "MRSAT" VALUES('C0206702','D018285','TH','');
+INSERT INTO "MRSAT" VALUES('C0206754','D018358','MN','C04.557.465.625.650');
+INSERT INTO "MRSAT" VALUES('C0206754','D018358','MN','C04.557.580.625.650');
+INSERT INTO "MRSAT" VALUES('C0206754','D018358','TH','');
+INSERT INTO "MRSAT" VALUES('C0206766','D018294','MN','C04.557.470.550');
+INSERT INTO "MRSAT" VALUES('C0206766','D018294','TH','');
+INSERT INTO "MRSAT" VALUES('C0206767','D018297','MN','C04.557.470.590');
+INSERT INTO "MRSAT" VALUES('C0206767','D018297','TH','');
+INSERT INTO "MRSAT" VALUES('C0206768','D018299','MN','C04.557.470.615');
+INSERT INTO "MRSAT" VALUES('C0206768','D018299','TH','');
+INSERT INTO "MRSAT" VALUES('C0221227','D011656','TH','');
+INSERT INTO "MRSAT" VALUES('C0235974','C562463','TH','');
+INSERT INTO "MRSAT" VALUES('C0236964','D019958','MN','F03.625.094');
+INSERT INTO "MRSAT" VALUES('C0236964','D019958','TH','');
+INSERT INTO "MRSAT" VALUES('C0237020','C562731','TH','');
+INSERT INTO "MRSAT" VALUES('C0264393','D011656','TH','');
+INSERT INTO "MRSAT" VALUES('C0265797','C535735','TH','');
+INSERT INTO "MRSAT" VALUES('C0268318','C535932','TH','');
+INSERT INTO "MRSAT" VALUES('C0269680','C535817','TH','');
+INSERT INTO "MRSAT" VALUES('C0271583','C562707','TH','');
+INSERT INTO "MRSAT" VALUES('C0279563','D000071960','TH','');
+INSERT INTO "MRSAT" VALUES('C0279702','D002292','TH','');
+INSERT INTO "MRSAT" VALUES('C0334276','D065311','MN','C04.557.470.200.025.014');
+INSERT INTO "MRSAT" VALUES('C0334276','D065311','MN','C04.557.470.200.240.124');
+INSERT INTO "MRSAT" VALUES('C0334276','D065311','MN','C23.149.249');
+INSERT INTO "MRSAT" VALUES('C0334276','D065311','TH','');
+INSERT INTO "MRSAT" VALUES('C0340036','C536287','TH','');
+INSERT INTO "MRSAT" VALUES('C0345904','D008113','TH','');
+INSERT INTO "MRSAT" VALUES('C0345905','D018281','TH','');
+INSERT INTO "MRSAT" VALUES('C0346153','C562840','TH','');
+INSERT INTO "MRSAT" VALUES('C0346402','D000306','TH','');
+INSERT INTO "MRSAT" VALUES('C0346647','D010190','TH','');
+INSERT INTO "MRSAT" VALUES('C0376338','D001523','TH','');
+INSERT INTO "MRSAT" VALUES('C0431109','C562943','TH','');
+INSERT INTO "MRSAT" VALUES('C0476089','D016889','TH','');
+INSERT INTO "MRSAT" VALUES('C0546476','C536150','TH','');
+INSERT INTO "MRSAT" VALUES('C0600176','D002276','TH','');
+INSERT INTO "MRSAT" VALUES('C0600260','D008173','MN','C08.381.495');
+INSERT INTO "MRSAT" VALUES('C0600260','D008173','TH','');
+INSERT INTO "MRSAT" VALUES('C0678222','D001943','TH','');
+INSERT INTO "MRSAT" VALUES('C0740345','D009373','TH','');
+INSERT INTO "MRSAT" VALUES('C0740457','D007680','TH','');
+INSERT INTO "MRSAT" VALUES('C0750887','D000310','TH','');
+INSERT INTO "MRSAT" VALUES('C0751075','D004067','TH','');
+INSERT INTO "MRSAT" VALUES('C0751364','D009373','TH','');
+INSERT INTO "MRSAT" VALUES('C0751365','D009373','TH','');
+INSERT INTO "MRSAT" VALUES('C0751567','D014328','TH','');
+INSERT INTO "MRSAT" VALUES('C0751569','D014565','TH','');
+INSERT INTO "MRSAT" VALUES('C0751571','D014571','TH','');
+INSERT INTO "MRSAT" VALUES('C0878500','D002278','TH','');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','MN','C04.557.470.200.025.232.750');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','MN','C04.557.470.615.132.750');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','MN','C04.588.274.761.750');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','MN','C04.588.322.475.750');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','MN','C06.301.761.750');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','MN','C06.689.667.625');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','MN','C19.344.421.750');
+INSERT INTO "MRSAT" VALUES('C0887833','D021441','TH','');
+INSERT INTO "MRSAT" VALUES('C0919267','D010051','MN','C04.588.322.455');
+INSERT INTO "MRSAT" VALUES('C0919267','D010051','MN','C13.351.500.056.630.705');
+INSERT INTO "MRSAT" VALUES('C0919267','D010051','MN','C13.351.937.418.685');
+INSERT INTO "MRSAT" VALUES('C0919267','D010051','MN','C19.344.410');
+INSERT INTO "MRSAT" VALUES('C0919267','D010051','MN','C19.391.630.705');
+INSERT INTO "MRSAT" VALUES('C0919267','D010051','TH','');
+INSERT INTO "MRSAT" VALUES('C0949804','D027601','MN','C02.256.721');
+INSERT INTO "MRSAT" VALUES('C0949804','D027601','TH','');
+INSERT INTO "MRSAT" VALUES('C1134719','D018270','MN','C04.557.470.200.025.232.500');
+INSERT INTO "MRSAT" VALUES('C1134719','D018270','MN','C04.557.470.615.132.500');
+INSERT INTO "MRSAT" VALUES('C1134719','D018270','MN','C04.588.180.390');
+INSERT INTO "MRSAT" VALUES('C1134719','D018270','MN','C17.800.090.500.390');
+INSERT INTO "MRSAT" VALUES('C1134719','D018270','TH','');
+INSERT INTO "MRSAT" VALUES('C1135873','D031954','MN','C04.557.465.955.207.438');
+INSERT INTO "MRSAT" VALUES('C1135873','D031954','MN','C04.557.470.200.025.455.750');
+INSERT INTO "MRSAT" VALUES('C1135873','D031954','MN','C04.850.908.208.438');
+INSERT INTO "MRSAT" VALUES('C1135873','D031954','MN','C13.703.720.949.208.438');
+INSERT INTO "MRSAT" VALUES('C1135873','D031954','TH','');
+INSERT INTO "MRSAT" VALUES('C1140680','D010051','TH','');
+INSERT INTO "MRSAT" VALUES('C1176475','D044584','MN','C04.557.470.200.025.232');
+INSERT INTO "MRSAT" VALUES('C1176475','D044584','MN','C04.557.470.615.132');
+INSERT INTO "MRSAT" VALUES('C1176475','D044584','TH','');
+INSERT INTO "MRSAT" VALUES('C1257931','D001943','TH','');
+INSERT INTO "MRSAT" VALUES('C1263846','D001289','MN','F03.625.094.150');
+INSERT INTO "MRSAT" VALUES('C1263846','D001289','TH','');
+INSERT INTO "MRSAT" VALUES('C1266042','D002292','TH','');
+INSERT INTO "MRSAT" VALUES('C1266043','D002292','TH','');
+INSERT INTO "MRSAT" VALUES('C1266044','D002292','TH','');
+INSERT INTO "MRSAT" VALUES('C1266065','D057090','MN','C04.557.470.200.025.500');
+INSERT INTO "MRSAT" VALUES('C1266065','D057090','TH','');
+INSERT INTO "MRSAT" VALUES('C1266101','C536905','TH','');
+INSERT INTO "MRSAT" VALUES('C1306837','D002292','TH','');
+INSERT INTO "MRSAT" VALUES('C1321905','D001289','TH','');
+INSERT INTO "MRSAT" VALUES('C1328479','D018273','MN','C04.557.470.200.025.290');
+INSERT INTO "MRSAT" VALUES('C1328479','D018273','MN','C04.588.274.761.500');
+INSERT INTO "MRSAT" VALUES('C1328479','D018273','MN','C04.588.322.475.500');
+INSERT INTO "MRSAT" VALUES('C1328479','D018273','MN','C06.301.761.500');
+INSERT INTO "MRSAT" VALUES('C1328479','D018273','MN','C06.689.667.500');
+INSERT INTO "MRSAT" VALUES('C1328479','D018273','MN','C19.344.421.500');
+INSERT INTO "MRSAT" VALUES('C1328479','D018273','TH','');
+INSERT INTO "MRSAT" VALUES('C1332347','D002285','TH','');
+INSERT INTO "MRSAT" VALUES('C1368683','D009375','TH','');
+INSERT INTO "MRSAT" VALUES('C1384901','C563237','TH','');
+INSERT INTO "MRSAT" VALUES('C1449718','D001941','TH','');
+INSERT INTO "MRSAT" VALUES('C1458155','D001943','MN','C04.588.180');
+INSERT INTO "MRSAT" VALUES('C1458155','D001943','MN','C17.800.090.500');
+INSERT INTO "MRSAT" VALUES('C1458155','D001943','TH','');
+INSERT INTO "MRSAT" VALUES('C1520159','C536741','TH','');
+INSERT INTO "MRSAT" VALUES('C1527303','D029424','TH','');
+INSERT INTO "MRSAT" VALUES('C1535926','D065886','MN','F03.625');
+INSERT INTO "MRSAT" VALUES('C1535926','D065886','TH','');
+INSERT INTO "MRSAT" VALUES('C1569637','D018269','TH','');
+INSERT INTO "MRSAT" VALUES('C1704374','D004701','TH','');
+INSERT INTO "MRSAT" VALUES('C1708350','C535516','TH','');
+INSERT INTO "MRSAT" VALUES('C1720765','D005261','MN','C13');
+INSERT INTO "MRSAT" VALUES('C1720765','D005261','TH','');
+INSERT INTO "MRSAT" VALUES('C1720816','D014591','TH','');
+INSERT INTO "MRSAT" VALUES('C1720887','D052776','MN','C13.351');
+INSERT INTO "MRSAT" VALUES('C1720887','D052776','TH','');
+INSERT INTO "MRSAT" VALUES('C1720894','D052801','MN','C12');
+INSERT INTO "MRSAT" VALUES('C1720894','D052801','TH','');
+INSERT INTO "MRSAT" VALUES('C1833053','C563423','TH','');
+INSERT INTO "MRSAT" VALUES('C1840586','C564186','TH','');
+INSERT INTO "MRSAT" VALUES('C1845343','C564505','TH','');
+INSERT INTO "MRSAT" VALUES('C1848813','C536908','TH','');
+INSERT INTO "MRSAT" VALUES('C1849554','C537727','TH','');
+INSERT INTO "MRSAT" VALUES('C1851718','C565057','TH','');
+INSERT INTO "MRSAT" VALUES('C1854729','C565366','TH','');
+INSERT INTO "MRSAT" VALUES('C1857314','C538220','TH','');
+INSERT INTO "MRSAT" VALUES('C1858302','C536183','TH','');
+INSERT INTO "MRSAT" VALUES('C1859971','C565971','TH','');
+INSERT INTO "MRSAT" VALUES('C1863649','C566352','TH','');
+INSERT INTO "MRSAT" VALUES('C1868647','C537167','TH','');
+INSERT INTO "MRSAT" VALUES('C2239176','D006528','MN','C04.557.470.200.025.255');
+INSERT INTO "MRSAT" VALUES('C2239176','D006528','MN','C04.588.274.623.160');
+INSERT INTO "MRSAT" VALUES('C2239176','D006528','MN','C06.301.623.160');
+INSERT INTO "MRSAT" VALUES('C2239176','D006528','MN','C06.552.697.160');
+INSERT INTO "MRSAT" VALUES('C2239176','D006528','TH','');
+INSERT INTO "MRSAT" VALUES('C2350878','D011656','TH','');
+INSERT INTO "MRSAT" VALUES('C2673196','C567089','TH','');
+INSERT INTO "MRSAT" VALUES('C2676033','C567299','TH','');
+INSERT INTO "MRSAT" VALUES('C2676788','C567364','TH','');
+INSERT INTO "MRSAT" VALUES('C2749137','C567595','TH','');
+INSERT INTO "MRSAT" VALUES('C2930839','C531777','TH','');
+INSERT INTO "MRSAT" VALUES('C2930967','C535650','TH','');
+INSERT INTO "MRSAT" VALUES('C2931144','C536264','TH','');
+INSERT INTO "MRSAT" VALUES('C2931296','C536714','TH','');
+INSERT INTO "MRSAT" VALUES('C2931303','C536730','TH','');
+INSERT INTO "MRSAT" VALUES('C2931410','C537064','TH','');
+INSERT INTO "MRSAT" VALUES('C2936722','D018267','TH','');
+INSERT INTO "MRSAT" VALUES('C3489727','C535817','TH','');
+INSERT INTO "MRSAT" VALUES('C3489728','C535932','TH','');
+INSERT INTO "MRSAT" VALUES('C3496549','C564777','TH','');
+INSERT INTO "MRSAT" VALUES('C3501777','C564014','TH','');
+INSERT INTO "MRSAT" VALUES('C3714514','D007239','MN','C01.539');
+INSERT INTO "MRSAT" VALUES('C3714514','D007239','TH','');
+INSERT INTO "MRSAT" VALUES('C3805278','D018281','TH','');
+INSERT INTO "MRSAT" VALUES('C3850167','D065308','MN','C23.149');
+INSERT INTO "MRSAT" VALUES('C3850167','D065308','TH','');
+INSERT INTO "MRSAT" VALUES('C4045991','D018285','TH','');
+INSERT INTO "MRSAT" VALUES('C4046029','D001523','TH','');
+INSERT INTO "MRSAT" VALUES('C4505432','D012192','TH','');
+INSERT INTO "MRSAT" VALUES('C9000001','C900001','TH','');
+INSERT INTO "MRSAT" VALUES('C9000002','C900001','TH','');
+INSERT INTO "MRSAT" VALUES('C9000004','D900004','TH','');
+CREATE TABLE MRSTY (CUI text, TUI text);
+INSERT INTO "MRSTY" VALUES('C0001418','T005');
+INSERT INTO "MRSTY" VALUES('C0001420','T005');
+INSERT INTO "MRSTY" VALUES('C0001576','T002');
+INSERT INTO "MRSTY" VALUES('C0001614','T002');
+INSERT INTO "MRSTY" VALUES('C0001618','T005');
+INSERT INTO "MRSTY" VALUES('C0001621','T002');
+INSERT INTO "MRSTY" VALUES('C0001624','T005');
+INSERT INTO "MRSTY" VALUES('C0003047','T002');
+INSERT INTO "MRSTY" VALUES('C0004615','T002');
+INSERT INTO "MRSTY" VALUES('C0004930','T001');
+INSERT INTO "MRSTY" VALUES('C0004936','T004');
+INSERT INTO "MRSTY" VALUES('C0006142','T001');
+INSERT INTO "MRSTY" VALUES('C0006145','T002');
+INSERT INTO "MRSTY" VALUES('C0006261','T002');
+INSERT INTO "MRSTY" VALUES('C0006277','T002');
+INSERT INTO "MRSTY" VALUES('C0006826','T001');
+INSERT INTO "MRSTY" VALUES('C0007093','T002');
+INSERT INTO "MRSTY" VALUES('C0007095','T005');
+INSERT INTO "MRSTY" VALUES('C0007097','T005');
+INSERT INTO "MRSTY" VALUES('C0007099','T005');
+INSERT INTO "MRSTY" VALUES('C0007120','T005');
+INSERT INTO "MRSTY" VALUES('C0007124','T005');
+INSERT INTO "MRSTY" VALUES('C0007129','T005');
+INSERT INTO "MRSTY" VALUES('C0007130','T005');
+INSERT INTO "MRSTY" VALUES('C0007134','T005');
+INSERT INTO "MRSTY" VALUES('C0007135','T005');
+INSERT INTO "MRSTY" VALUES('C0007222','T002');
+INSERT INTO "MRSTY" VALUES('C0008497','T005');
+INSERT INTO "MRSTY" VALUES('C0008677','T002');
+INSERT INTO "MRSTY" VALUES('C0010606','T005');
+INSERT INTO "MRSTY" VALUES('C0010631','T005');
+INSERT INTO "MRSTY" VALUES('C0011993','T005');
+INSERT INTO "MRSTY" VALUES('C0012242','T002');
+INSERT INTO "MRSTY" VALUES('C0012243','T005');
+INSERT INTO "MRSTY" VALUES('C0012674','T001');
+INSERT INTO "MRSTY" VALUES('C0012734','T001');
+INSERT INTO "MRSTY" VALUES('C0012922','T002');
+INSERT INTO "MRSTY" VALUES('C0014130','T002');
+INSERT INTO "MRSTY" VALUES('C0014132','T005');
+INSERT INTO "MRSTY" VALUES('C0014170','T005');
+INSERT INTO "MRSTY" VALUES('C0016047','T001');
+INSERT INTO "MRSTY" VALUES('C0017150','T005');
+INSERT INTO "MRSTY" VALUES('C0017411','T002');
+INSERT INTO "MRSTY" VALUES('C0017416','T005');
+INSERT INTO "MRSTY" VALUES('C0017689','T005');
+INSERT INTO "MRSTY" VALUES('C0018050','T002');
+INSERT INTO "MRSTY" VALUES('C0018799','T002');
+INSERT INTO "MRSTY" VALUES('C0021367','T001');
+INSERT INTO "MRSTY" VALUES('C0022658','T002');
+INSERT INTO "MRSTY" VALUES('C0022665','T005');
+INSERT INTO "MRSTY" VALUES('C0022790','T005');
+INSERT INTO "MRSTY" VALUES('C0023743','T005');
+INSERT INTO "MRSTY" VALUES('C0023895','T002');
+INSERT INTO "MRSTY" VALUES('C0023903','T005');
+INSERT INTO "MRSTY" VALUES('C0024115','T002');
+INSERT INTO "MRSTY" VALUES('C0024117','T002');
+INSERT INTO "MRSTY" VALUES('C0024586','T002');
+INSERT INTO "MRSTY" VALUES('C0027651','T005');
+INSERT INTO "MRSTY" VALUES('C0027652','T005');
+INSERT INTO "MRSTY" VALUES('C0027653','T005');
+INSERT INTO "MRSTY" VALUES('C0027654','T001');
+INSERT INTO "MRSTY" VALUES('C0027658','T005');
+INSERT INTO "MRSTY" VALUES('C0027660','T005');
+INSERT INTO "MRSTY" VALUES('C0027665','T005');
+INSERT INTO "MRSTY" VALUES('C0029121','T001');
+INSERT INTO "MRSTY" VALUES('C0029928','T002');
+INSERT INTO "MRSTY" VALUES('C0030186','T005');
+INSERT INTO "MRSTY" VALUES('C0030286','T002');
+INSERT INTO "MRSTY" VALUES('C0030297','T005');
+INSERT INTO "MRSTY" VALUES('C0030357','T001');
+INSERT INTO "MRSTY" VALUES('C0032962','T006');
+INSERT INTO "MRSTY" VALUES('C0032966','T005');
+INSERT INTO "MRSTY" VALUES('C0034049','T002');
+INSERT INTO "MRSTY" VALUES('C0034067','T002');
+INSERT INTO "MRSTY" VALUES('C0035242','T002');
+INSERT INTO "MRSTY" VALUES('C0035243','T002');
+INSERT INTO "MRSTY" VALUES('C0035369','T002');
+INSERT INTO "MRSTY" VALUES('C0035690','T002');
+INSERT INTO "MRSTY" VALUES('C0036946','T002');
+INSERT INTO "MRSTY" VALUES('C0037274','T002');
+INSERT INTO "MRSTY" VALUES('C0037661','T005');
+INSERT INTO "MRSTY" VALUES('C0039058','T007');
+INSERT INTO "MRSTY" VALUES('C0041182','T005');
+INSERT INTO "MRSTY" VALUES('C0041374','T005');
+INSERT INTO "MRSTY" VALUES('C0041671','T001');
+INSERT INTO "MRSTY" VALUES('C0041912','T001');
+INSERT INTO "MRSTY" VALUES('C0042065','T005');
+INSERT INTO "MRSTY" VALUES('C0042075','T002');
+INSERT INTO "MRSTY" VALUES('C0042076','T005');
+INSERT INTO "MRSTY" VALUES('C0042131','T002');
+INSERT INTO "MRSTY" VALUES('C0042138','T005');
+INSERT INTO "MRSTY" VALUES('C0042769','T002');
+INSERT INTO "MRSTY" VALUES('C0086565','T001');
+INSERT INTO "MRSTY" VALUES('C0086692','T001');
+INSERT INTO "MRSTY" VALUES('C0086768','T001');
+INSERT INTO "MRSTY" VALUES('C0149654','T004');
+INSERT INTO "MRSTY" VALUES('C0149951','T005');
+INSERT INTO "MRSTY" VALUES('C0152013','T005');
+INSERT INTO "MRSTY" VALUES('C0153567','T001');
+INSERT INTO "MRSTY" VALUES('C0154084','T005');
+INSERT INTO "MRSTY" VALUES('C0175166','T002');
+INSERT INTO "MRSTY" VALUES('C0205641','T001');
+INSERT INTO "MRSTY" VALUES('C0205642','T001');
+INSERT INTO "MRSTY" VALUES('C0205643','T001');
+INSERT INTO "MRSTY" VALUES('C0205644','T001');
+INSERT INTO "MRSTY" VALUES('C0205645','T001');
+INSERT INTO "MRSTY" VALUES('C0205695','T001');
+INSERT INTO "MRSTY" VALUES('C0205696','T001');
+INSERT INTO "MRSTY" VALUES('C0205697','T001');
+INSERT INTO "MRSTY" VALUES('C0205698','T001');
+INSERT INTO "MRSTY" VALUES('C0205699','T001');
+INSERT INTO "MRSTY" VALUES('C0205851','T001');
+INSERT INTO "MRSTY" VALUES('C0205852','T001');
+INSERT INTO "MRSTY" VALUES('C0205854','T001');
+INSERT INTO "MRSTY" VALUES('C0206093','T005');
+INSERT INTO "MRSTY" VALUES('C0206666','T005');
+INSERT INTO "MRSTY" VALUES('C0206681','T005');
+INSERT INTO "MRSTY" VALUES('C0206682','T005');
+INSERT INTO "MRSTY" VALUES('C0206683','T005');
+INSERT INTO "MRSTY" VALUES('C0206684','T005');
+INSERT INTO "MRSTY" VALUES('C0206685','T005');
+INSERT INTO "MRSTY" VALUES('C0206686','T005');
+INSERT INTO "MRSTY" VALUES('C0206687','T005');
+INSERT INTO "MRSTY" VALUES('C0206692','T005');
+INSERT INTO "MRSTY" VALUES('C0206693','T005');
+INSERT INTO "MRSTY" VALUES('C0206694','T005');
+INSERT INTO "MRSTY" VALUES('C0206695','T005');
+INSERT INTO "MRSTY" VALUES('C0206696','T005');
+INSERT INTO "MRSTY" VALUES('C0206697','T005');
+INSERT INTO "MRSTY" VALUES('C0206698','T005');
+INSERT INTO "MRSTY" VALUES('C0206699','T005');
+INSERT INTO "MRSTY" VALUES('C0206700','T005');
+INSERT INTO "MRSTY" VALUES('C0206701','T005');
+INSERT INTO "MRSTY" VALUES('C0206702','T005');
+INSERT INTO "MRSTY" VALUES('C0206754','T005');
+INSERT INTO "MRSTY" VALUES('C0206766','T005');
+INSERT INTO "MRSTY" VALUES('C0206767','T005');
+INSERT INTO "MRSTY" VALUES('C0206768','T005');
+INSERT INTO "MRSTY" VALUES('C0221227','T001');
+INSERT INTO "MRSTY" VALUES('C0235974','T005');
+INSERT INTO "MRSTY" VALUES('C0236964','T006');
+INSERT INTO "MRSTY" VALUES('C0237020','T005');
+INSERT INTO "MRSTY" VALUES('C0264393','T001');
+INSERT INTO "MRSTY" VALUES('C0265797','T001');
+INSERT INTO "MRSTY" VALUES('C0268318','T002');
+INSERT INTO "MRSTY" VALUES('C0269680','T006');
+INSERT INTO "MRSTY" VALUES('C0271583','T002');
+INSERT INTO "MRSTY" VALUES('C0279563','T001');
+INSERT INTO "MRSTY" VALUES('C0279702','T001');
+INSERT INTO "MRSTY" VALUES('C0334276','T005');
+INSERT INTO "MRSTY" VALUES('C0340036','T002');
+INSERT INTO "MRSTY" VALUES('C0345904','T001');
+INSERT INTO "MRSTY" VALUES('C0345905','T001');
+INSERT INTO "MRSTY" VALUES('C0346153','T005');
+INSERT INTO "MRSTY" VALUES('C0346402','T001');
+INSERT INTO "MRSTY" VALUES('C0346647','T001');
+INSERT INTO "MRSTY" VALUES('C0376338','T001');
+INSERT INTO "MRSTY" VALUES('C0431109','T005');
+INSERT INTO "MRSTY" VALUES('C0476089','T001');
+INSERT INTO "MRSTY" VALUES('C0546476','T005');
+INSERT INTO "MRSTY" VALUES('C0600176','T001');
+INSERT INTO "MRSTY" VALUES('C0600260','T002');
+INSERT INTO "MRSTY" VALUES('C0678222','T001');
+INSERT INTO "MRSTY" VALUES('C0740345','T001');
+INSERT INTO "MRSTY" VALUES('C0740457','T001');
+INSERT INTO "MRSTY" VALUES('C0750887','T001');
+INSERT INTO "MRSTY" VALUES('C0751075','T001');
+INSERT INTO "MRSTY" VALUES('C0751364','T001');
+INSERT INTO "MRSTY" VALUES('C0751365','T001');
+INSERT INTO "MRSTY" VALUES('C0751567','T001');
+INSERT INTO "MRSTY" VALUES('C0751569','T001');
+INSERT INTO "MRSTY" VALUES('C0751571','T001');
+INSERT INTO "MRSTY" VALUES('C0878500','T001');
+INSERT INTO "MRSTY" VALUES('C0887833','T005');
+INSERT INTO "MRSTY" VALUES('C0919267','T005');
+INSERT INTO "MRSTY" VALUES('C0949804','T002');
+INSERT INTO "MRSTY" VALUES('C1134719','T005');
+INSERT INTO "MRSTY" VALUES('C1135873','T005');
+INSERT INTO "MRSTY" VALUES('C1140680','T001');
+INSERT INTO "MRSTY" VALUES('C1176475','T005');
+INSERT INTO "MRSTY" VALUES('C1256741','T001');
+INSERT INTO "MRSTY" VALUES('C1256749','T001');
+INSERT INTO "MRSTY" VALUES('C1257931','T001');
+INSERT INTO "MRSTY" VALUES('C1263846','T004');
+INSERT INTO "MRSTY" VALUES('C1266042','T001');
+INSERT INTO "MRSTY" VALUES('C1266043','T001');
+INSERT INTO "MRSTY" VALUES('C1266044','T001');
+INSERT INTO "MRSTY" VALUES('C1266065','T005');
+INSERT INTO "MRSTY" VALUES('C1266101','T005');
+INSERT INTO "MRSTY" VALUES('C1306837','T001');
+INSERT INTO "MRSTY" VALUES('C1321905','T001');
+INSERT INTO "MRSTY" VALUES('C1328479','T005');
+INSERT INTO "MRSTY" VALUES('C1332347','T001');
+INSERT INTO "MRSTY" VALUES('C1368683','T001');
+INSERT INTO "MRSTY" VALUES('C1384901','T002');
+INSERT INTO "MRSTY" VALUES('C1449718','T001');
+INSERT INTO "MRSTY" VALUES('C1458155','T005');
+INSERT INTO "MRSTY" VALUES('C1520159','T005');
+INSERT INTO "MRSTY" VALUES('C1527303','T001');
+INSERT INTO "MRSTY" VALUES('C1535926','T004');
+INSERT INTO "MRSTY" VALUES('C1569637','T001');
+INSERT INTO "MRSTY" VALUES('C1704374','T001');
+INSERT INTO "MRSTY" VALUES('C1708350','T005');
+INSERT INTO "MRSTY" VALUES('C1720765','T002');
+INSERT INTO "MRSTY" VALUES('C1720816','T001');
+INSERT INTO "MRSTY" VALUES('C1720887','T002');
+INSERT INTO "MRSTY" VALUES('C1720894','T002');
+INSERT INTO "MRSTY" VALUES('C1833053','T002');
+INSERT INTO "MRSTY" VALUES('C1840586','T002');
+INSERT INTO "MRSTY" VALUES('C1845343','T002');
+INSERT INTO "MRSTY" VALUES('C1848813','T002');
+INSERT INTO "MRSTY" VALUES('C1849554','T001');
+INSERT INTO "MRSTY" VALUES('C1851718','T002');
+INSERT INTO "MRSTY" VALUES('C1854729','T002');
+INSERT INTO "MRSTY" VALUES('C1857314','T002');
+INSERT INTO "MRSTY" VALUES('C1858302','T002');
+INSERT INTO "MRSTY" VALUES('C1859971','T002');
+INSERT INTO "MRSTY" VALUES('C1863649','T005');
+INSERT INTO "MRSTY" VALUES('C1868647','T005');
+INSERT INTO "MRSTY" VALUES('C2239176','T005');
+INSERT INTO "MRSTY" VALUES('C2350878','T001');
+INSERT INTO "MRSTY" VALUES('C2673196','T002');
+INSERT INTO "MRSTY" VALUES('C2676033','T005');
+INSERT INTO "MRSTY" VALUES('C2676788','T002');
+INSERT INTO "MRSTY" VALUES('C2749137','T002');
+INSERT INTO "MRSTY" VALUES('C2930839','T005');
+INSERT INTO "MRSTY" VALUES('C2930967','T002');
+INSERT INTO "MRSTY" VALUES('C2931144','T002');
+INSERT INTO "MRSTY" VALUES('C2931296','T002');
+INSERT INTO "MRSTY" VALUES('C2931303','T002');
+INSERT INTO "MRSTY" VALUES('C2931410','T002');
+INSERT INTO "MRSTY" VALUES('C2936722','T001');
+INSERT INTO "MRSTY" VALUES('C3489727','T002');
+INSERT INTO "MRSTY" VALUES('C3489728','T002');
+INSERT INTO "MRSTY" VALUES('C3496549','T005');
+INSERT INTO "MRSTY" VALUES('C3501777','T002');
+INSERT INTO "MRSTY" VALUES('C3714514','T006');
+INSERT INTO "MRSTY" VALUES('C3805278','T001');
+INSERT INTO "MRSTY" VALUES('C3850167','T003');
+INSERT INTO "MRSTY" VALUES('C4045991','T001');
+INSERT INTO "MRSTY" VALUES('C4046029','T001');
+INSERT INTO "MRSTY" VALUES('C4505432','T001');
+INSERT INTO "MRSTY" VALUES('C9000001','T001');
+INSERT INTO "MRSTY" VALUES('C9000002','T001');
+INSERT INTO "MRSTY" VALUES('C9000003','T001');
+INSERT INTO "MRSTY" VALUES('C9000004','T001');
+CREATE TABLE SRDEF (UI text, ABR text);
+INSERT INTO "SRDEF" VALUES('T001','cgab');
+INSERT INTO "SRDEF" VALUES('T002','dsyn');
+INSERT INTO "SRDEF" VALUES('T003','fndg');
+INSERT INTO "SRDEF" VALUES('T004','mobd');
+INSERT INTO "SRDEF" VALUES('T005','neop');
+INSERT INTO "SRDEF" VALUES('T006','patf');
+INSERT INTO "SRDEF" VALUES('T007','sosy');
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""A stub of the MetaMap executable for the tests.
+
+| It reads one record per line from stdin, and writes one MMI line for each word of the record,
+| then "'EOT'." if the option --indicate_citation_end is given.
+| Its behaviour is set by the record and by environment variables:
+
+| "hang": never answer. "crash": exit with code 3.
+| "hang once" and "crash once": only the first time, the next MetaMap answers normally.
+| STUB_METAMAP_DELAY: seconds to sleep before the first answer, as MetaMap loads its data.
+| STUB_METAMAP_LOG: file, "start" and every record are appended to it.
+| STUB_METAMAP_STATE: directory, remembers the "once" records across processes.
+"""
+import os
+import sys
+import time
+
+
+def log(text=None):
+    path = os.environ.get("STUB_METAMAP_LOG")
+    if path is not None:
+        with open(path, "a") as handle:
+            handle.write(text + "\n")
+
+
+def firstTime(record=None):
+    """True if the record is seen for the first time by any stub process."""
+    state = os.environ.get("STUB_METAMAP_STATE", ".")
+    marker = os.path.join(state, "seen_" + "_".join(record.split()))
+    if os.path.exists(marker):
+        return False
+    open(marker, "w").close()
+    return True
+
+
+def main():
+    endMark = "--indicate_citation_end" in sys.argv[1:]
+    delay = float(os.environ.get("STUB_METAMAP_DELAY", "0"))
+    log(text="start")
+    for line in sys.stdin:
+        record = line.strip()
+        log(text=record)
+        if delay > 0:
+            time.sleep(delay)
+            delay = 0
+        once = record.endswith(" once")
+        if record.startswith("hang") and (not once or firstTime(record=record)):
+            time.sleep(3600)
+        if record.startswith("crash") and (not once or firstTime(record=record)):
+            sys.exit(3)
+        sys.stdout.write("Processing 00000000.tx.1: %s\n" % record)
+        for (i, word) in enumerate(record.split()):
+            sys.stdout.write("00000000|MMI|%d.00|%s|C%07d|[test]|[\"%s\"-tx-1-\"%s\"-noun-0]|TX|%d/%d|\n"
+                             % (10 - i, word, i, word, word, i, len(word)))
+        if endMark:
+            sys.stdout.write("'EOT'.\n")
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
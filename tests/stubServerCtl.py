@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""A stub of the control scripts skrmedpostctl and wsdserverctl of MetaMap for the tests.
+
+| usage: stubServerCtl.py name port log start|stop
+| start: log "name start", and run a server in the background, it listens on port after STUB_SERVER_DELAY seconds.
+| stop: log "name stop", and kill the server.
+| The pid of the server is kept in the file log.name.pid.
+"""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+
+def serve(port=None, delay=None):
+    time.sleep(delay)
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("localhost", port))
+    server.listen(16)
+    while True:
+        (connection, address) = server.accept()
+        connection.close()
+
+
+def main():
+    if sys.argv[1] == "serve":
+        serve(port=int(sys.argv[2]), delay=float(sys.argv[3]))
+        return 0
+    (name, port, log, action) = sys.argv[1:5]
+    pidFile = "%s.%s.pid" % (log, name)
+    with open(log, "a") as handle:
+        handle.write("%s %s\n" % (name, action))
+    if action == "start":
+        process = subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve", port,
+                                    os.environ.get("STUB_SERVER_DELAY", "0")],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+        with open(pidFile, "w") as handle:
+            handle.write(str(process.pid))
+    elif action == "stop" and os.path.exists(pidFile):
+        with open(pidFile) as handle:
+            os.kill(int(handle.read()), signal.SIGTERM)
+        os.remove(pidFile)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of AsyncMetaMap against the stub MetaMap executable stubMetaMap.py."""
+import asyncio
+import os
+import time
+
+import pytest
+
+from pyMeSHSim.metamapWrap.AsyncMetaMap import AsyncMetaMap
+from pyMeSHSim.metamapWrap.MetaMapCache import MetaMapCache
+from pyMeSHSim.metamapWrap.MetaMapSession import MetaMapSessionError
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubMetaMap.py")
+
+
+@pytest.fixture
+def stubLog(tmp_path, monkeypatch):
+    """Log the records received by the stub, and keep its state in tmp_path."""
+    path = tmp_path / "stub.log"
+    monkeypatch.setenv("STUB_METAMAP_LOG", str(path))
+    monkeypatch.setenv("STUB_METAMAP_STATE", str(tmp_path))
+    monkeypatch.delenv("STUB_METAMAP_DELAY", raising=False)
+
+    def read():
+        if not path.exists():
+            return []
+        return path.read_text().splitlines()
+    return read
+
+
+def names(results=None):
+    return [[concept["preferred_name"] for concept in concepts] for concepts in results]
+
+
+def test_annotate_in_several_event_loops(stubLog):
+    annotator = AsyncMetaMap(path=STUB, concurrency=1, timeout=10)
+    texts = ["lung cancer", "heart", "brain"]
+    for _ in range(2):
+        results = asyncio.run(asyncio.wait_for(annotator.annotateMany(texts=texts), timeout=30))
+        assert names(results=results) == [["lung", "cancer"], ["heart"], ["brain"]]
+    assert asyncio.run(annotator.annotate(text="lung\ncancer")) == results[0]
+    assert stubLog().count("start") == 7
+
+
+def test_repeated_and_empty_texts(stubLog):
+    annotator = AsyncMetaMap(path=STUB, concurrency=2, timeout=10)
+    results = asyncio.run(annotator.annotateMany(texts=["lung  cancer", "", "lung cancer", " "]))
+    assert names(results=results) == [["lung", "cancer"], [], ["lung", "cancer"], []]
+    assert stubLog() == ["start", "lung cancer"]
+
+
+def test_timeout_kills_metamap(stubLog):
+    annotator = AsyncMetaMap(path=STUB, concurrency=2, timeout=1)
+    start = time.time()
+    results = asyncio.run(annotator.annotateMany(texts=["hang", "heart"], returnExceptions=True))
+    assert time.time() - start < 4
+    assert isinstance(results[0], MetaMapSessionError)
+    assert names(results=results[1:]) == [["heart"]]
+    with pytest.raises(MetaMapSessionError):
+        asyncio.run(annotator.annotate(text="crash"))
+
+
+def test_cache_hits_are_not_sent(stubLog, tmp_path):
+    with MetaMapCache(path=str(tmp_path / "cache.sqlite")) as cache:
+        annotator = AsyncMetaMap(path=STUB, concurrency=2, timeout=10, cache=cache)
+        first = asyncio.run(annotator.annotateMany(texts=["lung cancer", "heart"]))
+        assert len(cache) == 2
+        second = asyncio.run(annotator.annotateMany(texts=["heart", "lung cancer", "brain"]))
+        assert second[0: 2] == [first[1], first[0]]
+        assert names(results=second[2:]) == [["brain"]]
+        assert asyncio.run(annotator.annotate(text="brain")) == second[2]
+    received = sorted(line for line in stubLog() if line != "start")
+    assert received == ["brain", "heart", "lung cancer"]
@@ -0,0 +1,105 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of BatchAnnotator against the stub MetaMap executable stubMetaMap.py."""
+import json
+import os
+
+import pytest
+
+from pyMeSHSim.metamapWrap.BatchAnnotator import BatchAnnotator, readCheckpoint, readRecords
+from pyMeSHSim.metamapWrap.MetaMapSession import MetaMapSession
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubMetaMap.py")
+
+
+@pytest.fixture
+def stubLog(tmp_path, monkeypatch):
+    """Log the records received by the stubs of all workers, and keep their state in tmp_path."""
+    path = tmp_path / "stub.log"
+    monkeypatch.setenv("STUB_METAMAP_LOG", str(path))
+    monkeypatch.setenv("STUB_METAMAP_STATE", str(tmp_path))
+    monkeypatch.delenv("STUB_METAMAP_DELAY", raising=False)
+
+    def read():
+        if not path.exists():
+            return []
+        return path.read_text().splitlines()
+    return read
+
+
+def writeInput(path=None, records=None):
+    with open(path, "w") as handle:
+        for (recordID, text) in records:
+            handle.write("%s|%s\n" % (recordID, text))
+    return str(path)
+
+
+def readOutput(path=None):
+    with open(path) as handle:
+        return [json.loads(line) for line in handle]
+
+
+def names(concepts=None):
+    return [concept["preferred_name"] for concept in concepts]
+
+
+def test_readRecords(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1|lung cancer\nno separator\n2|\n|text\n3|a|b\n")
+    assert list(readRecords(path=str(path))) == [("1", "lung cancer"), ("3", "a|b")]
+    assert list(readRecords(path=str(path), textConvert=True)) == [("1", "lung cancer"), ("3", "a b")]
+
+
+@pytest.mark.parametrize("tail", [b'{"id": "b", "concepts": []}', b'{"id": "b", "conc', b"\n"])
+def test_incomplete_last_line_is_removed(tmp_path, tail):
+    path = tmp_path / "output.jsonl"
+    first = b'{"id": "a", "concepts": []}\n'
+    path.write_bytes(first + tail)
+    assert readCheckpoint(path=str(path)) == {"a"}
+    assert path.read_bytes() == first
+
+
+def test_resume_after_a_split_write(stubLog, tmp_path):
+    inputPath = writeInput(path=tmp_path / "input.txt", records=[(i, "word" + i) for i in "abcdef"])
+    outputPath = tmp_path / "output.jsonl"
+    # the crash is between the JSON of "b" and its "\n"
+    outputPath.write_text(json.dumps({"id": "a", "concepts": []}) + "\n" + json.dumps({"id": "b", "concepts": []}))
+    annotator = BatchAnnotator(path=STUB, workers=2, timeout=10)
+    assert annotator.annotateFile(inputPath=inputPath, outputPath=str(outputPath)) == (5, 0)
+    results = readOutput(path=outputPath)
+    assert [result["id"] for result in results] == list("abcdef")
+    assert names(concepts=results[1]["concepts"]) == ["wordb"]
+    # a finished job sends nothing when it is run again
+    sent = len(stubLog())
+    assert annotator.annotateFile(inputPath=inputPath, outputPath=str(outputPath)) == (0, 0)
+    assert readOutput(path=outputPath) == results
+    assert [line for line in stubLog()[sent:] if line not in ("start", MetaMapSession.probeText)] == []
+
+
+def test_failed_records_are_tried_again(stubLog, tmp_path):
+    inputPath = writeInput(path=tmp_path / "input.txt", records=[("1", "lung"), ("2", "crash"), ("3", "heart")])
+    outputPath = str(tmp_path / "output.jsonl")
+    annotator = BatchAnnotator(path=STUB, workers=1, timeout=10, retries=0)
+    assert annotator.annotateFile(inputPath=inputPath, outputPath=outputPath) == (2, 1)
+    assert [result["id"] for result in readOutput(path=outputPath)] == ["1", "3"]
+    assert annotator.annotateFile(inputPath=inputPath, outputPath=outputPath) == (0, 1)
+    assert stubLog().count("crash") == 2
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_ordered_and_unordered(stubLog, ordered):
+    records = [("1", "hang once"), ("2", "lung"), ("3", "heart"), ("4", "brain"), ("5", "kidney")]
+    annotator = BatchAnnotator(path=STUB, workers=2, ordered=ordered, timeout=1)
+    results = list(annotator.annotate(records=iter(records)))
+    assert sorted((recordID, error) for (recordID, concepts, error) in results) == \
+        [(recordID, None) for (recordID, text) in records]
+    assert dict((recordID, names(concepts=concepts)) for (recordID, concepts, error) in results)["1"] == \
+        ["hang", "once"]
+    order = [recordID for (recordID, concepts, error) in results]
+    if ordered:
+        assert order == ["1", "2", "3", "4", "5"]
+    else:
+        # the record which waits for the timeout and the restart doesn't block the others
+        assert order[-1] == "1"
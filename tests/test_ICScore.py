@@ -0,0 +1,69 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of the IC table, against the frequence of the descendants and after the tables are rebuilt."""
+import math
+import os
+import random
+
+import numpy as np
+import pytest
+
+from pyMeSHSim.Sim.ICScore import InformationContent
+from pyMeSHSim.data.createDataFromXML import createXMLData
+from pyMeSHSim.data.storage import openTable
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CATEGORIES = ["C", "D", "F", "all"]
+
+
+@pytest.fixture(scope="module")
+def information():
+    return InformationContent()
+
+
+@pytest.mark.parametrize("category", CATEGORIES)
+def test_storedICTable(information, category):
+    (index, ic, maxIC) = information.getICTable(category=category)
+    (ids, computed) = information._computeICTable(category=category)
+    assert sorted(index) == ids
+    assert np.allclose(ic[[index[dui] for dui in ids]], computed, rtol=0, atol=1e-12)
+    assert maxIC == pytest.approx(ic[index[information.maxIDInCategory[category]]], abs=1e-12)
+    assert information._getMaxICInCategory(category=category) == maxIC
+
+
+@pytest.mark.parametrize("category", CATEGORIES)
+def test_ICOfDescendants(information, category):
+    freqDict = information.getFreqDict(category=category)
+    duis = sorted(information.getICTable(category=category)[0])
+    for dui in random.Random(0).sample(duis, 200):
+        total = sum(freqDict[con] for con in set(information.getDescendant(dui=dui, category=category)))
+        expected = -math.log10(total) if 0 < total <= 1 else 0
+        assert information.getMeSHIC(dui=dui, category=category) == pytest.approx(expected, abs=1e-12), dui
+
+
+def test_rebuiltTables(tmp_path, monkeypatch, capsys):
+    dataPath = str(tmp_path / "data")
+    stale = os.path.join(dataPath, "MeSHICData")
+    os.makedirs(stale)
+    open(os.path.join(stale, "IC"), "w").close()
+    createXMLData(descPath=os.path.join(DATA, "desc.xml"),
+                  suppPath=os.path.join(DATA, "supp.xml")).constructBcolz(dataPath=dataPath)
+    assert "removing the stale IC table" in capsys.readouterr().err
+    assert not os.path.exists(stale)
+    attrs = openTable(rootdir=os.path.join(dataPath, "MainHeadingDetailData")).attrs
+    # the least frequent concept
+    assert attrs["maxIDInCategory"] == {"C": "D007938", "all": "D007938"}
+
+    monkeypatch.setenv("PYMESHSIM_DATA_PATH", dataPath)
+    information = InformationContent()
+    assert information.getICData(category="C") is None
+    (index, computed, maxIC) = information.getICTable(category="C")
+    assert maxIC == computed[index["D007938"]] > 0
+    # no frequence in MeSH_IC.tsv and no descendant
+    assert computed[index["D000090999"]] == 0
+    information.createICData()
+    (df, storedMax) = InformationContent().getICData(category="C")
+    assert storedMax == pytest.approx(maxIC, abs=1e-12)
+    assert np.allclose(df["IC"].to_numpy(), computed[[index[dui] for dui in df["MeSHID"]]], rtol=0, atol=1e-12)
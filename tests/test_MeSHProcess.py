@@ -0,0 +1,122 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of the tree code index against a breadth first search over the ParentChildRel table."""
+import random
+
+import pytest
+
+from pyMeSHSim.Sim.MeSHProcess import MeSHProcess
+
+CATEGORIES = ["C", "D", "F", "all"]
+
+
+@pytest.fixture(scope="module")
+def meshProcess():
+    return MeSHProcess()
+
+
+@pytest.fixture(scope="module")
+def relations(meshProcess):
+    """Parent and child lists of each category, read from ParentChildRel."""
+    relations = {}
+    for category in CATEGORIES:
+        df = meshProcess.getRelData(data="ParentChildRel", category=category)
+        parents = {}
+        children = {}
+        for (child, parent) in zip(df["Child"], df["Parent"]):
+            parents.setdefault(child, []).append(parent)
+            children.setdefault(parent, []).append(child)
+        relations[category] = (parents, children)
+    return relations
+
+
+def bfs(dui=None, links=None):
+    """All MeSH ID reached from dui, dui itself included."""
+    searched = {dui}
+    queue = [dui]
+    while queue:
+        nextQueue = []
+        for con in queue:
+            for other in links.get(con, []):
+                if other not in searched:
+                    searched.add(other)
+                    nextQueue.append(other)
+        queue = nextQueue
+    return searched
+
+
+def sampleDuis(meshProcess=None, category=None, size=300):
+    """Random MeSH ID of the category, and the MeSH ID with several tree codes, top tree codes
+    or outside the category."""
+    mh = meshProcess.getMainHeadingDetailData(category="all")
+    if category == "all":
+        inCategory = mh
+        outside = []
+    else:
+        inCategory = mh[mh["Tree_Code"].str[0] == category]
+        outside = sorted(set(mh["MeSHID"]) - set(inCategory["MeSHID"]))[:20]
+    duis = sorted(set(inCategory["MeSHID"]))
+    rnd = random.Random(0)
+    codeCount = inCategory.groupby("MeSHID").size()
+    several = sorted(codeCount[codeCount > 1].index)
+    top = sorted(set(inCategory[~inCategory["Tree_Code"].str.contains(".", regex=False)]["MeSHID"]))
+    sample = rnd.sample(duis, min(size, len(duis))) + rnd.sample(several, min(50, len(several)))
+    return sorted(set(sample + top + outside))
+
+
+@pytest.mark.parametrize("category", CATEGORIES)
+def test_ancestorsAndDescendants(meshProcess, relations, category):
+    (parents, children) = relations[category]
+    for dui in sampleDuis(meshProcess=meshProcess, category=category):
+        ancestors = meshProcess.getAncestors(dui=dui, category=category)
+        assert ancestors[0] == dui
+        assert len(ancestors) == len(set(ancestors))
+        assert set(ancestors) == bfs(dui=dui, links=parents), dui
+        descendants = meshProcess.getDescendant(dui=dui, category=category)
+        assert descendants[0] == dui
+        assert len(descendants) == len(set(descendants))
+        assert set(descendants) == bfs(dui=dui, links=children), dui
+
+
+@pytest.mark.parametrize("category", CATEGORIES[:-1])
+def test_isAncestor(meshProcess, relations, category):
+    (parents, children) = relations[category]
+    duis = sampleDuis(meshProcess=meshProcess, category=category, size=100)
+    rnd = random.Random(1)
+    pairs = [(rnd.choice(duis), rnd.choice(duis)) for i in range(2000)]
+    for dui in duis:
+        pairs.append((dui, dui))
+        for ancestor in sorted(bfs(dui=dui, links=parents) - {dui})[:5]:
+            pairs.append((ancestor, dui))
+            pairs.append((dui, ancestor))
+    assert any(dui1 != dui2 for (dui1, dui2) in pairs)
+    for (dui1, dui2) in pairs:
+        expected = dui1 != dui2 and dui1 in bfs(dui=dui2, links=parents)
+        assert meshProcess.isAncestor(dui1=dui1, dui2=dui2, category=category) == expected, (dui1, dui2)
+
+
+def test_treeCodeQueries(meshProcess):
+    treeIndex = meshProcess.getTreeCodeIndex(category="all")
+    codes = treeIndex.codes[1:]
+    rnd = random.Random(2)
+    pairs = [(rnd.choice(codes), rnd.choice(codes)) for i in range(2000)]
+    # pairs in one subtree, and a code with its own prefixes
+    for code in rnd.sample(codes, 200):
+        array = code.split(".")
+        prefix = ".".join(array[0: rnd.randint(1, len(array))])
+        pairs.append((prefix, code))
+        pairs.append((code, prefix))
+    for (code1, code2) in pairs:
+        array1 = code1.split(".")
+        array2 = code2.split(".")
+        common = 0
+        while common < min(len(array1), len(array2)) and array1[common] == array2[common]:
+            common = common + 1
+        expected = ".".join(array1[0: common]) if common else None
+        assert treeIndex.lcaCode(code1=code1, code2=code2) == expected, (code1, code2)
+        isPrefix = common == len(array1) < len(array2)
+        assert treeIndex.isAncestorCode(code1=code1, code2=code2) == isPrefix, (code1, code2)
+    assert treeIndex.lcaCode(code1="C01", code2="Z99.999") is None
+    assert treeIndex.isAncestorCode(code1="C01", code2="Z99.999") is False
@@ -0,0 +1,146 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of MetaMapCache."""
+import itertools
+import json
+import multiprocessing
+import sqlite3
+import zlib
+
+import pytest
+
+import pyMeSHSim.metamapWrap.MetaMapCache as cacheModule
+from pyMeSHSim.metamapWrap.MetaMapCache import MetaMapCache
+
+
+class fakeClock(object):
+    """time.time of the cache module, each call is one second later, so lastUsed has no ties."""
+
+    def __init__(self):
+        self.counter = itertools.count(1)
+
+    def time(self):
+        return float(next(self.counter))
+
+
+@pytest.fixture
+def cachePath(tmp_path, monkeypatch):
+    monkeypatch.setattr(cacheModule, "time", fakeClock())
+    return str(tmp_path / "cache.sqlite")
+
+
+def storedSize(concepts=None):
+    return len(zlib.compress(json.dumps(concepts).encode("utf-8")))
+
+
+def sizeOfRows(cache=None):
+    return cache.connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+
+def concepts(name=None, count=None):
+    return [{"preferred_name": "%s %d" % (name, i), "cui": "C%07d" % i} for i in range(count)]
+
+
+def test_key_and_normalize():
+    assert MetaMapCache.normalizeText(text="  lung \t cancer \n  heart  ") == "lung cancer\nheart"
+    assert MetaMapCache.makeKey(text="lung  cancer", options=["-R", "MSH"]) == \
+        MetaMapCache.makeKey(text=" lung cancer ", options=["-R", "MSH"])
+    assert MetaMapCache.makeKey(text="lung cancer", options=["-R", "MSH"]) != \
+        MetaMapCache.makeKey(text="lung cancer", options=["-R", "MSH", "--conj"])
+    assert MetaMapCache.makeKey(text="lung\ncancer", options=[]) != MetaMapCache.makeKey(text="lung cancer",
+                                                                                         options=[])
+
+
+def test_get_and_put(cachePath):
+    with MetaMapCache(path=cachePath) as cache:
+        assert cache.get(key="a") is None
+        cache.putMany(results={"a": concepts(name="a", count=2), "b": []})
+        assert cache.getMany(keys=["a", "b", "c", "a"]) == {"a": concepts(name="a", count=2), "b": []}
+        assert (cache.hits, cache.misses) == (2, 2)
+    # the results are kept in the file
+    with MetaMapCache(path=cachePath) as cache:
+        assert len(cache) == 2
+        assert cache.get(key="a") == concepts(name="a", count=2)
+
+
+def test_total_size_after_upsert_delete_and_clear(cachePath):
+    with MetaMapCache(path=cachePath, maxBytes=None) as cache:
+        cache.putMany(results={"a": concepts(name="a", count=50), "b": concepts(name="b", count=5)})
+        assert cache.totalSize() == sizeOfRows(cache=cache) == \
+            storedSize(concepts=concepts(name="a", count=50)) + storedSize(concepts=concepts(name="b", count=5))
+        # a new result of a stored key replaces its size
+        cache.put(key="a", concepts=concepts(name="a", count=1))
+        assert len(cache) == 2
+        assert cache.totalSize() == sizeOfRows(cache=cache)
+        cache.connection.execute("DELETE FROM results WHERE key = 'b'")
+        cache.connection.commit()
+        assert cache.totalSize() == sizeOfRows(cache=cache) == storedSize(concepts=concepts(name="a", count=1))
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.totalSize() == 0
+        assert cache.connection.execute("SELECT COUNT(*) FROM totalSize").fetchone()[0] == 1
+
+
+def test_evict_least_recently_used_to_90_percent(cachePath):
+    results = dict(("k%d" % i, concepts(name="k%d" % i, count=40)) for i in range(10))
+    sizes = dict((key, storedSize(concepts=value)) for (key, value) in results.items())
+    maxBytes = sum(sizes.values()) - 1
+    with MetaMapCache(path=cachePath, maxBytes=maxBytes) as cache:
+        for i in range(9):
+            cache.put(key="k%d" % i, concepts=results["k%d" % i])
+        assert len(cache) == 9
+        # k0 and k1 are used again, so k2 is now the least recently used
+        cache.getMany(keys=["k0", "k1"])
+        cache.put(key="k9", concepts=results["k9"])
+        assert cache.totalSize() <= int(maxBytes * 0.9)
+        assert cache.totalSize() == sizeOfRows(cache=cache)
+        kept = set(key for (key,) in cache.connection.execute("SELECT key FROM results"))
+        removed = set(results) - kept
+        # the oldest results are removed, only as many as needed
+        order = ["k%d" % i for i in range(2, 9)] + ["k0", "k1", "k9"]
+        assert removed == set(order[0: len(removed)])
+        assert sum(sizes[key] for key in order[0: len(removed) - 1]) < sum(sizes.values()) - int(maxBytes * 0.9)
+        assert {"k0", "k1", "k9"} <= kept
+        assert cache.evict() == 0
+
+
+def test_no_limit_keeps_everything(cachePath):
+    with MetaMapCache(path=cachePath, maxBytes=None) as cache:
+        cache.putMany(results=dict(("k%d" % i, concepts(name="k", count=30)) for i in range(20)))
+        assert cache.evict() == 0
+        assert len(cache) == 20
+
+
+def _openCache(path=None):
+    MetaMapCache(path=path).close()
+
+
+def test_processes_create_one_total_size_row(tmp_path):
+    for i in range(5):
+        path = str(tmp_path / ("cache%d.sqlite" % i))
+        processes = [multiprocessing.Process(target=_openCache, args=(path,)) for j in range(8)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+        connection = sqlite3.connect(path)
+        assert connection.execute("SELECT id, size FROM totalSize").fetchall() == [(0, 0)]
+        connection.close()
+
+
+def test_old_total_size_table_is_replaced(cachePath):
+    connection = sqlite3.connect(cachePath)
+    connection.execute("CREATE TABLE results (key TEXT PRIMARY KEY, value BLOB, size INTEGER, lastUsed REAL)")
+    connection.execute("CREATE TABLE totalSize (size INTEGER)")
+    # two rows written by two processes
+    connection.executemany("INSERT INTO totalSize VALUES (?)", [(0,), (0,)])
+    connection.execute("INSERT INTO results VALUES ('a', x'00', 7, 1.0)")
+    connection.commit()
+    connection.close()
+    with MetaMapCache(path=cachePath) as cache:
+        assert cache.connection.execute("SELECT id, size FROM totalSize").fetchall() == [(0, 7)]
+        cache.put(key="b", concepts=[])
+        assert cache.totalSize() == sizeOfRows(cache=cache) == 7 + storedSize(concepts=[])
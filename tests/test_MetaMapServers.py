@@ -0,0 +1,104 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of MetaMapServers with the stub control script stubServerCtl.py."""
+import os
+import signal
+import socket
+import sys
+import time
+
+import pytest
+
+from pyMeSHSim.metamapWrap.MetaMapServers import MetaMapServer, MetaMapServers
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubServerCtl.py")
+
+
+def freePort():
+    with socket.socket() as probe:
+        probe.bind(("localhost", 0))
+        return probe.getsockname()[1]
+
+
+@pytest.fixture
+def stubServers(tmp_path, monkeypatch):
+    """MetaMapServers of a bin directory with stub control scripts, on free ports.
+
+    | The servers left running by a test are killed.
+    """
+    monkeypatch.setenv("STUB_SERVER_DELAY", "0")
+    log = tmp_path / "ctl.log"
+    servers = MetaMapServers(binDir=str(tmp_path))
+    for server in servers.servers:
+        server.port = freePort()
+        server.ctl = "%s %s %s %s %s" % (sys.executable, STUB, os.path.basename(server.ctl), server.port, log)
+
+    def read():
+        if not log.exists():
+            return []
+        return log.read_text().splitlines()
+    yield (servers, read)
+    for path in tmp_path.glob("ctl.log.*.pid"):
+        try:
+            os.kill(int(path.read_text()), signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def test_running_server_is_reused_and_not_stopped(stubServers):
+    (servers, read) = stubServers
+    listeners = []
+    for server in servers.servers:
+        listener = socket.socket()
+        listener.bind(("localhost", server.port))
+        listener.listen(4)
+        listeners.append(listener)
+    try:
+        assert servers.start(timeout=5) is True
+        assert not any(server.startedHere for server in servers.servers)
+        servers.stop()
+        assert read() == []
+        assert servers.isReady()
+    finally:
+        for listener in listeners:
+            listener.close()
+
+
+def test_started_here_is_stopped_once(stubServers):
+    (servers, read) = stubServers
+    assert servers.start(timeout=10, interval=0.1) is True
+    assert all(server.startedHere for server in servers.servers)
+    # the servers are ready, they are not started again
+    assert servers.start(timeout=10, interval=0.1) is True
+    servers.stop()
+    servers.stop()
+    assert sorted(read()) == ["skrmedpostctl start", "skrmedpostctl stop", "wsdserverctl start", "wsdserverctl stop"]
+    deadline = time.time() + 5
+    while servers.servers[0].isReady() and time.time() < deadline:
+        time.sleep(0.1)
+    assert not servers.servers[0].isReady()
+
+
+def test_slow_server_is_not_started_twice(stubServers, monkeypatch):
+    (servers, read) = stubServers
+    monkeypatch.setenv("STUB_SERVER_DELAY", "2")
+    assert servers.start(timeout=0.3, interval=0.1) is False
+    # called again while the servers are loading, eg. by another startMetaMap
+    assert servers.servers[1].start() is False
+    assert servers.start(timeout=10, interval=0.1) is True
+    assert sorted(read()) == ["skrmedpostctl start", "wsdserverctl start"]
+    servers.stop()
+    assert read().count("wsdserverctl stop") == 1
+
+
+def test_server_without_ctl_call_when_ready(tmp_path):
+    with socket.socket() as listener:
+        listener.bind(("localhost", 0))
+        listener.listen(1)
+        server = MetaMapServer(name="test", ctl=str(tmp_path / "missing"), port=listener.getsockname()[1])
+        assert server.isReady()
+        assert server.start() is False
+        server.stop()
+        assert server.startedHere is False
@@ -0,0 +1,115 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of MetaMapSession against the stub MetaMap executable stubMetaMap.py."""
+import os
+import sys
+import time
+
+import pytest
+
+from pyMeSHSim.metamapWrap.MetaMapCache import MetaMapCache
+from pyMeSHSim.metamapWrap.MetaMapSession import MetaMapSession, MetaMapSessionError
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubMetaMap.py")
+
+
+def parseWord(line=None):
+    """Keep the preferred name of the MMI lines, it is the word of the stub."""
+    array = line.strip("\n").split("|")
+    if len(array) > 1 and array[1] == "MMI":
+        return array[3]
+    return None
+
+
+@pytest.fixture
+def stubLog(tmp_path, monkeypatch):
+    """Log the records received by the stub, and keep its state in tmp_path."""
+    path = tmp_path / "stub.log"
+    monkeypatch.setenv("STUB_METAMAP_LOG", str(path))
+    monkeypatch.setenv("STUB_METAMAP_STATE", str(tmp_path))
+    monkeypatch.delenv("STUB_METAMAP_DELAY", raising=False)
+
+    def read():
+        if not path.exists():
+            return []
+        return path.read_text().splitlines()
+    return read
+
+
+def makeSession(**kwargs):
+    options = {"parser": parseWord, "timeout": 5, "startTimeout": 10, "retries": 1}
+    options.update(kwargs)
+    return MetaMapSession(command=[sys.executable, STUB, "-N", "--sldi"], **options)
+
+
+def test_start_waits_for_the_probe(stubLog, monkeypatch):
+    monkeypatch.setenv("STUB_METAMAP_DELAY", "1")
+    start = time.time()
+    with makeSession() as session:
+        assert session.isAlive()
+        assert time.time() - start >= 1
+        assert stubLog() == ["start", MetaMapSession.probeText]
+        assert session.annotate(text="lung") == ["lung"]
+    assert session.process is None
+
+
+def test_start_fails_if_metamap_is_not_ready(stubLog, monkeypatch):
+    monkeypatch.setenv("STUB_METAMAP_DELAY", "30")
+    session = makeSession(startTimeout=0.5)
+    start = time.time()
+    with pytest.raises(MetaMapSessionError):
+        session.start()
+    # the stuck MetaMap is killed, not waited for
+    assert time.time() - start < 3
+    assert session.process is None
+
+
+def test_results_are_split_by_the_end_mark(stubLog):
+    with makeSession() as session:
+        assert "--indicate_citation_end" in session.command
+        results = session.annotateMany(texts=["lung cancer", "heart\nattack  failure", "", "lung cancer"])
+    assert results == [["lung", "cancer"], ["heart", "attack", "failure"], [], ["lung", "cancer"]]
+    # a text is one record, the empty text and the repeated text are not sent
+    assert stubLog() == ["start", MetaMapSession.probeText, "lung cancer", "heart attack failure"]
+
+
+def test_timeout_kills_and_restarts(stubLog):
+    with makeSession(timeout=1) as session:
+        start = time.time()
+        assert session.annotate(text="hang once") == ["hang", "once"]
+        assert time.time() - start < 4
+        assert session.restarts == 1
+        assert session.annotate(text="lung") == ["lung"]
+    assert stubLog().count("start") == 2
+
+
+def test_timeout_after_all_retries(stubLog):
+    with makeSession(timeout=1, retries=1) as session:
+        start = time.time()
+        with pytest.raises(MetaMapSessionError):
+            session.annotate(text="hang")
+        # two attempts of one second, no wait for the stuck MetaMap to exit
+        assert time.time() - start < 5
+        assert session.restarts == 2
+
+
+def test_exit_restarts(stubLog):
+    with makeSession() as session:
+        assert session.annotate(text="crash once") == ["crash", "once"]
+        assert session.restarts == 1
+        assert session.annotate(text="lung") == ["lung"]
+    assert stubLog().count("start") == 2
+
+
+def test_cache_hits_are_not_sent(stubLog, tmp_path):
+    with MetaMapCache(path=str(tmp_path / "cache.sqlite")) as cache:
+        with makeSession(cache=cache) as session:
+            assert session.annotateMany(texts=["lung cancer", "heart"]) == [["lung", "cancer"], ["heart"]]
+        assert len(cache) == 2
+        with makeSession(cache=cache) as session:
+            assert session.annotateMany(texts=["heart", "lung  cancer", "brain"]) == \
+                [["heart"], ["lung", "cancer"], ["brain"]]
+    received = [line for line in stubLog() if line not in ("start", MetaMapSession.probeText)]
+    assert received == ["lung cancer", "heart", "brain"]
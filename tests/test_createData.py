@@ -0,0 +1,70 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of the table builder against the SQLite stand-in of UMLS in tests/data/umls.sql."""
+import sqlite3
+
+import pytest
+
+from pyMeSHSim.data.createData import createBcolzData, getCuiFunc, umlsMaps
+from pyMeSHSim.data.dataDB import dataDB
+
+
+class thQuery(object):
+    """The TH concepts of a MeSH ID, one query for each lookup."""
+
+    def __init__(self, DBclient=None):
+        self.DBclient = DBclient
+
+    def get(self, dui=None, default=None):
+        sqlcmd = "select distinct CUI from MRSAT where ATN = 'TH' and CODE = '%s';" % dui
+        cuis = [row[0] for row in self.DBclient.fetch_all(sql_cmd=sqlcmd)]
+        return cuis if len(cuis) > 0 else default
+
+
+class cuiQueryMaps(getCuiFunc):
+    """The interface of umlsMaps answered by the queries of getCuiFunc, one or more for each concept."""
+
+    def __init__(self, DBclient=None):
+        getCuiFunc.__init__(self, DBclient=DBclient)
+        self.thCuis = thQuery(DBclient=DBclient)
+
+    def iterRelation(self, rel="PAR"):
+        return iter(self.DBclient.fetch_all(sql_cmd="select distinct CUI1,CUI2 from MRREL where REL='%s'" % rel))
+
+    def prefetch(self, cuis=None):
+        return None
+
+    def getCodeForNoneTreeConcept(self, cui=None):
+        MeSHID = self.getMeSHID(cui=cui)
+        if MeSHID is not None:
+            return MeSHID
+        return self.getMeSHIDFromTH(cui=cui)
+
+    getCategoryOfTreecode = createBcolzData.getCategoryOfTreecode
+
+
+@pytest.mark.parametrize("poolSize", [1, 2])
+def test_maps_and_queries_give_the_same_tables(umlsDB, buildTables, tmp_path, poolSize):
+    DBclient = dataDB(connect=lambda: sqlite3.connect(umlsDB, check_same_thread=False), poolSize=poolSize,
+                      batchSize=50)
+    mapTables = buildTables(workPath=str(tmp_path / "maps"), maps=umlsMaps(DBclient=DBclient), DBclient=DBclient)
+    queryTables = buildTables(workPath=str(tmp_path / "queries"), maps=cuiQueryMaps(DBclient=DBclient),
+                              DBclient=DBclient)
+    DBclient.close()
+    assert list(mapTables) == list(queryTables)
+    for name in mapTables:
+        assert mapTables[name] == queryTables[name], name
+    # every table has rows in the fixture
+    for name in mapTables:
+        assert len(mapTables[name][1]) > 0, name
+
+
+def test_opened_connection(umlsDB, buildTables, tmp_path):
+    tables = buildTables(workPath=str(tmp_path / "maps"), DBclient=dataDB(connection=sqlite3.connect(umlsDB)))
+    assert tables["RBtoRN"][1] == ["D000231\tC531777"]
+    assert "D009369\tC04\tC0012674\tC\tDiseases (MeSH Category)" in tables["topDescription"][1]
+    assert "C538231\tD000230\tC" in tables["RNandRBRel"][1]
+    # a pair of concepts without MN attribute, and a narrow D code without MN attribute are skipped
+    assert not any(line.startswith(("C900001", "D900004")) for line in tables["RNandRBRel"][1])
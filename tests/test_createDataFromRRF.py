@@ -0,0 +1,51 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of rrfMaps on the RRF files in tests/data/META.
+
+| They are the rows of tests/data/umls.sql, with rows of other sources, other attributes and relations,
+| repeated rows and a field with quotes and a tab.
+"""
+import os
+import sqlite3
+
+import pytest
+
+from pyMeSHSim.data.createData import umlsMaps
+from pyMeSHSim.data.createDataFromRRF import readRRF, rrfMaps
+from pyMeSHSim.data.dataDB import dataDB
+
+META = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "META")
+SRDEF = os.path.join(META, "SRDEF")
+
+
+def test_readRRF_keeps_the_fields():
+    chunks = list(readRRF(path=os.path.join(META, "MRSAT.RRF"), table="MRSAT", usecols=["CUI", "ATN", "ATV"],
+                          chunksize=100))
+    assert len(chunks) == 7
+    rows = [row for chunk in chunks for row in chunk.itertuples(index=False, name=None)]
+    assert ("C0027651", "SOS", "Scope note with \"quotes\", 'apostrophes' and a\ttab") in rows
+    assert all(isinstance(value, str) for row in rows for value in row)
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 1000000])
+def test_chunksize_gives_the_same_tables(buildTables, tmp_path, chunksize):
+    maps = rrfMaps(metaPath=META, srdefPath=SRDEF, chunksize=chunksize)
+    # the pairs repeated in the file, also across chunks, are kept once
+    pairs = maps.getRelation(rel="PAR")
+    assert len(pairs) == len(set(pairs))
+    tables = buildTables(workPath=str(tmp_path / "rrf"), maps=maps)
+    reference = buildTables(workPath=str(tmp_path / "whole"), maps=rrfMaps(metaPath=META, srdefPath=SRDEF))
+    assert tables == reference
+
+
+def test_rrf_and_database_give_the_same_tables(umlsDB, buildTables, tmp_path):
+    maps = rrfMaps(metaPath=META, srdefPath=SRDEF, chunksize=50)
+    # the rows of other sources and the synonyms are skipped
+    assert maps.getPreferredName(cui="C0027651") == "Neoplasms"
+    assert maps.getTreeCode(cui="C0027651") == ["C04"]
+    rrfTables = buildTables(workPath=str(tmp_path / "rrf"), maps=maps)
+    DBclient = dataDB(connection=sqlite3.connect(umlsDB))
+    dbTables = buildTables(workPath=str(tmp_path / "db"), maps=umlsMaps(DBclient=DBclient), DBclient=DBclient)
+    assert rrfTables == dbTables
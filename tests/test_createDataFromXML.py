@@ -0,0 +1,95 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of createXMLData on MeSH XML files without ConceptUMLSUI, as the files of recent MeSH years."""
+import os
+
+import pytest
+
+from pyMeSHSim.data.createDataFromXML import createXMLData, main
+from pyMeSHSim.data.storage import openTable
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DESC = os.path.join(DATA, "desc.xml")
+SUPP = os.path.join(DATA, "supp.xml")
+
+# the MeSH atoms of the concepts in desc.xml and supp.xml, with atoms of other sources and a repeated row
+MRCONSO = [
+    "C0027651|ENG|P|L0027651|PF|S0086640|Y|A0088426||M0014585|D009369|MSH|MH|D009369|Neoplasms|0|N|256|",
+    "C0027651|ENG|P|L0027651|PF|S0086640|Y|A0088426||M0014585|D009369|MSH|MH|D009369|Neoplasms|0|N|256|",
+    "C9999999|ENG|P|L9999999|PF|S9999999|Y|A9999999||M0014585|108369006|SNOMEDCT_US|PT|108369006|Neoplasm|9|N||",
+    "C0086692|ENG|P|L0086692|PF|S0208931|Y|A0122357||M0030043|D009369|MSH|N1|D009369|Benign Neoplasms|0|N||",
+    "C0027652|ENG|P|L0027652|PF|S0086642|Y|A0088427||M0014586|D009370|MSH|MH|D009370|Neoplasms by Histologic Type|0|N||",
+    "C0023418|ENG|P|L0023418|PF|S0060395|Y|A0078546||M0012218|D007938|MSH|MH|D007938|Leukemia|0|N||",
+    "C0018939|ENG|P|L0018939|PF|S0047361|Y|A0067952||M0009821|D006402|MSH|MH|D006402|Hematologic Diseases|0|N||",
+    "C0152013|ENG|P|L0152013|PF|S0208932|Y|A0122358||M0538231|C538231|MSH|NM|C538231|Leukemia, Test Type|0|N||",
+]
+MRSTY = ["C0027651|T191|B2.2.1.2.1.2|Neoplastic Process|AT17683839|256|",
+         "C0086692|T191|B2.2.1.2.1.2|Neoplastic Process|AT17683840||",
+         "C0027652|T191|B2.2.1.2.1.2|Neoplastic Process|AT17683841||",
+         "C0023418|T191|B2.2.1.2.1.2|Neoplastic Process|AT17683842||",
+         "C0018939|T047|B2.2.1.2.1|Disease or Syndrome|AT17683843||",
+         "C0152013|T191|B2.2.1.2.1.2|Neoplastic Process|AT17683844||",
+         "C9999999|T033|A2.2|Finding|AT17683845||"]
+SRDEF = ["STY|T191|Neoplastic Process|B2.2.1.2.1.2|def|||Y|neop||",
+         "STY|T047|Disease or Syndrome|B2.2.1.2.1|def|||Y|dsyn||",
+         "RL|T186|process_of|R3.1|def|||||PR|"]
+
+
+@pytest.fixture
+def umlsPaths(tmp_path):
+    """The META directory and the SRDEF file."""
+    meta = tmp_path / "META"
+    meta.mkdir()
+    (meta / "MRCONSO.RRF").write_text("\n".join(MRCONSO) + "\n")
+    (meta / "MRSTY.RRF").write_text("\n".join(MRSTY) + "\n")
+    srdef = tmp_path / "SRDEF"
+    srdef.write_text("\n".join(SRDEF) + "\n")
+    return (str(meta), str(srdef))
+
+
+def test_warn_without_umls_id(capsys):
+    builder = createXMLData(descPath=DESC, suppPath=SUPP)
+    parentChild = builder.createParentChildRel()
+    mainHeading = builder.createMainHeadingDetailData(parentChild=parentChild)
+    err = capsys.readouterr().err
+    assert "no ConceptUMLSUI is found" in err
+    # the new descriptor is not in MeSH_IC.tsv
+    assert "1 descriptors are not in" in err
+    assert set(mainHeading["UMLSID"]) == {""}
+    assert set(mainHeading["Semantic_Type"]) == {""}
+    frequence = dict(zip(mainHeading["MeSHID"], mainHeading["Frequence"]))
+    assert frequence["D000090999"] == 0
+    assert frequence["D009369"] > 0
+    assert len(builder.createSupMainHeadingDetailData(parentChild=parentChild)) == 0
+
+
+def test_umls_id_from_rrf(umlsPaths, capsys):
+    (meta, srdef) = umlsPaths
+    builder = createXMLData(descPath=DESC, suppPath=SUPP, metaPath=meta, srdefPath=srdef)
+    parentChild = builder.createParentChildRel()
+    mainHeading = builder.createMainHeadingDetailData(parentChild=parentChild)
+    err = capsys.readouterr().err
+    assert "no ConceptUMLSUI" not in err
+    assert "1 of 5 descriptors have no UMLS ID" in err
+    rows = set(zip(mainHeading["MeSHID"], mainHeading["UMLSID"], mainHeading["Tree_Code"],
+                   mainHeading["Semantic_Type"]))
+    assert {("D009369", "C0027651", "C04", "neop"), ("D007938", "C0023418", "C15.378.400", "neop"),
+            ("D006402", "C0018939", "C15.378", "dsyn"), ("D000090999", "", "C04.557.337.999", "")} <= rows
+    supplement = builder.createSupMainHeadingDetailData(parentChild=parentChild)
+    assert sorted(supplement[supplement["MeSHID"] == "D009369"]["UMLSID"]) == ["C0027651", "C0086692"]
+    (RNandRB, RNDetail) = builder.createRNTables()
+    assert sorted(zip(RNandRB["RNconcept"], RNandRB["RBconcept"], RNandRB["Category"])) == \
+        [("C538231", "D007938", "C")]
+    assert list(zip(RNDetail["MeSHID"], RNDetail["UMLSID"], RNDetail["Semantic_Type"])) == \
+        [("C538231", "C0152013", "neop")]
+
+
+def test_command_line(umlsPaths, tmp_path):
+    (meta, srdef) = umlsPaths
+    dataPath = str(tmp_path / "data")
+    assert main([DESC, SUPP, dataPath, "--storage", "npy", "--meta", meta, "--srdef", srdef]) == 0
+    table = openTable(rootdir=os.path.join(dataPath, "MainHeadingDetailData"))
+    assert sorted(table.attrs["DiseaseCategoryST"]) == ["", "dsyn", "neop"]
+    assert set(table.readColumn(name="UMLSID")) == {"", "C0018939", "C0023418", "C0027651", "C0027652"}
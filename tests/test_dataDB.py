@@ -0,0 +1,67 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of dataDB and its connection pool on the SQLite stand-in of UMLS."""
+import sqlite3
+import threading
+
+import pytest
+
+from pyMeSHSim.data.dataDB import PoolExhaustedError, dataDB
+
+
+def test_credentials_are_required(monkeypatch, capsys):
+    monkeypatch.delenv("PYMESHSIM_DB_USER", raising=False)
+    monkeypatch.delenv("PYMESHSIM_DB_PASSWORD", raising=False)
+    with pytest.raises(SystemExit):
+        dataDB()
+    assert "PYMESHSIM_DB_USER and PYMESHSIM_DB_PASSWORD" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        dataDB(user="reader")
+    monkeypatch.setenv("PYMESHSIM_DB_USER", "reader")
+    with pytest.raises(SystemExit):
+        dataDB()
+
+
+def test_credentials_from_environment(monkeypatch):
+    monkeypatch.setenv("PYMESHSIM_DB_USER", "reader")
+    monkeypatch.setenv("PYMESHSIM_DB_PASSWORD", "secret")
+    monkeypatch.setenv("PYMESHSIM_DB_PORT", "3307")
+    client = dataDB()
+    assert (client.host, client.userName, client.password, client.database, client.port) == \
+        ("localhost", "reader", "secret", "umls", 3307)
+    assert dataDB(user="other", password="other2").userName == "other"
+
+
+def test_nested_query_in_iterate_raises(umlsDB):
+    client = dataDB(connection=sqlite3.connect(umlsDB), batchSize=10)
+    rows = client.iterate(sql_cmd="select CUI1, CUI2 from MRREL where REL = 'PAR'")
+    next(rows)
+    with pytest.raises(PoolExhaustedError):
+        client.fetch_one(sql_cmd="select count(*) from MRSAT")
+    rows.close()
+    # the connection is back in the pool
+    assert client.fetch_one(sql_cmd="select count(*) from MRREL where REL = 'RB'") == (1,)
+
+
+def test_nested_query_in_a_larger_pool(umlsDB):
+    client = dataDB(connect=lambda: sqlite3.connect(umlsDB, check_same_thread=False), poolSize=2)
+    count = client.fetch_one(sql_cmd="select count(*) from MRREL where REL = 'PAR'")[0]
+    names = 0
+    for (cui1, cui2) in client.iterate(sql_cmd="select CUI1, CUI2 from MRREL where REL = 'PAR'"):
+        names = names + len(client.fetch_all(sql_cmd="select STR from MRCONSO where CUI = '%s'" % cui1))
+    assert names >= count
+
+
+def test_other_thread_waits_for_a_connection(umlsDB):
+    client = dataDB(connect=lambda: sqlite3.connect(umlsDB, check_same_thread=False), poolSize=1)
+    results = []
+    with client.pool.connection():
+        worker = threading.Thread(target=lambda: results.append(client.fetch_one(sql_cmd="select 1")))
+        worker.start()
+        worker.join(timeout=0.5)
+        # the connection is used by this thread, the other thread waits
+        assert worker.is_alive()
+    worker.join(timeout=5)
+    assert results == [(1,)]
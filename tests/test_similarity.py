@@ -0,0 +1,164 @@
+# Author: ZhiHui Luo
+# Organization: HuaZhong Agricultural University
+
+#!/usr/bin/python3
+"""Tests of the batch similarity matrix against the similarity of each pair, and of the wang semantic values."""
+import random
+
+import numpy as np
+import pytest
+
+from pyMeSHSim.Sim.similarity import termComp
+
+METHODS = ["res", "lin", "jiang", "rel"]
+
+
+@pytest.fixture(scope="module")
+def comp():
+    return termComp()
+
+
+@pytest.fixture(scope="module")
+def duiLists(comp):
+    """Two unsorted lists of MeSH ID of category C, with repeated MeSH ID, shared MeSH ID,
+    MeSH ID without IC value and MeSH ID outside the category."""
+    mh = comp.getMainHeadingDetailData(category="all")
+    inC = sorted(set(mh[mh["Tree_Code"].str[0] == "C"]["MeSHID"]))
+    outside = sorted(set(mh["MeSHID"]) - set(inC))
+    (index, ic, maxIC) = comp.getICTable(category="C")
+    noIC = [dui for dui in inC if ic[index[dui]] <= 0]
+    rnd = random.Random(0)
+    duis1 = rnd.sample(inC, 60) + noIC[:2] + outside[:3]
+    duis1 = duis1 + duis1[:5]
+    rnd.shuffle(duis1)
+    duis2 = rnd.sample(inC, 40) + duis1[:10] + noIC[-1:] + outside[-2:]
+    rnd.shuffle(duis2)
+    return (duis1, duis2, set(inC))
+
+
+def lcsIC(comp=None, dui1=None, dui2=None, category=None):
+    """IC of the least common subsumer, the max over the longest common prefix of each pair of tree codes."""
+    (index, ic, maxIC) = comp.getICTable(category=category)
+    codes1 = [code for code in comp.getMeSHTreecode(dui=dui1) if code[0] == category]
+    codes2 = [code for code in comp.getMeSHTreecode(dui=dui2) if code[0] == category]
+    value = 0
+    for code1 in codes1:
+        for code2 in codes2:
+            array1 = code1.split(".")
+            array2 = code2.split(".")
+            common = 0
+            while common < min(len(array1), len(array2)) and array1[common] == array2[common]:
+                common = common + 1
+            if common == 0:
+                continue
+            owner = comp.getDuiFromTreeCode(treeCode=".".join(array1[0: common]))
+            if owner in index:
+                value = max(value, ic[index[owner]])
+    return value
+
+
+def test_ICMatrixMatchesSimil(comp, duiLists):
+    (duis1, duis2, inC) = duiLists
+    scores = comp.similMatrix(duis1=duis1, duis2=duis2, category="C")
+    assert sorted(scores) == sorted(METHODS)
+    for name in METHODS:
+        assert scores[name].shape == (len(duis1), len(duis2))
+        single = comp.termSimMatrix(duis1=duis1, duis2=duis2, category="C", method=name)
+        assert np.array_equal(single, scores[name], equal_nan=True)
+    for (i, dui1) in enumerate(duis1):
+        for (j, dui2) in enumerate(duis2):
+            if dui1 == dui2:
+                expected = (1, 1, 1, 1)
+            elif dui1 not in inC or dui2 not in inC:
+                expected = (np.nan, np.nan, np.nan, np.nan)
+            else:
+                expected = comp.simil(dui1=dui1, dui2=dui2, category="C")
+                if expected == -1:
+                    expected = (-1, -1, -1, -1)
+            for (name, value) in zip(["res", "lin", "jiang", "rel"], expected):
+                assert scores[name][i, j] == pytest.approx(value, abs=1e-12, nan_ok=True), (name, dui1, dui2)
+
+
+def test_LCSICMatrix(comp):
+    mh = comp.getMainHeadingDetailData(category="all")
+    inC = sorted(set(mh[mh["Tree_Code"].str[0] == "C"]["MeSHID"]))
+    # enough tree codes for several row blocks
+    duis = random.Random(1).sample(inC, 1500) + sorted(set(mh["MeSHID"]) - set(inC))[:5]
+    symmetric = comp._getLCSICMatrix(duis1=duis, duis2=None, category="C")
+    assert np.array_equal(symmetric, symmetric.T)
+    assert np.array_equal(symmetric, comp._getLCSICMatrix(duis1=duis, duis2=list(duis), category="C"))
+    rnd = random.Random(2)
+    for k in range(500):
+        (i, j) = (rnd.randrange(len(duis)), rnd.randrange(len(duis)))
+        expected = lcsIC(comp=comp, dui1=duis[i], dui2=duis[j], category="C")
+        assert symmetric[i, j] == pytest.approx(expected, abs=1e-12), (duis[i], duis[j])
+    for i in range(len(duis) - 5, len(duis)):
+        assert not symmetric[i].any()
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_symmetricMatrix(comp, duiLists, method):
+    (duis1, duis2, inC) = duiLists
+    allVsAll = comp.termSimMatrix(duis1=duis1, category="C", method=method)
+    assert np.array_equal(allVsAll, allVsAll.T, equal_nan=True)
+    assert np.array_equal(allVsAll, comp.termSimMatrix(duis1=duis1, duis2=list(duis1), category="C", method=method),
+                          equal_nan=True)
+
+
+def semanticValue(dui=None, parents=None, weight=0.7):
+    """Semantic value of the wang method, walking the parents level by level, the deeper level is kept."""
+    SV = {dui: 1}
+    level = {dui}
+    depth = 1
+    while level:
+        level = set(par for con in level for par in parents.get(con, []))
+        for con in level:
+            SV[con] = weight ** depth
+        depth = depth + 1
+    return SV
+
+
+def wangScore(SV1=None, SV2=None):
+    common = SV1.keys() & SV2.keys()
+    return (sum(SV1[con] for con in common) + sum(SV2[con] for con in common)) / (sum(SV1.values()) +
+                                                                                 sum(SV2.values()))
+
+
+@pytest.mark.parametrize("category", ["C", "D"])
+def test_semanticValue(comp, category):
+    df = comp.getRelData(data="ParentChildRel", category=category)
+    parents = {}
+    for (child, parent) in zip(df["Child"], df["Parent"]):
+        parents.setdefault(child, []).append(parent)
+    duis = sorted(set(df["Child"]) | set(df["Parent"]))
+    sample = random.Random(3).sample(duis, 300)
+    SVs = {}
+    for dui in sample:
+        SVs[dui] = comp._getSV(dui=dui, category=category)
+        expected = semanticValue(dui=dui, parents=parents)
+        assert sorted(SVs[dui]) == sorted(expected), dui
+        for con in expected:
+            assert SVs[dui][con] == pytest.approx(expected[con], abs=1e-12), (dui, con)
+    # the levels are cached, the values are the same when asked again in another order
+    for dui in reversed(sample):
+        assert comp._getSV(dui=dui, category=category) == SVs[dui]
+
+
+def test_wangMatrix(comp, duiLists):
+    (duis1, duis2, inC) = duiLists
+    df = comp.getRelData(data="ParentChildRel", category="C")
+    parents = {}
+    for (child, parent) in zip(df["Child"], df["Parent"]):
+        parents.setdefault(child, []).append(parent)
+    SV = {dui: semanticValue(dui=dui, parents=parents) for dui in set(duis1) | set(duis2)}
+    scores = comp.termSimMatrix(duis1=duis1, duis2=duis2, category="C", method="wang")
+    allVsAll = comp.termSimMatrix(duis1=duis1, category="C", method="wang")
+    for (matrix, other) in [(scores, duis2), (allVsAll, duis1)]:
+        assert matrix.shape == (len(duis1), len(other))
+        for (i, dui1) in enumerate(duis1):
+            for (j, dui2) in enumerate(other):
+                expected = 1 if dui1 == dui2 else wangScore(SV1=SV[dui1], SV2=SV[dui2])
+                assert matrix[i, j] == pytest.approx(expected, abs=1e-12), (dui1, dui2)
+                assert matrix[i, j] == pytest.approx(comp.calPathSimilarity(dui1=dui1, dui2=dui2, category="C"),
+                                                     abs=1e-12)
+    assert np.array_equal(allVsAll, allVsAll.T)